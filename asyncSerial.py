@@ -0,0 +1,380 @@
+import asyncio
+import queue
+import threading
+from time import perf_counter
+from typing import Callable, List, Optional
+
+import serial
+
+from perfStats import perf_stats
+from replaySource import REPLAY_MIN_SLEEP, open_replay_source, replaySource
+from serialHandler import REPLAY_PORT_PREFIX, SERIAL_BATCH_MAX_LINES
+
+ASYNC_QUEUE_BATCHES = 256  # Batches a port may have waiting for its callbacks
+ASYNC_READ_SIZE = 65536
+ASYNC_POLL_INTERVAL = 0.01  # Seconds between reads of a port without a descriptor
+ASYNC_OPEN_TIMEOUT = 5.0
+ASYNC_CLOSE_TIMEOUT = 2.0
+
+# What a port does when its callbacks fall behind and its queue is full
+ASYNC_DROP_OLDEST = "drop_oldest"  # Keep reading, forget the oldest waiting batch
+ASYNC_PAUSE = "pause"  # Stop reading until there is room, the OS buffers meanwhile
+
+
+# One port or replay source on an asyncSerialHub, with the same callbacks as serialHandler
+class asyncPort:
+    def __init__(
+        self,
+        port: str,
+        line_received_callback: Optional[Callable[[str], None]] = None,
+        lines_received_callback: Optional[Callable[[List[str]], None]] = None,
+        log_callback: Optional[Callable[[str], None]] = None,
+        max_batches: int = ASYNC_QUEUE_BATCHES,
+        policy: str = ASYNC_PAUSE,
+    ) -> None:
+        self.port = port
+        self.name = port
+        self.line_received_callback = line_received_callback
+        self.lines_received_callback = lines_received_callback
+        self.log_callback = log_callback
+        self.max_batches = max_batches
+        self.policy = policy
+        self.is_open: bool = False
+        self.paused: bool = False
+        self.dropped_lines: int = 0
+        self.lines_read: int = 0
+
+        self.serial_port: Optional[serial.Serial] = None
+        self.fd: Optional[int] = None
+        self.partial: bytes = b""
+        # Filled by the loop thread, emptied by the dispatcher thread
+        self.queue: queue.Queue[List[str]] = queue.Queue()
+        self.room: Optional[asyncio.Event] = (
+            None  # Set by the dispatcher while a reader waits
+        )
+        self.waiting: bool = False
+        self.hub: Optional["asyncSerialHub"] = None
+        self.tasks: List[asyncio.Task] = []
+
+    def log(self, message: str) -> None:
+        if self.log_callback:
+            self.log_callback(message)
+
+    # Split freshly read bytes into lines, keeping an unfinished line for the next read
+    def feed(self, data: bytes) -> None:
+        data = self.partial + data
+        *complete, self.partial = data.split(b"\n")
+        if complete:
+            self.enqueue(
+                [
+                    line.decode("utf-8", errors="replace").rstrip("\r")
+                    for line in complete
+                ]
+            )
+
+    # The queue itself is unbounded so a read never fails, the bound is applied here
+    def full(self) -> bool:
+        return self.queue.qsize() >= self.max_batches
+
+    # Loop thread
+    def enqueue(self, lines: List[str]) -> None:
+        for start in range(0, len(lines), SERIAL_BATCH_MAX_LINES):
+            batch = lines[start : start + SERIAL_BATCH_MAX_LINES]
+            while self.policy == ASYNC_DROP_OLDEST and self.full():
+                try:
+                    self.dropped_lines += len(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+                if perf_stats.enabled:
+                    perf_stats.count("async_dropped_batches")
+            self.queue.put_nowait(batch)
+            self.lines_read += len(batch)
+        if self.hub:
+            self.hub.ready.set()
+
+    # Dispatcher thread, runs the callbacks for one waiting batch, returns False if there was none
+    def dispatch(self) -> bool:
+        try:
+            lines = self.queue.get_nowait()
+        except queue.Empty:
+            return False
+        if self.waiting and not self.full() and self.hub and self.room:
+            self.hub.loop.call_soon_threadsafe(self.room.set)
+        if perf_stats.enabled:
+            perf_stats.gauge(f"async_queue_{self.name}", self.queue.qsize())
+        try:
+            if self.line_received_callback:
+                for line in lines:
+                    self.line_received_callback(line)
+            if self.lines_received_callback:
+                self.lines_received_callback(lines)
+        except Exception as err:
+            self.log(f"Callback Exception on [{self.name}]: {err}")
+        return True
+
+
+# Reads many serial ports and replay sources on one asyncio event loop in one thread.
+# Serial ports are read when their file descriptor is readable (POSIX) or polled otherwise. Each
+# port hands batches through a bounded queue to one dispatcher thread that runs the callbacks of
+# every port in turn, with an explicit policy for when the callbacks fall behind. Two threads in
+# total however many ports are open, and close() stops everything before it returns.
+class asyncSerialHub:
+    def __init__(self, log_callback: Optional[Callable[[str], None]] = None) -> None:
+        self.log_callback = log_callback
+        self.ports: List[asyncPort] = []
+        self.killed: bool = False
+        self.ready = threading.Event()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever, name="async-serial", daemon=True
+        )
+        self.thread.start()
+        self.dispatch_thread = threading.Thread(
+            target=self.dispatch, name="async-serial-dispatch", daemon=True
+        )
+        self.dispatch_thread.start()
+
+    def log(self, message: str) -> None:
+        if self.log_callback:
+            self.log_callback(message)
+
+    # Open `port` (a device or a "replay:" name), raises serial.SerialException like serialHandler
+    def add_port(
+        self,
+        port: str,
+        line_received_callback: Optional[Callable[[str], None]] = None,
+        lines_received_callback: Optional[Callable[[List[str]], None]] = None,
+        log_callback: Optional[Callable[[str], None]] = None,
+        baudrate: int = 115200,
+        max_batches: int = ASYNC_QUEUE_BATCHES,
+        policy: str = ASYNC_PAUSE,
+    ) -> asyncPort:
+        handle = asyncPort(
+            port,
+            line_received_callback=line_received_callback,
+            lines_received_callback=lines_received_callback,
+            log_callback=log_callback or self.log_callback,
+            max_batches=max_batches,
+            policy=policy,
+        )
+        future = asyncio.run_coroutine_threadsafe(
+            self.open_port(handle, baudrate), self.loop
+        )
+        future.result(timeout=ASYNC_OPEN_TIMEOUT)
+        self.ports.append(handle)
+        handle.log(f"Port [{handle.name}] Connected")
+        return handle
+
+    async def open_port(self, handle: asyncPort, baudrate: int) -> None:
+        handle.hub = self
+        handle.room = asyncio.Event()
+
+        if handle.port.startswith(REPLAY_PORT_PREFIX):
+            try:
+                source = open_replay_source(handle.port)
+            except OSError as err:
+                raise serial.SerialException(str(err))
+            handle.tasks.append(asyncio.create_task(self.replay(handle, source)))
+        else:
+            handle.serial_port = serial.Serial(
+                handle.port, baudrate=baudrate, timeout=0
+            )
+            try:
+                handle.fd = handle.serial_port.fileno()
+            except (AttributeError, serial.SerialException):
+                handle.fd = None  # Windows ports have no file descriptor
+            if handle.fd is not None:
+                self.loop.add_reader(handle.fd, self.readable, handle)
+            else:
+                handle.tasks.append(asyncio.create_task(self.poll(handle)))
+
+        handle.is_open = True
+
+    # Round robin over the ports, one batch each, so a chatty port cannot starve the others
+    def dispatch(self) -> None:
+        while not self.killed:
+            self.ready.clear()
+            dispatched = False
+            for handle in list(self.ports):
+                dispatched = handle.dispatch() or dispatched
+            if not dispatched:
+                self.ready.wait(timeout=0.1)
+
+    # Suspends a reader until the dispatcher made room in its queue
+    async def wait_for_room(self, handle: asyncPort) -> None:
+        assert handle.room is not None
+        handle.room.clear()
+        handle.waiting = True
+        if handle.full():
+            await handle.room.wait()
+        handle.waiting = False
+
+    def readable(self, handle: asyncPort) -> None:
+        assert handle.serial_port is not None
+        start_time = perf_counter()
+        try:
+            data = handle.serial_port.read(ASYNC_READ_SIZE)
+        except serial.SerialException as err:
+            handle.log(f"Could not read port [{handle.name}]: {err}")
+            self.loop.create_task(self.close_port(handle))
+            return
+        if data:
+            handle.feed(data)
+        if perf_stats.enabled:
+            perf_stats.record("async_read", int((perf_counter() - start_time) * 1e9))
+        if handle.policy == ASYNC_PAUSE and handle.full() and not handle.paused:
+            self.pause(handle)
+
+    # Stop watching the port until its consumer made room, then read what piled up
+    def pause(self, handle: asyncPort) -> None:
+        assert handle.fd is not None
+        handle.paused = True
+        self.loop.remove_reader(handle.fd)
+
+        async def resume() -> None:
+            await self.wait_for_room(handle)
+            if handle.is_open:
+                handle.paused = False
+                self.loop.add_reader(handle.fd, self.readable, handle)
+
+        handle.tasks.append(asyncio.create_task(resume()))
+
+    async def poll(self, handle: asyncPort) -> None:
+        assert handle.serial_port is not None
+        while handle.is_open:
+            if handle.policy == ASYNC_PAUSE and handle.full():
+                await self.wait_for_room(handle)
+            try:
+                data = handle.serial_port.read(handle.serial_port.in_waiting or 1)
+            except serial.SerialException as err:
+                handle.log(f"Could not read port [{handle.name}]: {err}")
+                await self.close_port(handle)
+                return
+            if data:
+                handle.feed(data)
+            else:
+                await asyncio.sleep(ASYNC_POLL_INTERVAL)
+
+    # Replay sources are paced with the loop's timers instead of a thread each
+    async def replay(self, handle: asyncPort, source: replaySource) -> None:
+        start_time = self.loop.time()
+        lines: List[str] = []
+        for due, line in source.timed_lines():
+            if due is not None:
+                delay = start_time + due - self.loop.time()
+                if delay > REPLAY_MIN_SLEEP:
+                    if lines:
+                        handle.enqueue(lines)
+                        lines = []
+                    await asyncio.sleep(delay)
+            lines.append(line)
+            if len(lines) >= SERIAL_BATCH_MAX_LINES:
+                handle.enqueue(lines)
+                lines = []
+                await asyncio.sleep(0)
+            if handle.policy == ASYNC_PAUSE and handle.full():
+                await self.wait_for_room(handle)
+        if lines:
+            handle.enqueue(lines)
+        handle.log(f"Replay [{handle.name}] finished")
+
+    async def close_port(self, handle: asyncPort) -> None:
+        if not handle.is_open:
+            return
+        handle.is_open = False
+        if handle.fd is not None and not handle.paused:
+            self.loop.remove_reader(handle.fd)
+        current = asyncio.current_task()
+        for task in handle.tasks:
+            if task is not current:
+                task.cancel()
+        await asyncio.gather(
+            *(task for task in handle.tasks if task is not current),
+            return_exceptions=True,
+        )
+        if handle.serial_port:
+            handle.serial_port.close()
+        handle.log(f"Port [{handle.name}] Disconnected")
+
+    def remove_port(self, handle: asyncPort) -> None:
+        if handle in self.ports:
+            self.ports.remove(handle)
+        if self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.close_port(handle), self.loop).result(
+                timeout=ASYNC_CLOSE_TIMEOUT
+            )
+
+    # Deterministic shutdown: every port is closed and the loop thread joined before returning
+    def close(self) -> None:
+        for handle in list(self.ports):
+            self.remove_port(handle)
+        self.killed = True
+        self.ready.set()
+        self.dispatch_thread.join(timeout=ASYNC_CLOSE_TIMEOUT)
+        if self.dispatch_thread.is_alive():
+            print("async-serial-dispatch thread did not exit in time")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=ASYNC_CLOSE_TIMEOUT)
+        if self.thread.is_alive():
+            print("async-serial thread did not exit in time")
+        else:
+            self.loop.close()
+
+
+def main():
+    import argparse
+    from time import sleep
+
+    parser = argparse.ArgumentParser(
+        description="Read several ports or replay sources on one event loop"
+    )
+    parser.add_argument("ports", nargs="+", help="serial ports or replay:<path> ports")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument(
+        "--slow-callback",
+        type=float,
+        default=0.0,
+        help="seconds each batch callback takes, to see backpressure",
+    )
+    parser.add_argument(
+        "--policy", choices=[ASYNC_PAUSE, ASYNC_DROP_OLDEST], default=ASYNC_PAUSE
+    )
+    args = parser.parse_args()
+
+    hub = asyncSerialHub(log_callback=print)
+    received = {port: 0 for port in args.ports}
+
+    def make_callback(port: str) -> Callable[[List[str]], None]:
+        def lines_received(lines: List[str]) -> None:
+            received[port] += len(lines)
+            if args.slow_callback:
+                sleep(args.slow_callback)
+
+        return lines_received
+
+    handles = [
+        hub.add_port(
+            port,
+            lines_received_callback=make_callback(port),
+            policy=args.policy,
+            max_batches=8,
+        )
+        for port in args.ports
+    ]
+    sleep(args.duration)
+    for handle in handles:
+        print(
+            f"{handle.name}: {received[handle.port]} lines delivered, "
+            f"{handle.lines_read} read, {handle.dropped_lines} dropped"
+        )
+    print(f"Threads before close: {threading.active_count()}")
+    start_time = perf_counter()
+    hub.close()
+    print(
+        f"Closed in {(perf_counter() - start_time) * 1000:.1f} ms, "
+        f"threads after: {threading.active_count()}"
+    )
+
+
+if __name__ == "__main__":
+    main()
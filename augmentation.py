@@ -0,0 +1,300 @@
+import queue
+import threading
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+AUGMENT_MAX_SHIFT = 10  # Samples
+AUGMENT_MAX_WARP = 0.1  # Relative speed change
+AUGMENT_MAX_SCALE = 0.1  # Relative amplitude change per axis
+AUGMENT_ACCEL_NOISE = 0.01  # G
+AUGMENT_GYRO_NOISE = 2.0  # DPS
+AUGMENT_MAX_ROTATION = 10.0  # Degrees
+AUGMENT_PREFETCH_BATCHES = 4
+
+
+# Read every sample of `batch` (B, T, C) at the fractional row `positions` (B, T), linearly
+# interpolated, rows before the first or after the last repeat the edge row
+def sample_rows(batch: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    length = batch.shape[1]
+    positions = np.clip(positions, 0, length - 1)
+    left = np.floor(positions).astype(np.intp)
+    right = np.minimum(left + 1, length - 1)
+    fraction = (positions - left)[:, :, np.newaxis]
+    samples = np.arange(len(batch))[:, np.newaxis]
+    return batch[samples, left] * (1 - fraction) + batch[samples, right] * fraction
+
+
+# (B, T) rows to read for `count` samples of `length` rows, each moved by up to `max_shift` rows
+# and played up to `max_warp` faster or slower around its middle
+def time_positions(
+    count: int,
+    length: int,
+    rng: np.random.Generator,
+    max_shift: int = AUGMENT_MAX_SHIFT,
+    max_warp: float = AUGMENT_MAX_WARP,
+) -> np.ndarray:
+    shifts = rng.integers(-max_shift, max_shift + 1, size=(count, 1))
+    speeds = rng.uniform(1 - max_warp, 1 + max_warp, size=(count, 1))
+    middle = (length - 1) / 2
+    return middle + (np.arange(length) - middle) * speeds - shifts
+
+
+def time_shift(
+    batch: np.ndarray, rng: np.random.Generator, max_shift: int = AUGMENT_MAX_SHIFT
+) -> np.ndarray:
+    return sample_rows(
+        batch, time_positions(len(batch), batch.shape[1], rng, max_shift, 0)
+    )
+
+
+def time_warp(
+    batch: np.ndarray, rng: np.random.Generator, max_warp: float = AUGMENT_MAX_WARP
+) -> np.ndarray:
+    return sample_rows(
+        batch, time_positions(len(batch), batch.shape[1], rng, 0, max_warp)
+    )
+
+
+# Scale every axis of each sample by up to `max_scale`
+def amplitude_scale(
+    batch: np.ndarray, rng: np.random.Generator, max_scale: float = AUGMENT_MAX_SCALE
+) -> np.ndarray:
+    scales = rng.uniform(1 - max_scale, 1 + max_scale, size=(len(batch), 1, 6))
+    return batch * scales
+
+
+def gaussian_noise(
+    batch: np.ndarray,
+    rng: np.random.Generator,
+    accel_noise: float = AUGMENT_ACCEL_NOISE,
+    gyro_noise: float = AUGMENT_GYRO_NOISE,
+) -> np.ndarray:
+    sigma = np.array([accel_noise] * 3 + [gyro_noise] * 3)
+    return batch + rng.standard_normal(batch.shape) * sigma
+
+
+# (B, 3, 3) rotations about random axes by up to `max_degrees`, Rodrigues' formula
+def random_rotations(
+    count: int, rng: np.random.Generator, max_degrees: float
+) -> np.ndarray:
+    axes = rng.standard_normal((count, 3))
+    axes /= np.linalg.norm(axes, axis=1, keepdims=True)
+    angles = np.radians(rng.uniform(-max_degrees, max_degrees, size=(count, 1, 1)))
+    x, y, z = axes[:, 0], axes[:, 1], axes[:, 2]
+    zeros = np.zeros(count)
+    cross = np.stack(
+        (
+            np.stack((zeros, -z, y), axis=1),
+            np.stack((z, zeros, -x), axis=1),
+            np.stack((-y, x, zeros), axis=1),
+        ),
+        axis=1,
+    )
+    return (
+        np.eye(3)
+        + np.sin(angles) * cross
+        + (1 - np.cos(angles)) * np.einsum("bij,bjk->bik", cross, cross)
+    )
+
+
+# Rotate the accelerometer and gyroscope vectors of each sample together, as if the device was
+# held slightly differently
+def rotate(
+    batch: np.ndarray,
+    rng: np.random.Generator,
+    max_degrees: float = AUGMENT_MAX_ROTATION,
+) -> np.ndarray:
+    rotations = random_rotations(len(batch), rng, max_degrees)
+    # Both vectors of every row as (B, 2T, 3) rows, one batched matrix product rotates all of them
+    vectors = np.ascontiguousarray(batch).reshape(len(batch), -1, 3)
+    return (vectors @ rotations.transpose(0, 2, 1)).reshape(batch.shape)
+
+
+# Applies every augmentation to whole (batch, length, 6) arrays, a 0 amount turns one off.
+# The same seed gives the same sequence of augmented batches.
+class batchAugmenter:
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        max_shift: int = AUGMENT_MAX_SHIFT,
+        max_warp: float = AUGMENT_MAX_WARP,
+        max_scale: float = AUGMENT_MAX_SCALE,
+        accel_noise: float = AUGMENT_ACCEL_NOISE,
+        gyro_noise: float = AUGMENT_GYRO_NOISE,
+        max_rotation: float = AUGMENT_MAX_ROTATION,
+    ) -> None:
+        self.rng = np.random.default_rng(seed)
+        self.max_shift = max_shift
+        self.max_warp = max_warp
+        self.max_scale = max_scale
+        self.accel_noise = accel_noise
+        self.gyro_noise = gyro_noise
+        self.max_rotation = max_rotation
+
+    def augment(self, batch: np.ndarray) -> np.ndarray:
+        augmented = np.asarray(batch, dtype=np.float64)
+        if self.max_shift or self.max_warp:
+            # Shift and warp together, the rows are only interpolated once
+            positions = time_positions(
+                len(augmented),
+                augmented.shape[1],
+                self.rng,
+                self.max_shift,
+                self.max_warp,
+            )
+            augmented = sample_rows(augmented, positions)
+        if self.max_rotation:
+            augmented = rotate(augmented, self.rng, self.max_rotation)
+        if self.max_scale:
+            augmented = amplitude_scale(augmented, self.rng, self.max_scale)
+        if self.accel_noise or self.gyro_noise:
+            augmented = gaussian_noise(
+                augmented, self.rng, self.accel_noise, self.gyro_noise
+            )
+        return augmented.astype(np.float32)
+
+
+# Endless shuffled (inputs, targets) batches of in-memory arrays, reshuffled every epoch
+def array_batches(
+    inputs: np.ndarray,
+    targets: np.ndarray,
+    batch_size: int = 32,
+    seed: Optional[int] = None,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    rng = np.random.default_rng(seed)
+    while True:
+        order = rng.permutation(len(inputs))
+        for start in range(0, len(order), batch_size):
+            batch = order[start : start + batch_size]
+            yield inputs[batch], targets[batch]
+
+
+# Augments the batches of `source` in a background thread, up to `prefetch` batches ahead, so the
+# trainer does not wait for them. Iterate over it like the source, e.g. in `model.fit`.
+class augmentationWorker:
+    def __init__(
+        self,
+        source: Iterator[tuple[np.ndarray, np.ndarray]],
+        augmenter: batchAugmenter,
+        prefetch: int = AUGMENT_PREFETCH_BATCHES,
+    ) -> None:
+        self.source = source
+        self.augmenter = augmenter
+        self.killed: bool = False
+        self.ended: Optional[Exception] = (
+            None  # StopIteration or the error of the thread
+        )
+        # Batches, then None once the source runs out or the error that stopped the thread
+        self.batches: queue.Queue[
+            Union[tuple[np.ndarray, np.ndarray], Exception, None]
+        ] = queue.Queue(maxsize=prefetch)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self) -> None:
+        try:
+            for inputs, targets in self.source:
+                if not self.put((self.augmenter.augment(inputs), targets)):
+                    return
+        except Exception as err:
+            # Raised again in the consumer instead of leaving it waiting forever
+            self.put(err)
+            return
+        # The source ran out, tell the consumer
+        self.put(None)
+
+    # False if the worker was closed before the consumer made room
+    def put(self, item: Union[tuple[np.ndarray, np.ndarray], Exception, None]) -> bool:
+        while not self.killed:
+            try:
+                self.batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __iter__(self) -> "augmentationWorker":
+        return self
+
+    def __next__(self) -> tuple[np.ndarray, np.ndarray]:
+        # Raised again on every later call, nothing else comes after it
+        if self.ended is None:
+            batch = self.batches.get()
+            if batch is None:
+                self.ended = StopIteration()
+            elif isinstance(batch, Exception):
+                self.ended = batch
+            else:
+                return batch
+        raise self.ended
+
+    def close(self) -> None:
+        self.killed = True
+        self.thread.join(timeout=1)
+        if self.thread.is_alive():
+            print("augmentation_thread did not exit in time")
+
+
+if __name__ == "__main__":
+    import argparse
+    from time import perf_counter, sleep
+
+    from resampler import RESAMPLE_INTERVAL_MS
+    from sampleData import get_gestures, load_gesture_samples
+
+    parser = argparse.ArgumentParser(
+        description="Measure how many augmented batches per second can be produced"
+    )
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--batches", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    samples = np.concatenate(
+        [
+            load_gesture_samples(gesture, resample_interval=RESAMPLE_INTERVAL_MS)[1]
+            for gesture in get_gestures()
+        ]
+    )
+    targets = np.zeros((len(samples), 1), dtype=np.float32)
+    print(f"{len(samples)} samples, batches of {args.batch_size}")
+
+    augmenter = batchAugmenter(args.seed)
+    for name, augment in (
+        ("time shift", lambda batch: time_shift(batch, augmenter.rng)),
+        ("time warp", lambda batch: time_warp(batch, augmenter.rng)),
+        ("rotation", lambda batch: rotate(batch, augmenter.rng)),
+        ("scale", lambda batch: amplitude_scale(batch, augmenter.rng)),
+        ("noise", lambda batch: gaussian_noise(batch, augmenter.rng)),
+        ("all", augmenter.augment),
+    ):
+        source = array_batches(samples, targets, args.batch_size, args.seed)
+        start_time = perf_counter()
+        for _ in range(args.batches):
+            augment(next(source)[0])
+        elapsed = perf_counter() - start_time
+        print(f"  {name:10s} {args.batches / elapsed:8.0f} batches/s")
+
+    # Consumer that needs 2 ms per batch and lets the worker run meanwhile, as a training step would
+    worker = augmentationWorker(
+        array_batches(samples, targets, args.batch_size, args.seed),
+        batchAugmenter(args.seed),
+    )
+    waited = 0.0
+    start_time = perf_counter()
+    for _ in range(args.batches):
+        wait_start = perf_counter()
+        next(worker)
+        waited += perf_counter() - wait_start
+        sleep(0.002)
+    elapsed = perf_counter() - start_time
+    worker.close()
+    print(
+        f"  prefetched {args.batches / elapsed:8.0f} batches/s, "
+        f"consumer waited {waited / elapsed:.0%} of the time"
+    )
+
+    first = batchAugmenter(args.seed).augment(samples[:8])
+    second = batchAugmenter(args.seed).augment(samples[:8])
+    print(f"Same seed, same batch: {np.array_equal(first, second)}")
@@ -0,0 +1,260 @@
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Optional
+
+import numpy as np
+
+from featureExtraction import FEATURE_NAMES, extract_features
+from gestureInference import (
+    MODEL_TFLITE_PATH,
+    load_gesture_labels,
+    load_model_sample_interval,
+    load_predictor,
+    load_tflite_interpreter,
+)
+from resampler import RESAMPLE_INTERVAL_MS
+from sampleData import (
+    SAMPLE_LENGTH,
+    SAVEDATA_FOLDER_PATH,
+    load_gesture_samples,
+)
+from sampleCatalog import sampleCatalog
+
+SCORE_REPORT_PATH = "./model/score_report.csv"
+SCORE_REPORT_HEADER = [
+    "gesture",
+    "file",
+    "predicted",
+    "confidence",
+    "gesture_confidence",
+    "correct",
+]
+SCORE_TFLITE_BATCH_SIZE = 256
+
+
+class sampleScore:
+    def __init__(
+        self,
+        gesture: str,
+        file: str,
+        predicted: str,
+        confidence: float,
+        gesture_confidence: float,
+    ) -> None:
+        self.gesture = gesture
+        self.file = file
+        self.predicted = predicted
+        self.confidence = confidence  # Probability of the predicted class
+        self.gesture_confidence = (
+            gesture_confidence  # Probability of the labelled class
+        )
+
+    @property
+    def correct(self) -> bool:
+        return self.gesture == self.predicted
+
+    def as_row(self) -> list[str]:
+        return [
+            self.gesture,
+            self.file,
+            self.predicted,
+            f"{self.confidence:.4f}",
+            f"{self.gesture_confidence:.4f}",
+            str(int(self.correct)),
+        ]
+
+
+# Load every sample of every gesture, returns (gesture, file) pairs and a (N, 120, 6) array.
+# With `resample_interval` the samples are resampled onto that grid first, as the model saw them.
+def load_savedata(
+    folder_path: str = SAVEDATA_FOLDER_PATH,
+    resample_interval: Optional[float] = None,
+) -> tuple[list[tuple[str, str]], np.ndarray]:
+    names: list[tuple[str, str]] = []
+    arrays: list[np.ndarray] = []
+    # Only the samples that passed the catalog checks are read
+    catalog = sampleCatalog(folder_path)
+    catalog.scan()
+    for gesture in catalog.gestures():
+        files, samples = load_gesture_samples(
+            gesture,
+            SAMPLE_LENGTH,
+            folder_path,
+            resample_interval,
+            catalog.files(gesture, valid_only=True),
+        )
+        names.extend((gesture, file) for file in files)
+        arrays.append(samples)
+    catalog.close()
+    if not arrays:
+        return names, np.empty((0, SAMPLE_LENGTH, 6))
+    return names, np.concatenate(arrays)
+
+
+tflite_interpreter = None
+
+
+def tflite_worker_init(model_path: str) -> None:
+    global tflite_interpreter
+    from gestureInference import load_tflite_interpreter
+
+    tflite_interpreter = load_tflite_interpreter(model_path)
+
+
+def tflite_worker_predict(windows: np.ndarray) -> np.ndarray:
+    from gestureInference import run_tflite
+
+    return run_tflite(tflite_interpreter, windows.astype(np.float32))
+
+
+# What the model takes for (N, 120, 6) samples: the samples themselves, or their features for a
+# model trained on featureExtraction.py's output, on the grid the model was trained on
+def model_inputs(
+    samples: np.ndarray, input_shape: tuple[int, ...], model_path: str
+) -> np.ndarray:
+    if tuple(input_shape) != (len(FEATURE_NAMES),):
+        return samples
+    interval = load_model_sample_interval(model_path) or RESAMPLE_INTERVAL_MS
+    return extract_features(samples, interval).astype(np.float32)
+
+
+# Class probabilities (N, classes) for (N, 120, 6) samples.
+# The NumPy engine runs in one vectorized pass, the TFLite interpreter is spread over processes.
+def predict_samples(
+    samples: np.ndarray,
+    model_path: str = MODEL_TFLITE_PATH,
+    engine: str = "numpy",
+    jobs: Optional[int] = None,
+) -> np.ndarray:
+    if engine == "numpy":
+        # Falls back to the interpreter in this process for models NumPy can't run
+        predict, _, input_shape = load_predictor(model_path)
+        return predict(model_inputs(samples, input_shape, model_path))
+
+    input_details = load_tflite_interpreter(model_path).get_input_details()[0]
+    samples = model_inputs(samples, tuple(input_details["shape"][1:]), model_path)
+    batches = [
+        samples[i : i + SCORE_TFLITE_BATCH_SIZE]
+        for i in range(0, len(samples), SCORE_TFLITE_BATCH_SIZE)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=tflite_worker_init, initargs=(model_path,)
+    ) as executor:
+        return np.concatenate(list(executor.map(tflite_worker_predict, batches)))
+
+
+def score_savedata(
+    model_path: str = MODEL_TFLITE_PATH,
+    engine: str = "numpy",
+    jobs: Optional[int] = None,
+    folder_path: str = SAVEDATA_FOLDER_PATH,
+    labels: Optional[list[str]] = None,
+) -> tuple[list[sampleScore], list[str]]:
+    if labels is None:
+        labels = load_gesture_labels()
+    names, samples = load_savedata(folder_path, load_model_sample_interval(model_path))
+    if not names:
+        return [], labels
+
+    probabilities = predict_samples(samples, model_path, engine, jobs)
+    labels = labels + [f"class {i}" for i in range(len(labels), probabilities.shape[1])]
+    predicted = probabilities.argmax(axis=1)
+
+    # Probability the model gives to the folder the sample is saved in, 0 if the model doesn't know it
+    label_index = {label: i for i, label in enumerate(labels)}
+    gesture_index = np.array([label_index.get(gesture, -1) for gesture, _ in names])
+    gesture_confidence = np.where(
+        gesture_index >= 0,
+        probabilities[np.arange(len(names)), np.maximum(gesture_index, 0)],
+        0.0,
+    )
+
+    scores = [
+        sampleScore(
+            gesture,
+            file,
+            labels[predicted[i]],
+            float(probabilities[i, predicted[i]]),
+            float(gesture_confidence[i]),
+        )
+        for i, (gesture, file) in enumerate(names)
+    ]
+    return scores, labels
+
+
+# Rows are the gesture folders, columns the predicted labels
+def confusion_matrix(
+    scores: list[sampleScore], labels: list[str]
+) -> tuple[list[str], np.ndarray]:
+    gestures = sorted({score.gesture for score in scores})
+    matrix = np.zeros((len(gestures), len(labels)), dtype=np.int64)
+    for score in scores:
+        matrix[gestures.index(score.gesture), labels.index(score.predicted)] += 1
+    return gestures, matrix
+
+
+# Samples the model disagrees with the most, lowest confidence for their own gesture first
+def worst_samples(scores: list[sampleScore], count: int = 20) -> list[sampleScore]:
+    return sorted(scores, key=lambda score: score.gesture_confidence)[:count]
+
+
+def write_report(scores: list[sampleScore], path: str = SCORE_REPORT_PATH) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(SCORE_REPORT_HEADER)
+        writer.writerows(score.as_row() for score in scores)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Score every savedata sample with the model and report likely mislabeled files"
+    )
+    parser.add_argument(
+        "--model", default=MODEL_TFLITE_PATH, help=".tflite or .npz model"
+    )
+    parser.add_argument("--engine", choices=["numpy", "tflite"], default="numpy")
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="processes for the TFLite engine"
+    )
+    parser.add_argument("--savedata", default=SAVEDATA_FOLDER_PATH)
+    parser.add_argument("--output", default=SCORE_REPORT_PATH)
+    parser.add_argument(
+        "--worst", type=int, default=20, help="number of worst samples to list"
+    )
+    args = parser.parse_args()
+
+    start_time = perf_counter()
+    scores, labels = score_savedata(args.model, args.engine, args.jobs, args.savedata)
+    elapsed = perf_counter() - start_time
+    write_report(scores, args.output)
+
+    if not scores:
+        print(f"No samples found in {args.savedata}")
+        return
+
+    accuracy = sum(score.correct for score in scores) / len(scores)
+    print(f"Scored {len(scores)} samples in {elapsed:.2f} s, accuracy {accuracy:.2%}")
+    print(f"Report written to {args.output}")
+
+    gestures, matrix = confusion_matrix(scores, labels)
+    width = max(len(name) for name in gestures + labels) + 2
+    print("\nConfusion (rows: folder, columns: predicted)")
+    print("".ljust(width) + "".join(label.rjust(width) for label in labels))
+    for gesture, row in zip(gestures, matrix):
+        print(gesture.ljust(width) + "".join(str(count).rjust(width) for count in row))
+
+    print(f"\nTop {args.worst} disagreements")
+    for score in worst_samples(scores, args.worst):
+        print(
+            f"{score.gesture}/{score.file}: predicted {score.predicted} ({score.confidence:.2f}), "
+            f"{score.gesture} {score.gesture_confidence:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,443 @@
+import json
+import math
+import os
+import platform
+import threading
+from datetime import datetime
+from time import perf_counter, perf_counter_ns, sleep
+from typing import Callable, Optional
+
+import numpy as np
+
+from devicePipeline import devicePipeline
+from imuParser import format_imu_line, parse_imu_line
+from perfStats import perfStats
+from serialHandler import serialHandler
+from tkDevicePanel import set_figure_data
+from tkPlotGraph import tkPlotGraph
+
+BENCHMARK_RATES = [100, 500, 1000, 2000, 5000, 10000]
+BENCHMARK_DURATION = 3.0
+BENCHMARK_STAGE_CALLS = 5000
+BENCHMARK_DRAW_FRAMES = 50
+BENCHMARK_RESULTS_PATH = "./benchmark_results.json"
+BENCHMARK_GRAPH_MAX_SAMPLES = 120
+BENCHMARK_DRAW_INTERVAL = 0.05
+BENCHMARK_DEVICE_TICK = 0.001
+BENCHMARK_DEVICE_TX_BUFFER = 4096  # Bytes the fake MCU can hold before it drops samples
+BENCHMARK_DELIVERED_THRESHOLD = 0.99
+BENCHMARK_LATENCY_GROWTH_THRESHOLD = 2.0
+BENCHMARK_CONTENTION_RATE = 1000
+
+
+# A sample line that looks like the MCU output, values are smooth so graphs draw realistic lines
+def synthetic_line(timestamp: int, index: int) -> str:
+    phase = index / 50
+    return format_imu_line(
+        timestamp,
+        (
+            math.sin(phase),
+            math.cos(phase),
+            -1.0,
+            100 * math.sin(phase * 2),
+            100 * math.cos(phase * 2),
+            10.0,
+        ),
+    )
+
+
+# Fake MCU on a pseudo-terminal, prints [IMU] lines at a fixed rate.
+# Timestamps are host milliseconds since start, so the receiver can compute transport latency.
+class fakeDevice:
+    def __init__(self, rate: float) -> None:
+        import tty
+
+        self.rate = rate
+        self.killed: bool = False
+        self.sent: int = 0
+        self.dropped: int = 0
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        os.set_blocking(self.master_fd, False)
+        self.port: str = os.ttyname(self.slave_fd)
+        self.start_time: float = 0.0
+        self.device_thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self) -> None:
+        self.start_time = perf_counter()
+        self.device_thread.start()
+
+    def run(self) -> None:
+        pending = bytearray()
+        index = 0
+        while not self.killed:
+            # Queue every sample that is due, drop it if the TX buffer is full like a UART would
+            now = perf_counter() - self.start_time
+            due = int(now * self.rate)
+            while index < due:
+                if len(pending) < BENCHMARK_DEVICE_TX_BUFFER:
+                    pending += (synthetic_line(int(now * 1000), index) + "\n").encode()
+                    self.sent += 1
+                else:
+                    self.dropped += 1
+                index += 1
+
+            if pending:
+                try:
+                    written = os.write(self.master_fd, pending)
+                    del pending[:written]
+                except (BlockingIOError, OSError):
+                    pass
+            sleep(BENCHMARK_DEVICE_TICK)
+
+    def stop(self) -> None:
+        self.killed = True
+        self.device_thread.join(timeout=1)
+
+    def close(self) -> None:
+        self.stop()
+        os.close(self.master_fd)
+        os.close(self.slave_fd)
+
+
+# Percentile summary of a list of durations in seconds
+def summarize(durations: list[float], unit: float = 1e6, name: str = "us") -> dict:
+    if not durations:
+        return {}
+    values = np.asarray(durations) * unit
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        f"mean_{name}": float(values.mean()),
+        f"p50_{name}": float(p50),
+        f"p95_{name}": float(p95),
+        f"p99_{name}": float(p99),
+        f"max_{name}": float(values.max()),
+    }
+
+
+def time_calls(function: Callable[[int], None], count: int) -> dict:
+    durations: list[float] = []
+    for i in range(count):
+        start_time = perf_counter_ns()
+        function(i)
+        durations.append((perf_counter_ns() - start_time) / 1e9)
+    result = summarize(durations)
+    result["calls_per_second"] = count / max(sum(durations), 1e-12)
+    return result
+
+
+def make_graphs() -> tuple[tkPlotGraph, tkPlotGraph]:
+    accelerometer = tkPlotGraph(
+        master=None, title="Acceleration (G)", max_samples=BENCHMARK_GRAPH_MAX_SAMPLES
+    )
+    accelerometer.set_ylim(-4, 4)
+    gyroscope = tkPlotGraph(
+        master=None,
+        title="Angular Velocity (DPS)",
+        max_samples=BENCHMARK_GRAPH_MAX_SAMPLES,
+    )
+    gyroscope.set_ylim(-3000, 3000)
+    return accelerometer, gyroscope
+
+
+# Same work as SerialPlotterApp.update_graphs, on offscreen graphs
+def append_sample(
+    accelerometer: tkPlotGraph, gyroscope: tkPlotGraph, line: str
+) -> None:
+    sample = parse_imu_line(line)
+    if sample:
+        acc_x, acc_y, acc_z = sample.accelerometer
+        accelerometer.append_dict(
+            sample.timestamp, {"x-axis": acc_x, "y-axis": acc_y, "z-axis": acc_z}
+        )
+        gyro_x, gyro_y, gyro_z = sample.gyroscope
+        gyroscope.append_dict(
+            sample.timestamp, {"x-axis": gyro_x, "y-axis": gyro_y, "z-axis": gyro_z}
+        )
+
+
+def bench_parse(count: int) -> dict:
+    lines = [synthetic_line(i * 10, i) for i in range(count)]
+    return time_calls(lambda i: parse_imu_line(lines[i]), count)
+
+
+def bench_append(count: int) -> dict:
+    accelerometer, gyroscope = make_graphs()
+    values = {"x-axis": 0.1, "y-axis": 0.2, "z-axis": 0.3}
+    result = time_calls(lambda i: accelerometer.append_dict(i * 10, values), count)
+    accelerometer.close()
+    gyroscope.close()
+    return result
+
+
+def bench_draw(frames: int) -> dict:
+    accelerometer, gyroscope = make_graphs()
+    for i in range(BENCHMARK_GRAPH_MAX_SAMPLES):
+        append_sample(accelerometer, gyroscope, synthetic_line(i * 10, i))
+
+    def draw(i: int) -> None:
+        # Add one sample so the graph is redrawn every frame
+        append_sample(accelerometer, gyroscope, synthetic_line((i + 200) * 10, i))
+        accelerometer.draw()
+
+    result = time_calls(draw, frames)
+    accelerometer.close()
+    gyroscope.close()
+    return result
+
+
+# Cost of one instrumentation hook: timing a stage and bumping a counter
+def bench_instrumentation(count: int) -> dict:
+    stats = perfStats()
+    stats.enabled = True
+
+    def hook(i: int) -> None:
+        start_time = perf_counter_ns()
+        if stats.enabled:
+            stats.record_since("stage", start_time)
+            stats.count("events")
+
+    return time_calls(hook, count)
+
+
+# Terminal writes need a Tk display, skipped when there is none
+def bench_terminal(count: int) -> dict:
+    try:
+        import tkinter as tk
+        from tkTerminal import tkTerminal
+
+        root = tk.Tk()
+    except Exception as err:
+        return {"skipped": f"no display: {err}"}
+
+    terminal = tkTerminal(master=root, width=180)
+    terminal.grid(row=0, column=0)
+    lines = [synthetic_line(i * 10, i) + "\n" for i in range(count)]
+    result = time_calls(lambda i: terminal.write(lines[i]), count)
+    root.destroy()
+    return result
+
+
+# Fake device -> pty -> serialHandler -> parse -> graph buffers, with a draw thread like the app
+def bench_end_to_end(rate: float, duration: float) -> dict:
+    device = fakeDevice(rate)
+    accelerometer, gyroscope = make_graphs()
+    latencies: list[tuple[float, float]] = []
+    received = [0]
+    frames = [0]
+    killed = [False]
+
+    def line_received(line: str) -> None:
+        receive_time = perf_counter() - device.start_time
+        append_sample(accelerometer, gyroscope, line)
+        received[0] += 1
+        if accelerometer.timestamp:
+            latencies.append(
+                (receive_time, receive_time - accelerometer.timestamp[-1] / 1000)
+            )
+
+    def draw_graphs() -> None:
+        while not killed[0]:
+            sleep(BENCHMARK_DRAW_INTERVAL)
+            try:
+                accelerometer.draw()
+                gyroscope.draw()
+                frames[0] += 1
+            except RuntimeError:
+                # The buffers were appended to while drawing, the app skips the frame too
+                pass
+
+    handler = serialHandler(line_received_callback=line_received)
+    draw_thread = threading.Thread(target=draw_graphs, daemon=True)
+    try:
+        handler.connect(device.port)
+        draw_thread.start()
+        device.start()
+        sleep(duration)
+        device.stop()
+        # Let the reader drain what is already in the pty
+        sleep(min(1.0, duration / 2))
+    finally:
+        killed[0] = True
+        handler.close()
+        draw_thread.join(timeout=1)
+        device.close()
+        accelerometer.close()
+        gyroscope.close()
+
+    # Compare the first and the last third of the run to see if latency keeps growing
+    times = np.array([t for t, _ in latencies]) if latencies else np.empty(0)
+    values = np.array([v for _, v in latencies]) if latencies else np.empty(0)
+    early = values[times < duration / 3]
+    late = values[(times >= 2 * duration / 3) & (times < duration)]
+    early_p50 = float(np.median(early)) * 1000 if early.size else 0.0
+    late_p50 = float(np.median(late)) * 1000 if late.size else 0.0
+    latency_growing = late_p50 > max(
+        BENCHMARK_LATENCY_GROWTH_THRESHOLD * early_p50, early_p50 + 5
+    )
+
+    offered = device.sent + device.dropped
+    delivered_ratio = received[0] / offered if offered else 0.0
+    result = {
+        "rate": rate,
+        "offered": offered,
+        "dropped_at_device": device.dropped,
+        "received": received[0],
+        "delivered_ratio": delivered_ratio,
+        "samples_per_second": received[0] / duration,
+        "frames_per_second": frames[0] / duration,
+        "latency_early_p50_ms": early_p50,
+        "latency_late_p50_ms": late_p50,
+        "latency_growing": bool(latency_growing),
+        "saturated": bool(
+            delivered_ratio < BENCHMARK_DELIVERED_THRESHOLD or latency_growing
+        ),
+    }
+    result.update(summarize([v for _, v in latencies], unit=1000, name="latency_ms"))
+    return result
+
+
+# Ingestion rate while the UI side draws as fast as it can, like during a resize or a Data Viewer load.
+# In thread mode parsing competes with drawing for the GIL, in process mode only the ring is shared.
+def bench_ui_contention(rate: float, duration: float, use_process: bool) -> dict:
+    device = fakeDevice(rate)
+    accelerometer, gyroscope = make_graphs()
+    pipeline = devicePipeline(device.port, use_process=use_process)
+    frames = 0
+    try:
+        pipeline.connect()
+        # A child process needs a moment to start and open the port
+        start_time = perf_counter()
+        while not pipeline.is_connected() and perf_counter() - start_time < 10:
+            sleep(0.05)
+        device.start()
+        start_time = perf_counter()
+        while perf_counter() - start_time < duration:
+            set_figure_data(
+                accelerometer, gyroscope, *pipeline.latest(BENCHMARK_GRAPH_MAX_SAMPLES)
+            )
+            accelerometer.draw()
+            gyroscope.draw()
+            frames += 1
+        device.stop()
+        sleep(min(1.0, duration / 2))
+    finally:
+        ingested = pipeline.ingested_samples()
+        pipeline.close()
+        device.close()
+        accelerometer.close()
+        gyroscope.close()
+
+    offered = device.sent + device.dropped
+    return {
+        "rate": rate,
+        "mode": "process" if use_process else "thread",
+        "offered": offered,
+        "dropped_at_device": device.dropped,
+        "ingested": ingested,
+        "delivered_ratio": ingested / offered if offered else 0.0,
+        "frames_per_second": frames / duration,
+    }
+
+
+# Print how much each number changed compared to an earlier results file
+def compare_results(current: dict, previous: dict) -> None:
+    print("\nComparison with previous results")
+    for stage in ("parse", "append", "terminal", "draw", "instrumentation"):
+        now, before = current.get(stage, {}), previous.get(stage, {})
+        if "p50_us" in now and "p50_us" in before:
+            ratio = now["p50_us"] / max(before["p50_us"], 1e-12)
+            print(
+                f"  {stage:10s} p50 {before['p50_us']:9.2f} -> {now['p50_us']:9.2f} us ({ratio:.2f}x)"
+            )
+    print(
+        f"  max sustained rate {previous.get('max_sustained_rate')} -> {current.get('max_sustained_rate')} Hz"
+    )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Measure ingest, parse, buffer, terminal and draw throughput with a fake MCU"
+    )
+    parser.add_argument("--rates", type=float, nargs="+", default=BENCHMARK_RATES)
+    parser.add_argument("--duration", type=float, default=BENCHMARK_DURATION)
+    parser.add_argument("--calls", type=int, default=BENCHMARK_STAGE_CALLS)
+    parser.add_argument("--frames", type=int, default=BENCHMARK_DRAW_FRAMES)
+    parser.add_argument("--output", default=BENCHMARK_RESULTS_PATH)
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    results: dict = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+    }
+
+    print("Stages")
+    for stage, run in (
+        ("parse", lambda: bench_parse(args.calls)),
+        ("append", lambda: bench_append(args.calls)),
+        ("terminal", lambda: bench_terminal(args.calls)),
+        ("draw", lambda: bench_draw(args.frames)),
+        ("instrumentation", lambda: bench_instrumentation(args.calls)),
+    ):
+        results[stage] = run()
+        if "skipped" in results[stage]:
+            print(f"  {stage:10s} skipped ({results[stage]['skipped']})")
+        else:
+            print(
+                f"  {stage:10s} p50 {results[stage]['p50_us']:9.2f} us, "
+                f"p99 {results[stage]['p99_us']:9.2f} us, "
+                f"{results[stage]['calls_per_second']:10.0f} /s"
+            )
+
+    print("\nEnd to end")
+    results["end_to_end"] = []
+    max_sustained_rate: Optional[float] = None
+    saturation_rate: Optional[float] = None
+    for rate in sorted(args.rates):
+        result = bench_end_to_end(rate, args.duration)
+        results["end_to_end"].append(result)
+        print(
+            f"  {rate:7.0f} Hz: received {result['samples_per_second']:8.0f} /s, "
+            f"delivered {result['delivered_ratio']:7.2%}, "
+            f"latency p50 {result.get('p50_latency_ms', 0):7.1f} ms, "
+            f"p99 {result.get('p99_latency_ms', 0):7.1f} ms, "
+            f"{result['frames_per_second']:4.1f} fps"
+            + (" SATURATED" if result["saturated"] else "")
+        )
+        if result["saturated"] and saturation_rate is None:
+            saturation_rate = rate
+        if saturation_rate is None:
+            max_sustained_rate = rate
+    print("\nIngestion while drawing continuously")
+    results["ui_contention"] = []
+    for use_process in (False, True):
+        result = bench_ui_contention(
+            BENCHMARK_CONTENTION_RATE, args.duration, use_process
+        )
+        results["ui_contention"].append(result)
+        print(
+            f"  {result['mode']:7s}: delivered {result['delivered_ratio']:7.2%} "
+            f"of {result['offered']} samples, {result['frames_per_second']:4.1f} fps"
+        )
+
+    results["max_sustained_rate"] = max_sustained_rate
+    results["saturation_rate"] = saturation_rate
+    print(
+        f"\nMax sustained rate: {max_sustained_rate} Hz, saturates at: {saturation_rate} Hz"
+    )
+
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            compare_results(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import csv
+from collections import deque
+from time import perf_counter
+from typing import Callable, Optional
+
+import numpy as np
+
+CLOCK_BLOCK_SECONDS = 1.0  # Device time covered by one minimum in the fit
+CLOCK_BLOCKS = 60  # Minima kept for the offset/drift fit
+CLOCK_HISTORY = 2000  # Latencies kept for the percentiles and the export
+CLOCK_LOG_INTERVAL = 10.0  # Seconds between two summaries in the log
+
+
+# Aligns device millisecond timestamps with host perf_counter() time.
+# The host receive time is modelled as `offset + (1 + drift) * device_time + latency`, where
+# offset and drift are fitted on the lowest-latency sample of every block. Latencies are therefore
+# measured above the fastest observed delivery, not absolute, as the link has no round trip.
+class clockSync:
+    def __init__(
+        self,
+        log_callback: Optional[Callable[[str], None]] = None,
+        log_interval: float = CLOCK_LOG_INTERVAL,
+    ) -> None:
+        self.log_callback = log_callback
+        self.log_interval = log_interval
+        self.reset()
+
+    def reset(self) -> None:
+        self.block_minima: deque[tuple[float, float]] = deque(maxlen=CLOCK_BLOCKS)
+        self.block_start: Optional[float] = None
+        self.block_minimum: Optional[tuple[float, float]] = None
+        self.offset: Optional[float] = None
+        self.drift: float = 0.0
+        self.last_device_time: Optional[float] = None
+        self.last_drawn_timestamp: Optional[int] = None
+        self.last_log_time: float = perf_counter()
+        # (device ms, host receive time, transport latency ms)
+        self.samples: deque[tuple[int, float, float]] = deque(maxlen=CLOCK_HISTORY)
+        self.transport_latencies: deque[float] = deque(maxlen=CLOCK_HISTORY)
+        self.pixel_latencies: deque[float] = deque(maxlen=CLOCK_HISTORY)
+
+    def log(self, message: str) -> None:
+        if self.log_callback:
+            self.log_callback(message)
+
+    # Host time at which a sample taken at `timestamp` would arrive with the lowest latency
+    def device_to_host(self, timestamp: int) -> Optional[float]:
+        if self.offset is None:
+            return None
+        device_time = timestamp / 1000
+        return self.offset + (1 + self.drift) * device_time
+
+    # Call with the host time the line was read, as soon after readline as possible
+    def push(self, timestamp: int, host_time: float) -> float:
+        device_time = timestamp / 1000
+        if self.last_device_time is not None and device_time < self.last_device_time:
+            # The MCU restarted, its clock has a new origin
+            self.reset()
+        self.last_device_time = device_time
+
+        residual = host_time - device_time
+        if self.block_start is None:
+            self.block_start = device_time
+        if self.block_minimum is None or residual < self.block_minimum[1]:
+            self.block_minimum = (device_time, residual)
+        if self.offset is None:
+            self.offset = residual
+
+        # Close the block and refit once per block, not once per sample
+        if device_time - self.block_start >= CLOCK_BLOCK_SECONDS:
+            self.block_minima.append(self.block_minimum)
+            self.block_start = device_time
+            self.block_minimum = None
+            self.fit()
+
+        # Only the minimum so far can be trusted until two blocks are closed
+        if len(self.block_minima) < 2:
+            self.offset = min(self.offset, residual)
+
+        latency = (residual - self.offset - self.drift * device_time) * 1000
+        self.samples.append((timestamp, host_time, latency))
+        self.transport_latencies.append(latency)
+
+        if host_time - self.last_log_time >= self.log_interval:
+            self.last_log_time = host_time
+            self.log(self.summary())
+        return latency
+
+    def fit(self) -> None:
+        if len(self.block_minima) < 2:
+            return
+        device_times, residuals = np.asarray(self.block_minima).T
+        slope, intercept = np.polyfit(device_times, residuals, 1)
+        # Shift the line down so it stays under every minimum
+        intercept += min(
+            0.0, float((residuals - (slope * device_times + intercept)).min())
+        )
+        self.drift = float(slope)
+        self.offset = float(intercept)
+
+    # Call after the graphs are drawn, with the newest device timestamp they show
+    def mark_drawn(self, timestamp: int, host_time: float) -> Optional[float]:
+        if timestamp == self.last_drawn_timestamp:
+            return None
+        self.last_drawn_timestamp = timestamp
+
+        sampled_host_time = self.device_to_host(timestamp)
+        if sampled_host_time is None:
+            return None
+        latency = (host_time - sampled_host_time) * 1000
+        self.pixel_latencies.append(latency)
+        return latency
+
+    # Offset, drift and latency percentiles, suitable for perfStats gauges
+    def stats(self) -> dict[str, float]:
+        stats = {
+            "drift_ppm": self.drift * 1e6,
+            "offset_s": self.offset or 0.0,
+        }
+        for name, latencies in (
+            ("transport", list(self.transport_latencies)),
+            ("sensor_to_pixel", list(self.pixel_latencies)),
+        ):
+            if latencies:
+                p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+                stats.update(
+                    {
+                        f"{name}_p50_ms": float(p50),
+                        f"{name}_p95_ms": float(p95),
+                        f"{name}_p99_ms": float(p99),
+                    }
+                )
+        return stats
+
+    def summary(self) -> str:
+        stats = self.stats()
+        message = f"Clock drift {stats['drift_ppm']:.0f} ppm"
+        for name in ("transport", "sensor_to_pixel"):
+            if f"{name}_p50_ms" in stats:
+                message += (
+                    f", {name.replace('_', '-')} p50 {stats[f'{name}_p50_ms']:.1f} ms"
+                    f" p99 {stats[f'{name}_p99_ms']:.1f} ms"
+                )
+        return message
+
+    def export_csv(self, path: str) -> None:
+        with open(path, mode="w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["device_ms", "host_s", "transport_latency_ms"])
+            writer.writerows(list(self.samples))
+
+
+if __name__ == "__main__":
+    # 100 Hz device clock running 50 ppm fast, 2-20 ms of random transport delay
+    rng = np.random.default_rng(0)
+    sync = clockSync(log_callback=print, log_interval=20)
+    for i in range(6000):
+        timestamp = i * 10
+        host_time = 3.0 + timestamp / 1000 * (1 + 50e-6) + rng.uniform(0.002, 0.02)
+        sync.push(timestamp, host_time)
+        if i % 5 == 0:
+            sync.mark_drawn(timestamp, host_time + 0.03)
+    print(sync.summary())
@@ -0,0 +1,444 @@
+import multiprocessing
+import os
+import queue
+import threading
+from collections import deque
+from time import perf_counter, sleep
+from typing import Callable, List, Optional
+
+import numpy as np
+import serial
+
+from asyncSerial import asyncPort, asyncSerialHub
+from clockSync import clockSync
+from imuParser import parse_imu_line
+from perfStats import perf_stats
+from sampleMonitor import sampleMonitor
+from serialHandler import REPLAY_PORT_PREFIX, serialHandler
+from sharedRing import sharedRing
+
+DEVICE_BUFFER_SAMPLES = 2000  # Samples kept per device for saving, about 20 s at 100 Hz
+DEVICE_QUEUE_BATCHES = 1000  # Batches buffered between a reader process and the app
+DEVICE_STOP_TIMEOUT = 2.0
+DEVICE_RING_COLUMNS = 8  # Host receive time, device ms, aX, aY, aZ, gX, gY, gZ
+DEVICE_MULTI_FOLDER = "multi"  # Aligned multi-device samples go in "{gesture}/multi/"
+
+# (host receive time, device ms, (aX, aY, aZ, gX, gY, gZ))
+deviceSample = tuple[float, int, tuple[float, float, float, float, float, float]]
+
+
+# Short name of a port, used to label panels, terminal lines and saved columns
+def device_name(port: str) -> str:
+    if port.startswith(REPLAY_PORT_PREFIX):
+        path = port[len(REPLAY_PORT_PREFIX) :].partition("?")[0]
+        return "replay_" + os.path.basename(path.split(",")[0].rstrip("/\\"))
+    return os.path.basename(port)
+
+
+# Parse a batch of lines read together, they share one host receive time
+def parse_batch(lines: List[str], received_time: float) -> List[deviceSample]:
+    samples: List[deviceSample] = []
+    for line in lines:
+        sample = parse_imu_line(line)
+        if sample:
+            samples.append((received_time, sample.timestamp, sample.values()))
+    return samples
+
+
+# Runs in a child process: reads and parses one port into the shared ring `ring_name`.
+# Lines for the terminal and logs go through `messages`: ("connected", name), ("batch", (lines, dropped)),
+# ("log", message) and ("closed", None). Samples never wait on the app, only lines can be dropped.
+def device_reader_process(
+    port: str,
+    baudrate: int,
+    ring_name: str,
+    ring_capacity: int,
+    messages: multiprocessing.Queue,
+    stop_event,
+) -> None:
+    ring = sharedRing(DEVICE_RING_COLUMNS, capacity=ring_capacity, name=ring_name)
+    dropped: int = 0
+
+    def send(kind: str, payload) -> bool:
+        try:
+            messages.put_nowait((kind, payload))
+            return True
+        except queue.Full:
+            return False
+
+    def lines_received(lines: List[str]) -> None:
+        nonlocal dropped
+        samples = parse_batch(lines, perf_counter())
+        if samples:
+            ring.write(
+                np.array(
+                    [
+                        (received, timestamp) + values
+                        for received, timestamp, values in samples
+                    ]
+                )
+            )
+        if send("batch", (lines, dropped)):
+            dropped = 0
+        else:
+            # The app is not keeping up, drop the lines rather than stall the port
+            dropped += len(lines)
+
+    handler = serialHandler(
+        lines_received_callback=lines_received,
+        log_callback=lambda message: send("log", message),
+        monitor_ports=False,
+    )
+    try:
+        handler.connect(port, baudrate=baudrate)
+    except serial.SerialException as err:
+        send("log", f"Could not connect to [{port}]: {err}")
+        send("closed", None)
+        handler.close()
+        ring.close()
+        return
+
+    # Lines still queued at shutdown are not worth waiting for, the error above is
+    messages.cancel_join_thread()
+    send("connected", handler.serial_port.name if handler.serial_port else port)
+    while not stop_event.is_set() and handler.is_connected():
+        stop_event.wait(0.1)
+    handler.close()
+    ring.close()
+    send("closed", None)
+
+
+# One device: its own reader, parser, buffers, sample monitor and clock alignment.
+# With `use_process` the reading and parsing run in a child process, so a busy device or a busy UI
+# cannot slow ingestion down. Samples are then kept in a shared memory ring the UI reads directly,
+# and `connection_callback` hears when the child opened the port and when it stopped reading it.
+class devicePipeline:
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 115200,
+        use_process: bool = False,
+        sample_callback: Optional[Callable[[List[deviceSample]], None]] = None,
+        lines_callback: Optional[Callable[[str, List[str]], None]] = None,
+        log_callback: Optional[Callable[[str], None]] = None,
+        buffer_samples: int = DEVICE_BUFFER_SAMPLES,
+        hub: Optional[asyncSerialHub] = None,
+        connection_callback: Optional[Callable[["devicePipeline", bool], None]] = None,
+    ) -> None:
+        self.port = port
+        self.name = device_name(port)
+        self.baudrate = baudrate
+        self.use_process = use_process
+        self.sample_callback = sample_callback
+        self.lines_callback = lines_callback
+        self.log_callback = log_callback
+        self.connection_callback = connection_callback
+        self.killed: bool = False
+        self.connected: bool = False
+        self.dropped_lines: int = 0
+        self.ingested: int = (
+            0  # Samples parsed in thread mode, the ring counts them otherwise
+        )
+
+        self.buffer_lock = threading.Lock()
+        self.timestamps: deque[int] = deque(maxlen=buffer_samples)
+        self.values: deque[tuple[float, ...]] = deque(maxlen=buffer_samples)
+
+        self.monitor = sampleMonitor(log_callback=self.log)
+        self.clock = clockSync(log_callback=self.clock_log)
+        perf_stats.add_source(f"{self.name}_imu", self.monitor.stats)
+        perf_stats.add_source(f"{self.name}_clock", self.clock.stats)
+
+        self.buffer_samples = buffer_samples
+        self.ring: Optional[sharedRing] = None
+        self.ring_cursor: int = 0
+        self.serial: Optional[serialHandler] = None
+        # In thread mode, a shared event loop reads the port instead of a thread of its own
+        self.hub = hub
+        self.hub_port: Optional[asyncPort] = None
+        self.process: Optional[multiprocessing.Process] = None
+        self.drain_thread: Optional[threading.Thread] = None
+
+    def log(self, message: str) -> None:
+        if self.log_callback:
+            self.log_callback(f"[{self.name}] {message}")
+
+    def clock_log(self, message: str) -> None:
+        if perf_stats.enabled:
+            self.log(message)
+
+    def connect(self) -> None:
+        if self.use_process:
+            context = multiprocessing.get_context("spawn")
+            self.ring = sharedRing(DEVICE_RING_COLUMNS, capacity=self.buffer_samples)
+            self.ring_cursor = 0
+            self.messages = context.Queue(maxsize=DEVICE_QUEUE_BATCHES)
+            self.stop_event = context.Event()
+            self.process = context.Process(
+                target=device_reader_process,
+                args=(
+                    self.port,
+                    self.baudrate,
+                    self.ring.name,
+                    self.buffer_samples,
+                    self.messages,
+                    self.stop_event,
+                ),
+                name=f"device-{self.name}",
+                daemon=True,
+            )
+            self.process.start()
+            self.drain_thread = threading.Thread(target=self.drain, daemon=True)
+            self.drain_thread.start()
+            return
+
+        if self.hub:
+            self.hub_port = self.hub.add_port(
+                self.port,
+                lines_received_callback=self.lines_received,
+                log_callback=self.log,
+                baudrate=self.baudrate,
+            )
+            self.connected = True
+            return
+
+        self.serial = serialHandler(
+            lines_received_callback=self.lines_received,
+            log_callback=self.log,
+            monitor_ports=False,
+        )
+        try:
+            self.serial.connect(self.port, baudrate=self.baudrate)
+        except serial.SerialException:
+            self.serial.close()
+            self.serial = None
+            raise
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        if self.use_process:
+            return (
+                self.connected and self.process is not None and self.process.is_alive()
+            )
+        if self.hub_port:
+            return self.hub_port.is_open
+        return self.serial is not None and self.serial.is_connected()
+
+    # Thread mode, called by the serialHandler reader thread or the hub dispatcher
+    def lines_received(self, lines: List[str]) -> None:
+        self.ingest(lines, parse_batch(lines, perf_counter()))
+
+    # Process mode, follows the ring for the monitor and clock and hands the lines on
+    def drain(self) -> None:
+        while not self.killed:
+            try:
+                kind, payload = self.messages.get(timeout=0.1)
+            except queue.Empty:
+                self.drain_ring()
+                if self.process is not None and not self.process.is_alive():
+                    break
+                continue
+            except (EOFError, OSError):
+                break
+
+            if kind == "batch":
+                lines, dropped = payload
+                if dropped:
+                    self.dropped_lines += dropped
+                    self.log(f"Dropped {dropped} lines, the app is not keeping up")
+                if self.lines_callback:
+                    self.lines_callback(self.name, lines)
+                self.drain_ring()
+            elif kind == "log":
+                self.log(payload)
+            elif kind == "connected":
+                self.connected = True
+                if self.connection_callback:
+                    self.connection_callback(self, True)
+            elif kind == "closed":
+                break
+        # The port could not be opened, was unplugged or the child died, not closed by the app
+        if not self.killed:
+            self.connected = False
+            if self.connection_callback:
+                self.connection_callback(self, False)
+        print(f"Device [{self.name}] drain thread exiting")
+
+    def drain_ring(self) -> None:
+        # close() may drop the ring at any time, only the local reference is used
+        ring = self.ring
+        if ring is None or self.killed:
+            return
+        rows, self.ring_cursor, lost = ring.read_since(self.ring_cursor)
+        if lost:
+            self.log(f"{lost} samples were overwritten before the app read them")
+        if not len(rows):
+            return
+
+        samples: List[deviceSample] = [
+            (row[0], int(row[1]), tuple(row[2:])) for row in rows.tolist()
+        ]
+        with self.buffer_lock:
+            for received_time, timestamp, _ in samples:
+                self.monitor.push(timestamp)
+                self.clock.push(timestamp, received_time)
+        if perf_stats.enabled:
+            perf_stats.count(f"{self.name}_samples", len(samples))
+        if self.sample_callback:
+            self.sample_callback(samples)
+
+    def ingest(self, lines: List[str], samples: List[deviceSample]) -> None:
+        if self.lines_callback:
+            self.lines_callback(self.name, lines)
+        if not samples:
+            return
+
+        with self.buffer_lock:
+            for received_time, timestamp, values in samples:
+                self.monitor.push(timestamp)
+                self.clock.push(timestamp, received_time)
+                self.timestamps.append(timestamp)
+                self.values.append(values)
+            self.ingested += len(samples)
+        if perf_stats.enabled:
+            perf_stats.count(f"{self.name}_samples", len(samples))
+        if self.sample_callback:
+            self.sample_callback(samples)
+
+    # Samples parsed so far, counted where they are parsed
+    def ingested_samples(self) -> int:
+        ring = self.ring
+        return ring.count if ring is not None else self.ingested
+
+    def reset(self) -> None:
+        with self.buffer_lock:
+            self.timestamps.clear()
+            self.values.clear()
+            self.monitor.reset()
+            self.clock.reset()
+
+    # Newest `length` buffered samples: (device ms, (N, 6) values)
+    def latest(self, length: int) -> tuple[np.ndarray, np.ndarray]:
+        ring = self.ring
+        if ring is not None:
+            rows = ring.latest(length)
+            return rows[:, 1].astype(np.int64), rows[:, 2:]
+        with self.buffer_lock:
+            timestamps = list(self.timestamps)[-length:]
+            values = list(self.values)[-length:]
+        return (
+            np.array(timestamps, dtype=np.int64),
+            np.array(values, dtype=np.float64).reshape(-1, 6),
+        )
+
+    # Buffered samples on the host timeline: (host seconds, device ms, (N, 6) values)
+    def aligned_samples(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        timestamps, values = self.latest(self.buffer_samples)
+        with self.buffer_lock:
+            offset, drift = self.clock.offset, self.clock.drift
+        if offset is None:
+            return np.empty(0), timestamps[:0], values[:0]
+        return offset + (1 + drift) * timestamps / 1000, timestamps, values
+
+    def close(self) -> None:
+        self.killed = True
+        perf_stats.remove_source(f"{self.name}_imu")
+        perf_stats.remove_source(f"{self.name}_clock")
+
+        if self.serial:
+            self.serial.close()
+        if self.hub and self.hub_port:
+            self.hub.remove_port(self.hub_port)
+            self.hub_port = None
+
+        if self.process:
+            self.stop_event.set()
+            self.process.join(timeout=DEVICE_STOP_TIMEOUT)
+            if self.process.is_alive():
+                print(f"device-{self.name} process did not exit in time")
+                self.process.terminate()
+        if self.drain_thread:
+            self.drain_thread.join(timeout=1)
+            if self.drain_thread.is_alive():
+                print(f"Device [{self.name}] drain thread did not exit in time")
+        # The ring was created here, so it is closed and unlinked here even if the drain thread
+        # is still stuck in a callback; it stops reading once it sees `killed`
+        if self.ring:
+            ring, self.ring = self.ring, None
+            ring.close()
+        self.connected = False
+
+
+# Interpolate every device onto the host times of the first one, rows outside the overlap are dropped.
+# `devices` holds (host seconds, (N, 6) values) per device, returns the kept row indices of the first
+# device and the (rows, 6 * devices) aligned values.
+def align_samples(
+    devices: List[tuple[np.ndarray, np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray]:
+    reference_times = devices[0][0]
+    keep = np.ones(reference_times.shape, dtype=bool)
+    for host_times, _ in devices[1:]:
+        if host_times.size < 2:
+            keep[:] = False
+            break
+        keep &= (reference_times >= host_times[0]) & (reference_times <= host_times[-1])
+
+    rows = np.flatnonzero(keep)
+    columns = [devices[0][1][rows]]
+    for host_times, values in devices[1:]:
+        columns.append(
+            np.column_stack(
+                [
+                    np.interp(reference_times[rows], host_times, values[:, axis])
+                    for axis in range(values.shape[1])
+                ]
+            )
+        )
+    return rows, np.hstack(columns)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Read several devices at once, each in its own pipeline"
+    )
+    parser.add_argument("ports", nargs="+", help="serial ports or replay:<path> ports")
+    parser.add_argument("--process", action="store_true", help="one process per device")
+    parser.add_argument(
+        "--hub", action="store_true", help="read every device on one asyncio loop"
+    )
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    hub = asyncSerialHub(log_callback=print) if args.hub else None
+    devices = [
+        devicePipeline(port, use_process=args.process, log_callback=print, hub=hub)
+        for port in args.ports
+    ]
+    for device in devices:
+        device.connect()
+    sleep(args.duration)
+
+    series = []
+    for device in devices:
+        host_times, timestamps, values = device.aligned_samples()
+        stats = device.monitor.stats()
+        print(
+            f"{device.name}: {len(timestamps)} samples, "
+            f"{stats['received_hz']:.1f} Hz, loss {stats['loss_ratio']:.2%}, "
+            f"dropped {device.dropped_lines} lines"
+        )
+        series.append((host_times, values))
+    if all(host_times.size for host_times, _ in series):
+        rows, aligned = align_samples(series)
+        print(f"Aligned {len(rows)} rows x {aligned.shape[1]} columns")
+
+    for device in devices:
+        device.close()
+    if hub:
+        hub.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+from typing import Optional
+
+import numpy as np
+
+from resampler import RESAMPLE_INTERVAL_MS
+from sampleData import SAMPLE_HEADER, SAMPLE_LENGTH
+
+# Frequency bands in Hz whose amplitude is a feature of every axis
+FEATURE_BANDS = [(1.0, 3.0), (3.0, 6.0), (6.0, 12.0), (12.0, 30.0)]
+FEATURE_AXIS_STATS = ["mean", "std", "min", "max", "rms", "crossings"]
+FEATURE_MAGNITUDE_STATS = ["mean", "std", "min", "max", "rms"]
+FEATURE_REFERENCE_PATH = "./model/features_reference.h"
+FEATURE_REFERENCE_WINDOWS = 4
+
+FEATURE_NAMES = [
+    f"{axis}_{stat}"
+    for axis in SAMPLE_HEADER[1:]
+    for stat in FEATURE_AXIS_STATS
+    + [f"band_{low:g}_{high:g}hz" for low, high in FEATURE_BANDS]
+] + [
+    f"{vector}_magnitude_{stat}"
+    for vector in ("accel", "gyro")
+    for stat in FEATURE_MAGNITUDE_STATS
+]
+
+
+# DFT bins of each band for windows of `length` samples `interval` ms apart, bin k is at
+# k / (length * interval) Hz
+def band_bins(length: int, interval: float = RESAMPLE_INTERVAL_MS) -> list[np.ndarray]:
+    frequencies = np.arange(length // 2 + 1) * 1000 / (length * interval)
+    return [
+        np.flatnonzero((frequencies >= low) & (frequencies < high) & (frequencies > 0))
+        for low, high in FEATURE_BANDS
+    ]
+
+
+# RMS amplitude of the signal in each band from the (..., bins, axes) one-sided DFT of a
+# `length` sample window, as sqrt(2 * sum(|X[k]|^2)) / length
+def band_amplitudes(
+    spectrum: np.ndarray, bands: list[np.ndarray], length: int
+) -> np.ndarray:
+    power = np.abs(spectrum) ** 2
+    return np.stack(
+        [np.sqrt(2 * power[..., bins, :].sum(axis=-2)) / length for bins in bands],
+        axis=-2,
+    )
+
+
+# Features that only need the values of the window, shared by the batched and the streaming path.
+# `sums` and `squares` are the (..., 8) sums of the 6 axes and 2 magnitudes and their squares.
+def window_features(
+    windows: np.ndarray,
+    magnitudes: np.ndarray,
+    sums: np.ndarray,
+    squares: np.ndarray,
+    bands: np.ndarray,
+) -> np.ndarray:
+    length = windows.shape[-2]
+    mean = sums / length
+    rms = np.sqrt(squares / length)
+    std = np.sqrt(np.maximum(squares / length - mean**2, 0))
+    # Sign changes around the window mean, a sample exactly on the mean counts as above it
+    above = windows >= mean[..., np.newaxis, :6]
+    crossings = (above[..., 1:, :] != above[..., :-1, :]).sum(axis=-2)
+    axis_features = np.concatenate(
+        (
+            np.stack(
+                (
+                    mean[..., :6],
+                    std[..., :6],
+                    windows.min(axis=-2),
+                    windows.max(axis=-2),
+                    rms[..., :6],
+                    crossings,
+                ),
+                axis=-2,
+            ),
+            bands,
+        ),
+        axis=-2,
+    )
+    magnitude_features = np.stack(
+        (
+            mean[..., 6:],
+            std[..., 6:],
+            magnitudes.min(axis=-2),
+            magnitudes.max(axis=-2),
+            rms[..., 6:],
+        ),
+        axis=-2,
+    )
+    # Axis by axis, then magnitude by magnitude, the order of FEATURE_NAMES
+    return np.concatenate(
+        (
+            np.swapaxes(axis_features, -1, -2).reshape(*windows.shape[:-2], -1),
+            np.swapaxes(magnitude_features, -1, -2).reshape(*windows.shape[:-2], -1),
+        ),
+        axis=-1,
+    )
+
+
+def vector_magnitudes(values: np.ndarray) -> np.ndarray:
+    return np.stack(
+        (
+            np.linalg.norm(values[..., :3], axis=-1),
+            np.linalg.norm(values[..., 3:], axis=-1),
+        ),
+        axis=-1,
+    )
+
+
+# (batch, len(FEATURE_NAMES)) features of (batch, length, 6) windows in one vectorized pass
+def extract_features(
+    windows: np.ndarray, interval: float = RESAMPLE_INTERVAL_MS
+) -> np.ndarray:
+    windows = np.asarray(windows, dtype=np.float64)
+    length = windows.shape[1]
+    magnitudes = vector_magnitudes(windows)
+    combined = np.concatenate((windows, magnitudes), axis=2)
+    bands = band_amplitudes(
+        np.fft.rfft(windows, axis=1), band_bins(length, interval), length
+    )
+    return window_features(
+        windows,
+        magnitudes,
+        combined.sum(axis=1),
+        (combined**2).sum(axis=1),
+        bands,
+    ).astype(np.float32)
+
+
+# Mean and standard deviation of every feature over a training set, a constant feature gets a
+# standard deviation of 1. The features span several orders of magnitude, a model trains on
+# (features - mean) / std.
+def feature_statistics(features: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    features = np.asarray(features, dtype=np.float64)
+    mean = features.mean(axis=0)
+    std = features.std(axis=0)
+    std[std == 0] = 1
+    return mean.astype(np.float32), std.astype(np.float32)
+
+
+# Kernel and bias of a first dense layer trained on standardized features, rewritten to take the
+# features as they are: ((x - mean) / std) @ kernel + bias == x @ (kernel / std) + bias'.
+# The exported model then needs no normalization step on the host or the MCU.
+def fold_standardization(
+    kernel: np.ndarray, bias: np.ndarray, mean: np.ndarray, std: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    kernel = kernel / std[:, np.newaxis]
+    return kernel, bias - mean @ kernel
+
+
+# Features of the latest `length` samples of a live stream.
+# Sums and the DFT are updated with every sample instead of recomputed over the window: a sample
+# entering and one leaving change every bin by X[k] = (X[k] - old + new) * exp(2j*pi*k / length).
+# Both are recomputed from the window every `length` samples so rounding errors cannot build up.
+# Minimum, maximum and mean crossings are taken from the window when the features are read.
+class streamFeatures:
+    def __init__(
+        self, length: int = SAMPLE_LENGTH, interval: float = RESAMPLE_INTERVAL_MS
+    ) -> None:
+        self.length = length
+        self.bands = band_bins(length, interval)
+        bins = np.arange(length // 2 + 1)
+        self.twiddle = np.exp(2j * np.pi * bins / length)
+        self.reset()
+
+    def reset(self) -> None:
+        self.window = np.zeros((self.length, 6), dtype=np.float64)
+        self.magnitudes = np.zeros((self.length, 2), dtype=np.float64)
+        self.count: int = 0  # Samples ever pushed, the oldest is at count % length
+        self.sums = np.zeros(8)
+        self.squares = np.zeros(8)
+        self.spectrum = np.zeros((self.length // 2 + 1, 6), dtype=np.complex128)
+        self.since_resync: int = 0
+
+    # `values` is (N, 6), samples on the same grid the model was trained on
+    def push(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64).reshape(-1, 6)
+        if len(values) >= self.length:
+            values = values[-self.length :]
+        count = len(values)
+        if not count:
+            return
+        indices = (self.count + np.arange(count)) % self.length
+        magnitudes = vector_magnitudes(values)
+        old = np.concatenate((self.window[indices], self.magnitudes[indices]), axis=1)
+        new = np.concatenate((values, magnitudes), axis=1)
+        self.window[indices] = values
+        self.magnitudes[indices] = magnitudes
+        self.count += count
+        self.since_resync += count
+
+        if self.since_resync >= self.length:
+            self.resync()
+            return
+        self.sums += (new - old).sum(axis=0)
+        self.squares += (new**2 - old**2).sum(axis=0)
+        # Sample i of the batch is rotated count - i times, (bins, N) @ (N, 6) for all of them
+        twiddle = self.twiddle[:, np.newaxis]
+        rotations = twiddle ** (count - np.arange(count))
+        self.spectrum = twiddle**count * self.spectrum + rotations @ (
+            new[:, :6] - old[:, :6]
+        )
+
+    def resync(self) -> None:
+        window, magnitudes = self.ordered()
+        combined = np.concatenate((window, magnitudes), axis=1)
+        self.sums = combined.sum(axis=0)
+        self.squares = (combined**2).sum(axis=0)
+        self.spectrum = np.fft.rfft(window, axis=0)
+        self.since_resync = 0
+
+    # The window and its magnitudes oldest sample first
+    def ordered(self) -> tuple[np.ndarray, np.ndarray]:
+        start = self.count % self.length
+        return (
+            np.roll(self.window, -start, axis=0),
+            np.roll(self.magnitudes, -start, axis=0),
+        )
+
+    # (len(FEATURE_NAMES),) features of the latest window, None until it is full
+    def features(self) -> Optional[np.ndarray]:
+        if self.count < self.length:
+            return None
+        window, magnitudes = self.ordered()
+        bands = band_amplitudes(self.spectrum, self.bands, self.length)
+        return window_features(
+            window, magnitudes, self.sums, self.squares, bands
+        ).astype(np.float32)
+
+
+def format_c_floats(values: np.ndarray) -> str:
+    return ", ".join(f"{value:.9g}f" for value in np.ravel(values))
+
+
+# C header with a few windows and the features expected for them, for checking a firmware port.
+# Band amplitudes use the plain DFT X[k] = sum(x[n] * exp(-2j*pi*k*n / length)).
+def write_reference_header(
+    windows: np.ndarray,
+    path: str = FEATURE_REFERENCE_PATH,
+    interval: float = RESAMPLE_INTERVAL_MS,
+) -> None:
+    import os
+
+    windows = np.asarray(windows, dtype=np.float32)
+    features = extract_features(windows, interval)
+    count, length, axes = windows.shape
+    names = ", ".join(f'"{name}"' for name in FEATURE_NAMES)
+    bands = ", ".join(f"{{{low:g}f, {high:g}f}}" for low, high in FEATURE_BANDS)
+    window_rows = ",\n".join(f"    {{{format_c_floats(window)}}}" for window in windows)
+    feature_rows = ",\n".join(f"    {{{format_c_floats(row)}}}" for row in features)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as file:
+        file.write(
+            "#pragma once\n\n"
+            f"const unsigned int feature_len = {len(FEATURE_NAMES)};\n\n"
+            f"const char *feature_names[{len(FEATURE_NAMES)}] = {{{names}}};\n\n"
+            f"const float feature_sample_interval_ms = {interval:.9g}f;\n\n"
+            f"const float feature_bands_hz[{len(FEATURE_BANDS)}][2] = {{{bands}}};\n\n"
+            f"const unsigned int feature_test_len = {count};\n\n"
+            f"const float feature_test_windows[{count}][{length * axes}] = {{\n"
+            f"{window_rows}\n}};\n\n"
+            f"const float feature_test_outputs[{count}][{len(FEATURE_NAMES)}] = {{\n"
+            f"{feature_rows}\n}};\n"
+        )
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    from sampleData import get_gestures, load_gesture_samples
+
+    windows = np.concatenate(
+        [
+            load_gesture_samples(gesture, resample_interval=RESAMPLE_INTERVAL_MS)[1]
+            for gesture in get_gestures()
+        ]
+    )
+    start_time = perf_counter()
+    features = extract_features(windows)
+    elapsed = perf_counter() - start_time
+    print(
+        f"{len(windows)} windows of {windows.shape[1]}x{windows.shape[2]} = "
+        f"{windows[0].size} inputs -> {features.shape[1]} features in {elapsed * 1e3:.1f} ms "
+        f"({elapsed / len(windows) * 1e6:.1f} us per window)"
+    )
+
+    # The windows back to back as one stream, fed in batches of 7 samples
+    stream = windows.reshape(-1, 6)
+    extractor = streamFeatures(windows.shape[1])
+    errors: list[float] = []
+    start_time = perf_counter()
+    for offset in range(0, len(stream), 7):
+        extractor.push(stream[offset : offset + 7])
+    elapsed = perf_counter() - start_time
+    print(
+        f"Streaming: {len(stream)} samples in {elapsed * 1e3:.1f} ms "
+        f"({elapsed / len(stream) * 1e6:.1f} us per sample)"
+    )
+    # Compared with the batched path on the latest window after every push, resyncs included
+    extractor.reset()
+    for offset in range(0, 20 * windows.shape[1], 7):
+        extractor.push(stream[offset : offset + 7])
+        latest = extractor.features()
+        end = min(offset + 7, len(stream))
+        if latest is not None:
+            expected = extract_features(
+                stream[np.newaxis, end - extractor.length : end]
+            )
+            errors.append(float(np.abs(latest - expected[0]).max()))
+    start_time = perf_counter()
+    for _ in range(1000):
+        extractor.features()
+    elapsed = (perf_counter() - start_time) / 1000
+    print(
+        f"Reading the features takes {elapsed * 1e6:.1f} us, "
+        f"max difference to the batched path {max(errors):.2e}"
+    )
+
+    write_reference_header(windows[:FEATURE_REFERENCE_WINDOWS])
+    print(f"Reference outputs written to {FEATURE_REFERENCE_PATH}")
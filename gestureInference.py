@@ -0,0 +1,352 @@
+import queue
+import re
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from featureExtraction import FEATURE_NAMES, streamFeatures
+from resampler import RESAMPLE_INTERVAL_MS, streamResampler
+
+MODEL_TFLITE_PATH = "./model/model.tflite"
+MODEL_HEADER_PATH = "./model/model.h"
+MODEL_WINDOW_LENGTH = 120
+MODEL_AXES = 6
+# Grid train.ipynb resamples the training windows to, stored with the exported model. Live samples
+# are only resampled for a model that has one.
+MODEL_SAMPLE_INTERVAL_MS = RESAMPLE_INTERVAL_MS
+MODEL_GESTURES_REGEX = r"gestures\[\d+\]\s*=\s*\{([^}]*)\}"
+MODEL_SAMPLE_INTERVAL_REGEX = r"model_sample_interval_ms\s*=\s*([0-9.eE+-]+)"
+MODEL_PENDING_SAMPLES = 10  # Single samples are resampled in batches of up to this many
+
+
+# Read the gesture names that were exported along with the model, in output order
+def load_gesture_labels(header_path: str = MODEL_HEADER_PATH) -> list[str]:
+    try:
+        with open(header_path, "r") as file:
+            for line in file:
+                match = re.search(MODEL_GESTURES_REGEX, line)
+                if match:
+                    return re.findall(r'"([^"]*)"', match.group(1))
+                if "model_data" in line:
+                    break
+    except OSError:
+        pass
+    return []
+
+
+# Grid in milliseconds the model's training windows were resampled to, None for a model trained on
+# raw rows. A .npz model stores it itself, for a .tflite model it is read from the exported header.
+def load_model_sample_interval(
+    model_path: str = MODEL_TFLITE_PATH, header_path: str = MODEL_HEADER_PATH
+) -> Optional[float]:
+    if model_path.endswith(".npz"):
+        try:
+            with np.load(model_path) as arrays:
+                if "sample_interval_ms" in arrays.files:
+                    return float(arrays["sample_interval_ms"]) or None
+        except OSError:
+            pass
+        return None
+    try:
+        with open(header_path, "r") as file:
+            for line in file:
+                match = re.search(MODEL_SAMPLE_INTERVAL_REGEX, line)
+                if match:
+                    return float(match.group(1)) or None
+                if "model_data" in line:
+                    break
+    except OSError:
+        pass
+    return None
+
+
+# Create a TFLite interpreter from whichever runtime is installed
+def load_tflite_interpreter(model_path: str = MODEL_TFLITE_PATH):
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        try:
+            from ai_edge_litert.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter  # type: ignore
+
+    interpreter = Interpreter(model_path=model_path)
+    interpreter.allocate_tensors()
+    return interpreter
+
+
+# Runs a (batch, 120, 6) window through a TFLite interpreter, returns (batch, classes)
+def run_tflite(interpreter, windows: np.ndarray) -> np.ndarray:
+    input_details = interpreter.get_input_details()[0]
+    output_details = interpreter.get_output_details()[0]
+
+    # Resize the input tensor if the batch size changed
+    if input_details["shape"][0] != windows.shape[0]:
+        interpreter.resize_tensor_input(input_details["index"], windows.shape)
+        interpreter.allocate_tensors()
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+
+    # Quantized models take integer inputs, values outside the calibrated range saturate instead
+    # of wrapping around
+    scale, zero_point = input_details["quantization"]
+    if scale:
+        limits = np.iinfo(input_details["dtype"])
+        windows = np.clip(
+            np.round(windows / scale + zero_point), limits.min, limits.max
+        )
+    interpreter.set_tensor(
+        input_details["index"], windows.astype(input_details["dtype"])
+    )
+    interpreter.invoke()
+
+    output = interpreter.get_tensor(output_details["index"]).astype(np.float32)
+    scale, zero_point = output_details["quantization"]
+    if scale:
+        output = (output - zero_point) * scale
+    return output
+
+
+# Returns a (batch, *input shape) -> (batch, classes) function, the name of the backend used and
+# the input shape, (120, 6) for raw windows or (len(FEATURE_NAMES),) for feature models.
+# Dense models are evaluated with NumPy, anything else falls back to the TFLite interpreter.
+def load_predictor(
+    model_path: str = MODEL_TFLITE_PATH,
+) -> tuple[Callable[[np.ndarray], np.ndarray], str, tuple[int, ...]]:
+    from numpyModel import load_model
+
+    try:
+        model = load_model(model_path)
+        return model.predict, "numpy", model.input_shape
+    except (ValueError, KeyError) as err:
+        if model_path.endswith(".npz"):
+            raise
+        print(f"NumPy engine unavailable for [{model_path}]: {err}")
+
+    interpreter = load_tflite_interpreter(model_path)
+    input_shape = tuple(int(d) for d in interpreter.get_input_details()[0]["shape"][1:])
+    return lambda windows: run_tflite(interpreter, windows), "tflite", input_shape
+
+
+class inferenceResult:
+    def __init__(
+        self, gesture: str, confidence: float, latency: float, timestamp: int | float
+    ) -> None:
+        self.gesture = gesture
+        self.confidence = confidence
+        self.latency = latency  # Seconds spent in the interpreter
+        self.timestamp = (
+            timestamp  # Device timestamp of the newest sample in the window
+        )
+
+
+class inferenceWorker:
+    def __init__(
+        self,
+        model_path: str = MODEL_TFLITE_PATH,
+        labels: Optional[list[str]] = None,
+        stride: int = 10,
+        window_length: int = MODEL_WINDOW_LENGTH,
+        result_callback: Optional[Callable[[inferenceResult], None]] = None,
+        log_callback: Optional[Callable[[str], None]] = None,
+        latency_history: int = 1000,
+        resample_interval: Optional[float] = None,
+    ) -> None:
+        self.model_path = model_path
+        self.labels: list[str] = labels if labels is not None else load_gesture_labels()
+        self.stride = stride
+        self.window_length = window_length
+        self.result_callback = result_callback
+        self.log_callback = log_callback
+        self.killed: bool = False
+        # Samples are put on the grid the training windows were resampled to, if they were, before
+        # they are windowed. Without `resample_interval` it is read from the model.
+        if resample_interval is None:
+            resample_interval = load_model_sample_interval(model_path)
+        self.resampler: Optional[streamResampler] = (
+            streamResampler(resample_interval) if resample_interval else None
+        )
+        self.sample_interval = resample_interval or RESAMPLE_INTERVAL_MS
+        # Single samples waiting to be resampled together
+        self.pending: list[tuple[int | float, Sequence[float]]] = []
+        # Set once a model taking features instead of the raw window is loaded, kept up to date
+        # with every sample
+        self.features: Optional[streamFeatures] = None
+
+        # Sliding window, every sample is written twice so the newest window is always contiguous
+        self.buffer = np.zeros((2 * window_length, MODEL_AXES), dtype=np.float32)
+        self.buffer_index: int = 0
+        self.samples_seen: int = 0
+        self.samples_since_inference: int = 0
+        self.last_timestamp: int | float = 0
+
+        # Only the newest window is kept, older pending windows are dropped
+        self.windows: queue.Queue[tuple[int | float, np.ndarray]] = queue.Queue(
+            maxsize=1
+        )
+        self.dropped_windows: int = 0
+
+        self.latencies: deque[float] = deque(maxlen=latency_history)
+        self.latest_result: Optional[inferenceResult] = None
+
+        self.inference_thread = threading.Thread(target=self.run, daemon=True)
+        self.inference_thread.start()
+
+    def log(self, message: str) -> None:
+        if self.log_callback:
+            self.log_callback(message)
+
+    def set_stride(self, stride: int) -> None:
+        self.stride = max(1, stride)
+
+    # Called from the serial reader thread, never blocks. Samples to be resampled are collected and
+    # resampled in one call every stride, at most MODEL_PENDING_SAMPLES
+    def push_sample(self, timestamp: int | float, values: Sequence[float]) -> None:
+        if self.resampler is None:
+            self.append_sample(timestamp, values)
+            return
+        self.pending.append((timestamp, values))
+        if len(self.pending) >= min(self.stride, MODEL_PENDING_SAMPLES):
+            pending, self.pending = self.pending, []
+            self.push_samples(
+                np.array([timestamp for timestamp, _ in pending]),
+                np.array([values for _, values in pending], dtype=np.float64),
+            )
+
+    # (N,) timestamps and (N, 6) values at once, resampled in one go
+    def push_samples(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        if self.resampler is not None:
+            timestamps, values = self.resampler.push(timestamps, values)
+        for timestamp, row in zip(timestamps, values):
+            self.append_sample(timestamp, row)
+
+    def append_sample(self, timestamp: int | float, values: Sequence[float]) -> None:
+        index = self.buffer_index
+        self.buffer[index] = values
+        self.buffer[index + self.window_length] = values
+        self.buffer_index = (index + 1) % self.window_length
+        self.samples_seen += 1
+        self.samples_since_inference += 1
+        self.last_timestamp = timestamp
+        features = self.features
+        if features is not None:
+            features.push(values)
+
+        if self.samples_seen < self.window_length:
+            return
+        if self.samples_since_inference < self.stride:
+            return
+        self.samples_since_inference = 0
+
+        if features is not None:
+            # None until the window is full again after the model was loaded
+            window = features.features()
+            if window is None:
+                return
+        else:
+            window = self.buffer[
+                self.buffer_index : self.buffer_index + self.window_length
+            ].copy()
+        try:
+            self.windows.put_nowait((timestamp, window))
+        except queue.Full:
+            # The interpreter is still busy, replace the pending window with the newer one
+            try:
+                self.windows.get_nowait()
+                self.dropped_windows += 1
+            except queue.Empty:
+                pass
+            try:
+                self.windows.put_nowait((timestamp, window))
+            except queue.Full:
+                self.dropped_windows += 1
+
+    def reset(self) -> None:
+        if self.resampler is not None:
+            self.resampler.reset()
+        self.pending = []
+        self.samples_seen = 0
+        self.samples_since_inference = 0
+        self.buffer_index = 0
+        if self.features is not None:
+            self.features.reset()
+
+    def run(self) -> None:
+        # The model is loaded here so importing a runtime does not block the caller
+        try:
+            predict, backend, input_shape = load_predictor(self.model_path)
+        except Exception as err:
+            self.log(f"Could not load model [{self.model_path}]: {err}")
+            return
+        if input_shape == (len(FEATURE_NAMES),):
+            self.features = streamFeatures(self.window_length, self.sample_interval)
+            backend += f", {len(FEATURE_NAMES)} features"
+        self.log(f"Host inference model [{self.model_path}] loaded ({backend})")
+
+        while not self.killed:
+            try:
+                timestamp, window = self.windows.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            try:
+                start_time = perf_counter()
+                output = predict(window[np.newaxis])[0]
+                latency = perf_counter() - start_time
+            except Exception as err:
+                self.log(f"Inference Exception: {err}")
+                continue
+
+            predicted = int(np.argmax(output))
+            gesture = (
+                self.labels[predicted]
+                if predicted < len(self.labels)
+                else f"class {predicted}"
+            )
+            result = inferenceResult(
+                gesture, float(output[predicted]), latency, timestamp
+            )
+            self.latencies.append(latency)
+            self.latest_result = result
+            if self.result_callback:
+                self.result_callback(result)
+        print("Inference thread exited")
+
+    # Latency percentiles in milliseconds
+    def latency_percentiles(
+        self, percentiles: Sequence[float] = (50, 95, 99)
+    ) -> list[float]:
+        latencies = list(self.latencies)
+        if not latencies:
+            return [0.0 for _ in percentiles]
+        return [float(p) * 1000 for p in np.percentile(latencies, percentiles)]
+
+    def close(self) -> None:
+        self.killed = True
+        self.inference_thread.join(timeout=1)
+        if self.inference_thread.is_alive():
+            print("inference_thread did not exit in time")
+
+
+if __name__ == "__main__":
+    from sampleData import get_gestures, load_gesture_samples
+    from time import sleep
+
+    # Stream a few saved samples through the worker as if they came from the device, on the grid
+    # of the model if it has one, so resampling them again leaves them as they are
+    worker = inferenceWorker(stride=MODEL_WINDOW_LENGTH, log_callback=print)
+    interval = load_model_sample_interval()
+    for gesture in get_gestures():
+        _, samples = load_gesture_samples(gesture, resample_interval=interval)
+        for sample in samples[:5]:
+            for index, row in enumerate(sample):
+                worker.push_sample(index * (interval or 1), row)
+            sleep(0.05)
+            result = worker.latest_result
+            if result:
+                print(f"{gesture}: {result.gesture} ({result.confidence:.2f})")
+    print(f"Latency p50/p95/p99: {worker.latency_percentiles()} ms")
+    worker.close()
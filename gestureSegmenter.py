@@ -0,0 +1,258 @@
+import queue
+import threading
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from sampleData import SAMPLE_LENGTH
+
+SEGMENT_PRE_SAMPLES = 30  # Kept before the onset, the rest of SAMPLE_LENGTH follows it
+SEGMENT_POST_SAMPLES = SAMPLE_LENGTH - SEGMENT_PRE_SAMPLES
+SEGMENT_WINDOW = 10  # Samples in the rolling standard deviation
+SEGMENT_ACCEL_STD = 0.15  # G, rolling deviation that counts as motion
+SEGMENT_GYRO_STD = 60.0  # DPS, rolling deviation that counts as motion
+SEGMENT_RELEASE = 0.5  # Fraction of the thresholds to fall under before the next onset
+SEGMENT_HISTORY_SAMPLES = 1000
+SEGMENT_PENDING_SAMPLES = 10  # Single samples are processed in batches of this many
+SEGMENT_SAVE_BACKLOG = 16  # Captures waiting to be saved, more are dropped
+
+
+# Finds gesture onsets in the live stream and hands over a window around each one.
+# A sample is moving when the rolling standard deviation of the acceleration or angular velocity
+# magnitude exceeds its threshold. After a capture the stream has to calm down again before the
+# next onset, so one gesture is only captured once. Every batch only computes the rolling
+# statistics of its own samples, from running sums over the last `window` magnitudes.
+class gestureSegmenter:
+    def __init__(
+        self,
+        segment_callback: Optional[Callable[[np.ndarray, np.ndarray], None]] = None,
+        log_callback: Optional[Callable[[str], None]] = None,
+        pre_samples: int = SEGMENT_PRE_SAMPLES,
+        post_samples: int = SEGMENT_POST_SAMPLES,
+        window: int = SEGMENT_WINDOW,
+        accel_std: float = SEGMENT_ACCEL_STD,
+        gyro_std: float = SEGMENT_GYRO_STD,
+        release: float = SEGMENT_RELEASE,
+        history_samples: int = SEGMENT_HISTORY_SAMPLES,
+    ) -> None:
+        # Called with the (length,) timestamps and (length, 6) values of every capture
+        self.segment_callback = segment_callback
+        self.log_callback = log_callback
+        self.pre_samples = pre_samples
+        self.post_samples = post_samples
+        self.window = window
+        self.thresholds = np.array([accel_std, gyro_std])
+        self.release = release
+        self.capacity = max(history_samples, 2 * (pre_samples + post_samples))
+        self.reset_requested: bool = False
+        self.reset()
+
+    # For other threads than the one pushing, the pushing thread resets before its next batch
+    def request_reset(self) -> None:
+        self.reset_requested = True
+
+    def reset(self) -> None:
+        self.reset_requested = False
+        # Time and 6 values per row, `count` is the number of rows ever pushed
+        self.history = np.zeros((self.capacity, 7), dtype=np.float64)
+        self.count: int = 0
+        # Magnitudes of the last `window - 1` samples, the rolling windows continue from them
+        self.carry = np.empty((0, 2), dtype=np.float64)
+        self.armed: bool = False
+        self.onset: Optional[int] = None
+        self.position: int = 0  # First sample not searched yet
+        self.captures: int = 0
+        self.pending: list[tuple[int, Sequence[float]]] = []
+
+    def log(self, message: str) -> None:
+        if self.log_callback:
+            self.log_callback(message)
+
+    # For readers that parse one line at a time
+    def push_sample(self, timestamp: int, values: Sequence[float]) -> None:
+        if self.reset_requested:
+            self.reset()
+        self.pending.append((timestamp, values))
+        if len(self.pending) >= SEGMENT_PENDING_SAMPLES:
+            pending, self.pending = self.pending, []
+            self.push(
+                np.array([timestamp for timestamp, _ in pending]),
+                np.array([values for _, values in pending], dtype=np.float64),
+            )
+
+    # `timestamps` is (N,) in device milliseconds, `values` (N, 6)
+    def push(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        if self.reset_requested:
+            self.reset()
+        length = len(timestamps)
+        if not length:
+            return
+        start = self.count
+        indices = (start + np.arange(length)) % self.capacity
+        self.history[indices, 0] = timestamps
+        self.history[indices, 1:] = values
+        self.count += length
+
+        # Motion score of every new sample, 1 is the threshold; samples before the first full
+        # window have none and are never an onset
+        magnitudes = np.column_stack(
+            (
+                np.linalg.norm(values[:, :3], axis=1),
+                np.linalg.norm(values[:, 3:], axis=1),
+            )
+        )
+        series = np.concatenate((self.carry, magnitudes))
+        self.carry = series[-(self.window - 1) :] if self.window > 1 else series[:0]
+        if len(series) < self.window:
+            return
+        sums = np.cumsum(np.vstack((np.zeros((1, 2)), series)), axis=0)
+        squares = np.cumsum(np.vstack((np.zeros((1, 2)), series**2)), axis=0)
+        mean = (sums[self.window :] - sums[: -self.window]) / self.window
+        variance = (squares[self.window :] - squares[: -self.window]) / self.window
+        std = np.sqrt(np.maximum(variance - mean**2, 0))
+        scores = (std / self.thresholds).max(axis=1)
+        self.scan(scores, self.count - len(scores))
+
+    # Walk the onset state machine over `scores`, the first of which belongs to sample `first`
+    def scan(self, scores: np.ndarray, first: int) -> None:
+        end = first + len(scores)
+        self.position = max(self.position, first)
+        while self.position < end or self.onset is not None:
+            if self.onset is not None:
+                if self.count < self.onset + self.post_samples:
+                    return
+                self.capture(self.onset)
+                # Samples inside the capture cannot arm the next one
+                self.position = max(self.position, self.onset + self.post_samples)
+                self.onset = None
+                continue
+
+            remaining = scores[self.position - first :]
+            if not self.armed:
+                quiet = np.flatnonzero(remaining < self.release)
+                if not quiet.size:
+                    self.position = end
+                    return
+                self.armed = True
+                self.position += int(quiet[0])
+                continue
+
+            moving = np.flatnonzero(remaining >= 1)
+            if not moving.size:
+                self.position = end
+                return
+            self.onset = self.position + int(moving[0])
+            self.armed = False
+            self.position = self.onset + 1
+
+    # Window of `pre_samples + post_samples` rows around sample `onset`
+    def capture(self, onset: int) -> None:
+        length = self.pre_samples + self.post_samples
+        start = max(onset - self.pre_samples, 0, self.count - self.capacity)
+        if self.count - start < length:
+            self.log("Not enough samples around the gesture, nothing captured")
+            return
+        rows = self.history[(start + np.arange(length)) % self.capacity]
+        self.captures += 1
+        self.log(
+            f"Gesture captured at {int(self.history[onset % self.capacity, 0])} ms"
+        )
+        if self.segment_callback:
+            self.segment_callback(rows[:, 0].astype(np.int64), rows[:, 1:])
+
+
+# Saves captures on a thread of its own, so the reader thread that found them never waits on the
+# disk or the sample catalog. `push` is the segment_callback of a gestureSegmenter.
+class segmentWriter:
+    def __init__(
+        self,
+        save: Callable[[np.ndarray, np.ndarray], None],
+        log_callback: Optional[Callable[[str], None]] = None,
+        backlog: int = SEGMENT_SAVE_BACKLOG,
+    ) -> None:
+        self.save = save
+        self.log_callback = log_callback
+        self.killed: bool = False
+        self.dropped: int = 0
+        self.segments: queue.Queue[tuple[np.ndarray, np.ndarray]] = queue.Queue(
+            maxsize=backlog
+        )
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def log(self, message: str) -> None:
+        if self.log_callback:
+            self.log_callback(message)
+
+    # Never blocks
+    def push(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        try:
+            self.segments.put_nowait((timestamps, values))
+        except queue.Full:
+            self.dropped += 1
+            self.log("Captures are not saved fast enough, one was dropped")
+
+    # Captures still queued when the writer is closed are saved before it exits
+    def run(self) -> None:
+        while True:
+            try:
+                timestamps, values = self.segments.get(timeout=0.1)
+            except queue.Empty:
+                if self.killed:
+                    break
+                continue
+            try:
+                self.save(timestamps, values)
+            except Exception as err:
+                self.log(f"Capture not saved: {err}")
+        print("Segment writer thread exited")
+
+    def close(self) -> None:
+        self.killed = True
+        self.thread.join(timeout=1)
+        if self.thread.is_alive():
+            print("segment_writer_thread did not exit in time")
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    from sampleData import get_gestures, load_gesture_samples
+
+    # Recorded gestures separated by stretches of idle samples stand in for a live session
+    rng = np.random.default_rng(0)
+    idle_files, idle = load_gesture_samples("idle")
+    pieces: list[np.ndarray] = []
+    onsets: list[int] = []
+    for gesture in get_gestures():
+        if gesture == "idle":
+            continue
+        _, samples = load_gesture_samples(gesture)
+        for sample in samples[:10]:
+            pieces.append(idle[rng.integers(len(idle))])
+            onsets.append(sum(len(piece) for piece in pieces))
+            pieces.append(sample)
+    values = np.concatenate(pieces)
+    timestamps = np.arange(len(values)) * 10
+
+    captured: list[np.ndarray] = []
+    segmenter = gestureSegmenter(
+        segment_callback=lambda timestamps, values: captured.append(timestamps),
+    )
+    start_time = perf_counter()
+    for offset in range(0, len(values), 7):
+        segmenter.push(timestamps[offset : offset + 7], values[offset : offset + 7])
+    elapsed = perf_counter() - start_time
+
+    # How far each detected onset is from the start of the recorded gesture it belongs to
+    detected = np.array([window[0] // 10 + SEGMENT_PRE_SAMPLES for window in captured])
+    delays = [
+        int(detected[detected >= onset].min() - onset)
+        for onset in onsets
+        if (detected >= onset).any()
+    ]
+    print(
+        f"{len(values)} samples in {elapsed * 1e3:.1f} ms, "
+        f"{len(captured)} captures for {len(onsets)} recorded gestures, "
+        f"onset {np.median(delays):.0f} samples into the recorded window"
+    )
@@ -0,0 +1,279 @@
+import argparse
+import csv
+import signal
+import sys
+import threading
+from collections import deque
+from datetime import datetime
+from time import perf_counter
+from typing import Optional, TextIO, List
+
+import numpy as np
+
+from gestureSegmenter import gestureSegmenter, segmentWriter
+from imuParser import parse_imu_line
+from replaySource import make_replay_port_name
+from sampleData import (
+    SAMPLE_HEADER,
+    SAMPLE_LENGTH,
+    SAVEDATA_FOLDER_PATH,
+    SAVEDATA_SESSION_FOLDER,
+    new_sample_filename,
+    save_sample,
+)
+from sampleCatalog import catalog_sample
+from sampleMonitor import sampleMonitor
+from serialHandler import SERIAL_DEFAULT_BAUDRATE, detect_baudrate, serialHandler
+
+# Kept free of tkinter, matplotlib and pandas so it starts fast on capture rigs without a screen
+
+HEADLESS_STATS_INTERVAL = 5.0  # Seconds between two stats lines
+HEADLESS_MODE_GESTURE = "gesture"
+HEADLESS_MODE_SESSION = "session"
+HEADLESS_MODE_AUTO = "auto"
+
+headlessRow = tuple[int, float, float, float, float, float, float]
+
+
+# Records IMU samples without any UI.
+# Gesture mode saves the newest `length` samples on each trigger, like "Save as .csv" in the GUI.
+# Session mode starts recording every sample on a trigger and stops on the next one.
+# Auto mode needs no trigger, gestureSegmenter saves a window around every gesture it detects.
+class headlessRecorder:
+    def __init__(
+        self,
+        gesture: str,
+        mode: str = HEADLESS_MODE_GESTURE,
+        length: int = SAMPLE_LENGTH,
+        folder_path: str = SAVEDATA_FOLDER_PATH,
+    ) -> None:
+        self.gesture = gesture
+        self.mode = mode
+        self.folder_path = folder_path
+        self.samples: deque[headlessRow] = deque(maxlen=length)
+        self.monitor = sampleMonitor(log_callback=self.log)
+        self.lock = threading.Lock()
+        self.session_file: Optional[TextIO] = None
+        self.session_writer = None
+        self.session_filename: Optional[str] = None
+        self.session_samples: int = 0
+        self.saved_files: int = 0
+        self.segment_writer: Optional[segmentWriter] = None
+        self.segmenter: Optional[gestureSegmenter] = None
+        if mode == HEADLESS_MODE_AUTO:
+            # Captures are saved off the serial reader thread
+            self.segment_writer = segmentWriter(
+                self.save_segment, log_callback=self.log
+            )
+            self.segmenter = gestureSegmenter(
+                segment_callback=self.segment_writer.push, log_callback=self.log
+            )
+
+    def log(self, message: str) -> None:
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", flush=True)
+
+    # Called from the serial reader thread
+    def lines_received(self, lines: List[str]) -> None:
+        rows: List[headlessRow] = []
+        for line in lines:
+            sample = parse_imu_line(line)
+            if sample is None:
+                continue
+            self.monitor.push(sample.timestamp)
+            rows.append((sample.timestamp, *sample.values()))
+        if not rows:
+            return
+        if self.segmenter:
+            array = np.array(rows, dtype=np.float64)
+            self.segmenter.push(array[:, 0], array[:, 1:])
+        with self.lock:
+            self.samples.extend(rows)
+            if self.session_writer is not None:
+                self.session_writer.writerows(rows)
+                self.session_samples += len(rows)
+
+    def trigger(self) -> None:
+        if self.mode == HEADLESS_MODE_SESSION:
+            if self.session_file is None:
+                self.start_session()
+            else:
+                self.stop_session()
+        else:
+            self.save_gesture()
+
+    def save_gesture(self) -> None:
+        with self.lock:
+            rows = list(self.samples)
+        if len(rows) < (self.samples.maxlen or 0):
+            self.log(f"Only {len(rows)} samples buffered, nothing saved")
+            return
+        filename = new_sample_filename(f"{self.folder_path}/{self.gesture}")
+        with open(filename, mode="w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(SAMPLE_HEADER)
+            writer.writerows(rows)
+        catalog_sample(filename, self.folder_path)
+        self.saved_files += 1
+        self.log(f"Data saved to {filename}, {len(rows)} samples")
+
+    # Called from the segment writer thread in auto mode
+    def save_segment(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        filename = save_sample(self.gesture, timestamps, values, self.folder_path)
+        self.saved_files += 1
+        self.log(f"Data saved to {filename}, {len(timestamps)} samples")
+
+    def start_session(self) -> None:
+        filename = new_sample_filename(
+            f"{self.folder_path}/{self.gesture}/{SAVEDATA_SESSION_FOLDER}"
+        )
+        file = open(filename, mode="w", newline="")
+        writer = csv.writer(file)
+        writer.writerow(SAMPLE_HEADER)
+        with self.lock:
+            self.session_file, self.session_writer = file, writer
+            self.session_filename = filename
+            self.session_samples = 0
+        self.log(f"Recording session to {filename}")
+
+    def stop_session(self) -> None:
+        with self.lock:
+            file, self.session_file, self.session_writer = (
+                self.session_file,
+                None,
+                None,
+            )
+        if file is None:
+            return
+        file.close()
+        self.saved_files += 1
+        self.log(
+            f"Session saved to {self.session_filename}, {self.session_samples} samples"
+        )
+
+    def stats_line(self, serial_handler: serialHandler) -> str:
+        stats = self.monitor.stats()
+        link = serial_handler.link_stats()
+        line = (
+            f"{stats['received_hz']:.1f} Hz, loss {stats['loss_ratio']:.1%}, "
+            f"gaps {stats['gaps']:.0f}, resets {stats['resets']:.0f}, "
+            f"link {link['bytes_per_second'] / 1000:.1f} kB/s "
+            f"({link['link_utilization']:.0%}), saved {self.saved_files}"
+        )
+        if self.session_file is not None:
+            line += f", recording {self.session_samples} samples"
+        return line
+
+    def close(self) -> None:
+        self.stop_session()
+        if self.segment_writer:
+            self.segment_writer.close()
+
+
+# Every line on stdin is a trigger, "q" or end of input quits when `quit_on_eof` is set
+def read_stdin_triggers(
+    triggered: threading.Event, stop: threading.Event, quit_on_eof: bool
+) -> None:
+    for line in sys.stdin:
+        if line.strip().lower() in ("q", "quit", "exit"):
+            stop.set()
+            return
+        triggered.set()
+    if quit_on_eof:
+        stop.set()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Record IMU samples without a UI. "
+        "Press Enter (or send SIGUSR1) to trigger, type q to quit."
+    )
+    parser.add_argument("port", nargs="?", help="serial port, e.g. /dev/ttyACM0")
+    parser.add_argument("--replay", help="replay a saved .csv, raw log or folder")
+    parser.add_argument(
+        "--baudrate",
+        default=str(SERIAL_DEFAULT_BAUDRATE),
+        help="baud rate, or 'auto' to detect it",
+    )
+    parser.add_argument("--gesture", default="idle", help="savedata folder to save to")
+    parser.add_argument(
+        "--mode",
+        choices=[HEADLESS_MODE_GESTURE, HEADLESS_MODE_SESSION, HEADLESS_MODE_AUTO],
+        default=HEADLESS_MODE_GESTURE,
+        help="gesture: save the newest samples on a trigger, "
+        "session: start/stop recording every sample on a trigger, "
+        "auto: save a window around every detected gesture",
+    )
+    parser.add_argument("--length", type=int, default=SAMPLE_LENGTH)
+    parser.add_argument("--stats-interval", type=float, default=HEADLESS_STATS_INTERVAL)
+    parser.add_argument("--duration", type=float, help="stop after this many seconds")
+    parser.add_argument(
+        "--no-stdin", action="store_true", help="only trigger on SIGUSR1"
+    )
+    args = parser.parse_args()
+
+    start_time = perf_counter()
+    if args.replay:
+        port = make_replay_port_name(args.replay)
+    elif args.port:
+        port = args.port
+    else:
+        parser.error("a port or --replay is required")
+
+    recorder = headlessRecorder(args.gesture, args.mode, args.length)
+    baudrate = SERIAL_DEFAULT_BAUDRATE
+    if args.baudrate == "auto" and not args.replay:
+        detected = detect_baudrate(port, log_callback=recorder.log)
+        if detected is None:
+            recorder.log(f"No IMU data found on [{port}] at any baud rate")
+            sys.exit(1)
+        baudrate = detected
+    elif args.baudrate != "auto":
+        baudrate = int(args.baudrate)
+
+    serial_handler = serialHandler(
+        log_callback=recorder.log,
+        lines_received_callback=recorder.lines_received,
+        monitor_ports=False,
+    )
+    triggered = threading.Event()
+    stop = threading.Event()
+    # Signal handlers only set events, the main loop does the file work
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda signum, frame: triggered.set())
+    signal.signal(signal.SIGINT, lambda signum, frame: stop.set())
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
+    try:
+        serial_handler.connect(port, baudrate)
+    except Exception as err:
+        recorder.log(f"Could not open [{port}]: {err}")
+        serial_handler.close()
+        sys.exit(1)
+    recorder.log(
+        f"Ready in {(perf_counter() - start_time) * 1000:.0f} ms, "
+        f"{args.mode} mode, saving to {SAVEDATA_FOLDER_PATH}/{args.gesture}"
+    )
+
+    if not args.no_stdin:
+        threading.Thread(
+            target=read_stdin_triggers,
+            args=(triggered, stop, sys.stdin.isatty()),
+            daemon=True,
+        ).start()
+
+    next_stats_time = perf_counter() + args.stats_interval
+    end_time = perf_counter() + args.duration if args.duration else None
+    while not stop.is_set() and serial_handler.is_connected():
+        if triggered.wait(timeout=0.1):
+            triggered.clear()
+            recorder.trigger()
+        now = perf_counter()
+        if now >= next_stats_time:
+            recorder.log(recorder.stats_line(serial_handler))
+            next_stats_time = now + args.stats_interval
+        if end_time is not None and now >= end_time:
+            break
+
+    serial_handler.close()
+    recorder.close()
+    recorder.log(recorder.stats_line(serial_handler))
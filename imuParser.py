@@ -0,0 +1,46 @@
+import re
+from typing import Optional, Sequence
+
+SERIAL_IMU_DATA_REGEX = r"\[IMU\] \[\s*(\d+) ms\], Acc: \[\s*([-.\d]+),\s*([-.\d]+),\s*([-.\d]+)\] G, Gyro: \[\s*([-.\d]+),\s*([-.\d]+),\s*([-.\d]+)\] DPS"
+SERIAL_IMU_DATA_PATTERN = re.compile(SERIAL_IMU_DATA_REGEX)
+SERIAL_IMU_PREFIX = "[IMU]"
+SERIAL_RESULT_PREFIX = "[Res]"
+
+
+class imuSample:
+    def __init__(
+        self,
+        timestamp: int,
+        accelerometer: tuple[float, float, float],
+        gyroscope: tuple[float, float, float],
+    ) -> None:
+        self.timestamp = timestamp  # Device time in milliseconds
+        self.accelerometer = accelerometer  # G
+        self.gyroscope = gyroscope  # DPS
+
+    def values(self) -> tuple[float, float, float, float, float, float]:
+        return self.accelerometer + self.gyroscope
+
+
+# Parse one `[IMU] [ N ms], Acc: [...] G, Gyro: [...] DPS` line, returns None for anything else
+def parse_imu_line(line: str) -> Optional[imuSample]:
+    match = SERIAL_IMU_DATA_PATTERN.search(line)
+    if not match:
+        return None
+
+    time, acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z = match.groups()
+    return imuSample(
+        int(time),
+        (float(acc_x), float(acc_y), float(acc_z)),
+        (float(gyro_x), float(gyro_y), float(gyro_z)),
+    )
+
+
+# Format a sample the same way the MCU prints it
+def format_imu_line(timestamp: int, values: Sequence[float]) -> str:
+    acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z = values
+    return (
+        f"[IMU] [{int(timestamp):6d} ms], "
+        f"Acc: [{acc_x:7.3f}, {acc_y:7.3f}, {acc_z:7.3f}] G, "
+        f"Gyro: [{gyro_x:8.2f}, {gyro_y:8.2f}, {gyro_z:8.2f}] DPS"
+    )
@@ -1,65 +1,122 @@
-import re
+import argparse
 import sys
 import threading
 import tkinter as tk
-from time import sleep
+from time import perf_counter, perf_counter_ns, sleep
 from tkinter import ttk
 import csv
 import os
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional
 
-import matplotlib
-import pandas as pd
+import numpy as np
 import serial
 import serial.tools.list_ports
 
-from serialHandler import serialHandler
+from serialHandler import (
+    REPLAY_PORT_PREFIX,
+    SERIAL_BAUDRATES,
+    SERIAL_DEFAULT_BAUDRATE,
+    detect_baudrate,
+    serialHandler,
+)
 from ansiEncoding import ANSI
+from clockSync import clockSync
+from devicePipeline import (
+    DEVICE_MULTI_FOLDER,
+    align_samples,
+    devicePipeline,
+    deviceSample,
+    device_name,
+)
+from imuParser import parse_imu_line
+from perfStats import perf_stats
+from sampleCatalog import catalog_sample, sampleCatalog
+from sampleMonitor import sampleMonitor
+from replaySource import make_replay_port_name
+from gestureInference import inferenceWorker, MODEL_TFLITE_PATH
+from gestureSegmenter import gestureSegmenter, segmentWriter
+from sampleData import (
+    SAMPLE_HEADER,
+    SAVEDATA_FOLDER_PATH,
+    get_gestures,
+    load_gesture_samples,
+    load_sample,
+    save_sample,
+)
 
 from tkAutocompleteCombobox import tkAutocompleteCombobox
+from tkDevicePanel import set_figure_data, tkDevicePanel
+from tkPerfPanel import tkPerfPanel
 from tkPlotGraph import tkPlotGraph
+from tkSortableTable import tkSortableTable
 from tkTerminal import tkTerminal
 
-matplotlib.use("Agg")
+# Only needed by the Data Viewer or extra devices, imported the first time they are used
+if TYPE_CHECKING:
+    from asyncSerial import asyncSerialHub
+    from tkOverlayGraph import tkOverlayGraph
 
-
-SAVEDATA_FOLDER_PATH = "./savedata"
 TERMINAL_MAX_WIDTH = 180
 GRAPH_MAX_SAMPLES = 120
 GRAPH_ACCEL_Y_LIMIT = 4
 GRAPH_GYRO_Y_LIMIT = 3000
-SERIAL_IMU_DATA_REGEX = r"\[IMU\] \[\s*(\d+) ms\], Acc: \[\s*([-.\d]+),\s*([-.\d]+),\s*([-.\d]+)\] G, Gyro: \[\s*([-.\d]+),\s*([-.\d]+),\s*([-.\d]+)\] DPS"
 THREAD_PLOTTER_DRAW_GRAPH_INTERVAL = 0.05
 THREAD_DATA_VIEWER_UPDATE_INTERVAL = 0.10
-
-
-# Return a list of gestures
-def get_gestures() -> list[str]:
-    if not os.path.exists(SAVEDATA_FOLDER_PATH) or not os.listdir(SAVEDATA_FOLDER_PATH):
-        return ["idle"]
-    else:
-        return [
-            name
-            for name in os.listdir(SAVEDATA_FOLDER_PATH)
-            if os.path.isdir(os.path.join(SAVEDATA_FOLDER_PATH, name))
-        ]
+THREAD_DATA_VIEWER_SCAN_INTERVAL = 10.0  # Picks up files changed outside the app
+OVERLAY_OUTLIER_SIGMA = 2.0
+INFERENCE_DEFAULT_STRIDE = 10
+INFERENCE_DISPLAY_UPDATE_INTERVAL_MS = 200
+LINK_DISPLAY_UPDATE_INTERVAL_MS = 1000
+BAUDRATE_AUTO = "auto"
 
 
 class SerialPlotterApp:
 
-    def __init__(self, root: tk.Misc) -> None:
+    def __init__(
+        self, root: tk.Misc, virtual_ports: Optional[List[str]] = None
+    ) -> None:
         self.root: tk.Misc = root
         self.killed: bool = False
         self.show_imu_data: bool = True
         self.show_model_result: bool = True
+        self.inference_worker: Optional[inferenceWorker] = None
+        self.inference_display_job: Optional[str] = None  # Pending root.after id
+        # Devices connected next to the main one, and the main one when read in its own process
+        self.device_panels: List[tkDevicePanel] = []
+        self.main_device: Optional[devicePipeline] = None
+        # Reads every extra device not in a process of its own on one event loop
+        self.serial_hub: Optional["asyncSerialHub"] = None
+        # A baud rate detection thread is listening on a port, for the main or an extra device
+        self.detecting: bool = False
 
         self.serial: serialHandler = serialHandler()
+        for port in virtual_ports or []:
+            self.serial.add_virtual_port(port)
+
+        # Watches the device timestamps for lost, duplicated and reset samples
+        self.sample_monitor: sampleMonitor = sampleMonitor(
+            log_callback=self.terminal_show_message
+        )
+        perf_stats.add_source("imu", self.sample_monitor.stats)
+
+        # Aligns the device clock with the host one to estimate transport and draw latency
+        self.clock_sync: clockSync = clockSync(log_callback=self.clock_sync_log)
+        perf_stats.add_source("clock", self.clock_sync.stats)
+
+        # Saves a window around every gesture it detects while auto capture is on
+        self.auto_capture: bool = False
+        self.segment_writer = segmentWriter(
+            self.auto_capture_segment, log_callback=self.terminal_show_message
+        )
+        self.segmenter: gestureSegmenter = gestureSegmenter(
+            segment_callback=self.segment_writer.push,
+            log_callback=self.terminal_show_message,
+        )
 
         self.setup_ui()
 
-        # Get a list of all available serial ports
-        #! TODO: update `ports` on device change
+        # Get a list of all available serial ports, kept up to date by serial_ports_changed
         ports = self.serial.get_ports()
         self.port_selection_combobox.set_completion_list(ports)
         self.serial_connect_toggle_button_update()
@@ -181,6 +238,123 @@ class SerialPlotterApp:
         self.gesture_selected_combobox.set_completion_list(get_gestures())
         self.gesture_selected_combobox.grid(row=4, column=0)
 
+        # Create host inference toggle, runs the model on the host next to the MCU result
+        self.inference_enabled_var = tk.BooleanVar(master=self.root, value=False)
+        self.inference_enabled_checkbox = tk.Checkbutton(
+            master=self.options_frame,
+            text="Host inference",
+            variable=self.inference_enabled_var,
+            command=self.inference_toggle,
+        )
+        self.inference_enabled_checkbox.grid(row=5, column=0)
+
+        # Create inference stride selection, in samples between two inferences
+        self.inference_stride_frame = tk.Frame(master=self.options_frame)
+        self.inference_stride_frame.grid(row=6, column=0)
+        self.inference_stride_label = tk.Label(
+            master=self.inference_stride_frame, text="Stride:"
+        )
+        self.inference_stride_label.grid(row=0, column=0)
+        self.inference_stride_var = tk.IntVar(
+            master=self.root, value=INFERENCE_DEFAULT_STRIDE
+        )
+        self.inference_stride_spinbox = tk.Spinbox(
+            master=self.inference_stride_frame,
+            from_=1,
+            to=GRAPH_MAX_SAMPLES,
+            width=5,
+            textvariable=self.inference_stride_var,
+            command=self.inference_stride_changed,
+        )
+        self.inference_stride_spinbox.bind(
+            "<Return>", lambda event: self.inference_stride_changed()
+        )
+        self.inference_stride_spinbox.grid(row=0, column=1)
+
+        # Create host inference result display
+        self.inference_result_label = tk.Label(
+            master=self.options_frame, text="Host: -", justify="left"
+        )
+        self.inference_result_label.grid(row=7, column=0)
+
+        # Create show/hide performance panel button
+        self.perf_panel_toggle_button = tk.Button(
+            master=self.options_frame,
+            text="Show performance",
+            command=self.perf_panel_toggle,
+        )
+        self.perf_panel_toggle_button.config(width=20)
+        self.perf_panel_toggle_button.grid(row=8, column=0)
+
+        # Create add device button, reads the selected port in its own pipeline and window
+        self.add_device_button = tk.Button(
+            master=self.options_frame,
+            text="Add device",
+            command=self.add_device,
+        )
+        self.add_device_button.config(width=20)
+        self.add_device_button.grid(row=9, column=0)
+
+        # Create process per device toggle, applies to devices added afterwards
+        self.device_process_var = tk.BooleanVar(master=self.root, value=False)
+        self.device_process_checkbox = tk.Checkbutton(
+            master=self.options_frame,
+            text="Process per device",
+            variable=self.device_process_var,
+        )
+        self.device_process_checkbox.grid(row=10, column=0)
+
+        # Create separate ingest process toggle, the main device is then read and parsed in a
+        # child process and drawn from shared memory, so drawing cannot slow ingestion down
+        self.ingest_process_var = tk.BooleanVar(master=self.root, value=False)
+        self.ingest_process_checkbox = tk.Checkbutton(
+            master=self.options_frame,
+            text="Ingest in separate process",
+            variable=self.ingest_process_var,
+        )
+        self.ingest_process_checkbox.grid(row=11, column=0)
+
+        # Create baud rate selection, "auto" tries every rate until [IMU] lines come through
+        self.baudrate_frame = tk.Frame(master=self.options_frame)
+        self.baudrate_frame.grid(row=12, column=0)
+        self.baudrate_label = tk.Label(master=self.baudrate_frame, text="Baud:")
+        self.baudrate_label.grid(row=0, column=0)
+        self.baudrate_combobox = ttk.Combobox(
+            master=self.baudrate_frame,
+            values=[BAUDRATE_AUTO] + [str(rate) for rate in SERIAL_BAUDRATES],
+            width=9,
+        )
+        self.baudrate_combobox.set(str(SERIAL_DEFAULT_BAUDRATE))
+        self.baudrate_combobox.grid(row=0, column=1)
+        self.low_latency_var = tk.BooleanVar(master=self.root, value=False)
+        self.low_latency_checkbox = tk.Checkbutton(
+            master=self.baudrate_frame,
+            text="Low latency",
+            variable=self.low_latency_var,
+        )
+        self.low_latency_checkbox.grid(row=1, column=0, columnspan=2)
+
+        # Create effective link rate display, shows whether the link or the host is the limit
+        self.link_label = tk.Label(master=self.options_frame, text="Link: -")
+        self.link_label.grid(row=13, column=0)
+
+        # Create auto capture toggle, saves every detected gesture without pressing "Save as .csv"
+        self.auto_capture_var = tk.BooleanVar(master=self.root, value=False)
+        self.auto_capture_checkbox = tk.Checkbutton(
+            master=self.options_frame,
+            text="Auto capture",
+            variable=self.auto_capture_var,
+            command=self.auto_capture_toggle,
+        )
+        self.auto_capture_checkbox.grid(row=14, column=0)
+
+        # Create the performance panel, hidden until toggled
+        # The clock samples behind the drift and latency percentiles are saved with the stats
+        self.perf_panel = tkPerfPanel(
+            master=self.root,
+            csv_exports={"clock": lambda path: self.main_clock().export_csv(path)},
+        )
+
         # Configure the grid to expand
         self.root.grid_rowconfigure(1, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
@@ -191,6 +365,15 @@ class SerialPlotterApp:
         # Flag the process as dead and close serial port
         self.killed = True
         self.serial.close()
+        if self.main_device:
+            self.main_device.close()
+        for panel in list(self.device_panels):
+            panel.device.close()
+        if self.serial_hub:
+            self.serial_hub.close()
+        if self.inference_worker:
+            self.inference_worker.close()
+        self.segment_writer.close()
 
         self.draw_graphs_thread.join(timeout=1)
         if self.draw_graphs_thread.is_alive():
@@ -200,40 +383,205 @@ class SerialPlotterApp:
         print("[W] Close terminal to exit the program.")
 
     def serial_line_received(self, line: str) -> None:
-        self.update_graphs(line)
+        self.update_graphs(line, perf_counter())
         self.update_terminal(line)
 
     def serial_log(self, message: str) -> None:
         self.terminal_show_message(message)
 
-    def serial_ports_changed(self, ports: List[str]) -> None:
+    # The periodic latency summary is only logged while instrumentation is on
+    def clock_sync_log(self, message: str) -> None:
+        if perf_stats.enabled:
+            self.terminal_show_message(message)
+
+    def serial_ports_changed(self, added: List[str], removed: List[str]) -> None:
+        ports = [
+            port
+            for port in self.port_selection_combobox.get_completion_list()
+            if port not in removed
+        ]
         self.port_selection_combobox.set_completion_list(
-            list(set(self.port_selection_combobox.get_completion_list() + ports))
+            ports + [port for port in added if port not in ports]
         )
         self.serial_connect_toggle_button_update()
-        self.terminal_show_message(f"Ports changed: {ports}")
+        if added:
+            self.terminal_show_message(f"Ports added: {added}")
+        if removed:
+            self.terminal_show_message(f"Ports removed: {removed}")
 
     def serial_connect_toggle_button_update(self) -> None:
-        display_text = "Disconnect" if self.serial.is_connected() else "Connect"
+        if self.detecting:
+            # Clicks are ignored until the detection is done
+            display_text = "Detecting..."
+        elif self.is_main_connected():
+            display_text = "Disconnect"
+        elif self.main_device:
+            # The ingest process is still opening the port, a click cancels it
+            display_text = "Connecting..."
+        else:
+            display_text = "Connect"
         self.serial_connect_toggle_button.configure(text=display_text)
 
+    def is_main_connected(self) -> bool:
+        if self.main_device is not None:
+            return self.main_device.is_connected()
+        return self.serial.is_connected()
+
+    # Port of the main device, None when disconnected
+    def main_port(self) -> Optional[str]:
+        if self.main_device:
+            return self.main_device.port if self.main_device.is_connected() else None
+        if self.serial.is_connected() and self.serial.serial_port:
+            return self.serial.serial_port.name
+        return None
+
+    # Clock alignment of the main device, which belongs to its pipeline in separate process mode
+    def main_clock(self) -> clockSync:
+        return self.main_device.clock if self.main_device else self.clock_sync
+
     def serial_connect_toggle(self) -> None:
-        # If already connected, disconnect
-        if self.serial.is_connected():
-            self.serial.disconnect()
+        # The detection connects by itself once it is done
+        if self.detecting:
+            return
+
+        # If already connected or still connecting, disconnect
+        if self.main_device or self.serial.is_connected():
+            if self.main_device:
+                self.main_device_close()
+            else:
+                self.serial.disconnect()
             self.serial_connect_toggle_button_update()
             return
 
         # Otherwise, try to connect
         self.reset_graphs()
+        port = self.port_selection_combobox.get()
+        baudrate = self.selected_baudrate()
+        if baudrate is None and not port.startswith(REPLAY_PORT_PREFIX):
+            self.detect_baudrate_then(port, self.main_detected)
+            return
+        self.main_connect(port, baudrate or SERIAL_DEFAULT_BAUDRATE)
+
+    def main_detected(self, port: str, baudrate: int) -> None:
+        self.baudrate_combobox.set(str(baudrate))
+        self.main_connect(port, baudrate)
+
+    def main_connect(self, port: str, baudrate: int) -> None:
+        if self.ingest_process_var.get():
+            self.main_device = devicePipeline(
+                port,
+                baudrate=baudrate,
+                use_process=True,
+                sample_callback=self.main_device_samples_received,
+                lines_callback=self.main_device_lines_received,
+                log_callback=self.terminal_show_message,
+                connection_callback=self.main_device_connection_changed,
+            )
+            # The monitor and clock of the app only see samples parsed in this process
+            perf_stats.add_source("imu", self.main_device.monitor.stats)
+            perf_stats.add_source("clock", self.main_device.clock.stats)
+            self.main_device.connect()
+            self.serial_connect_toggle_button_update()
+            return
+        self.serial_connect(port, baudrate)
+
+    def main_device_close(self) -> None:
+        if self.main_device:
+            self.main_device.close()
+            self.main_device = None
+        perf_stats.add_source("imu", self.sample_monitor.stats)
+        perf_stats.add_source("clock", self.clock_sync.stats)
+
+    # Called from the drain thread of the main device
+    def main_device_connection_changed(
+        self, device: devicePipeline, connected: bool
+    ) -> None:
+        self.root.after(
+            0, lambda: self.main_device_connection_update(device, connected)
+        )
+
+    def main_device_connection_update(
+        self, device: devicePipeline, connected: bool
+    ) -> None:
+        # Ignore a pipeline that was already replaced
+        if device is not self.main_device:
+            return
+        if not connected:
+            self.terminal_show_message(f"[{device.name}] Disconnected")
+            self.main_device_close()
+        self.serial_connect_toggle_button_update()
+
+    def serial_connect(self, port: str, baudrate: int) -> None:
         try:
-            self.serial.connect(self.port_selection_combobox.get())
+            self.serial.connect(
+                port, baudrate=baudrate, low_latency=self.low_latency_var.get()
+            )
             self.serial_connect_toggle_button_update()
+            self.root.after(LINK_DISPLAY_UPDATE_INTERVAL_MS, self.link_display_update)
 
         except serial.SerialException as e:
+            self.serial_connect_toggle_button_update()
+            self.terminal_show_message(f"Could not open port [{port}]: {e}")
+
+    # Detection listens for a while at every rate, so it runs in a thread to keep the window
+    # responsive. `connect(port, baudrate)` is called on the Tk thread with the rate it found.
+    def detect_baudrate_then(
+        self, port: str, connect: Callable[[str, int], None]
+    ) -> None:
+        self.detecting = True
+        self.serial_connect_toggle_button_update()
+        threading.Thread(
+            target=self.serial_detect_and_connect, args=(port, connect), daemon=True
+        ).start()
+
+    def serial_detect_and_connect(
+        self, port: str, connect: Callable[[str, int], None]
+    ) -> None:
+        try:
+            baudrate = detect_baudrate(port, log_callback=self.terminal_show_message)
+        except serial.SerialException as e:
+            self.root.after(0, self.serial_detect_done)
+            self.terminal_show_message(f"Could not open port [{port}]: {e}")
+            return
+        if baudrate is None:
+            self.root.after(0, self.serial_detect_done)
+            self.terminal_show_message(f"No [IMU] lines on [{port}] at any baud rate")
+            return
+        self.terminal_show_message(f"Detected {baudrate} baud on [{port}]")
+        self.root.after(
+            0, lambda: self.serial_detect_done(lambda: connect(port, baudrate))
+        )
+
+    def serial_detect_done(self, connect: Optional[Callable[[], None]] = None) -> None:
+        self.detecting = False
+        if connect:
+            connect()
+        self.serial_connect_toggle_button_update()
+
+    # None when the baud rate is to be detected
+    def selected_baudrate(self) -> Optional[int]:
+        selection = self.baudrate_combobox.get().strip()
+        if selection == BAUDRATE_AUTO:
+            return None
+        try:
+            return int(selection)
+        except ValueError:
             self.terminal_show_message(
-                f"Could not open port [{self.port_selection_combobox.get()}]: {e}"
+                f"Invalid baud rate [{selection}], using {SERIAL_DEFAULT_BAUDRATE}"
             )
+            return SERIAL_DEFAULT_BAUDRATE
+
+    def link_display_update(self) -> None:
+        if self.killed or not self.serial.is_connected():
+            self.link_label.configure(text="Link: -")
+            return
+
+        stats = self.serial.link_stats()
+        self.link_label.configure(
+            text=f"Link: {stats['bytes_per_second'] / 1000:.1f} kB/s, "
+            f"{stats['link_utilization']:.0%} of {stats['baudrate']:.0f} baud"
+        )
+        self.root.after(LINK_DISPLAY_UPDATE_INTERVAL_MS, self.link_display_update)
 
     def save_csv(self) -> None:
         # Create directory if it doesn't exist
@@ -266,8 +614,165 @@ class SerialPlotterApp:
                         self.gyroscope_figure.data_series["z-axis"][i],
                     ]
                 )
+        catalog_sample(filename)
         self.terminal_show_message(f"Data saved to {filename}, {total_samples} samples")
 
+        if self.device_panels:
+            self.save_multi_device_csv()
+
+    # Save every device on the time base of the first one, in "{gesture}/multi/[datetime].csv".
+    # Format: Time, <device>_aX, ..., <device>_gZ for each device, Time is the first device's ms.
+    def save_multi_device_csv(self) -> None:
+        names: List[str] = []
+        series: List[tuple[np.ndarray, np.ndarray]] = []
+        reference_timestamps: Optional[np.ndarray] = None
+
+        clock = self.main_clock()
+        if clock.offset is not None and self.accelerometer_figure.timestamp:
+            timestamps = np.array(self.accelerometer_figure.timestamp, dtype=np.int64)
+            columns = [
+                np.array(figure.data_series[axis], dtype=np.float64)
+                for figure in (self.accelerometer_figure, self.gyroscope_figure)
+                for axis in ("x-axis", "y-axis", "z-axis")
+            ]
+            # The reader thread may have appended to some series already, keep the newest rows
+            length = min(len(column) for column in columns + [timestamps])
+            timestamps = timestamps[-length:]
+            values = np.column_stack([column[-length:] for column in columns])
+            names.append(device_name(self.main_port() or "main"))
+            series.append(
+                (clock.offset + (1 + clock.drift) * timestamps / 1000, values)
+            )
+            reference_timestamps = timestamps
+
+        for panel in self.device_panels:
+            host_times, timestamps, values = panel.device.aligned_samples()
+            if not host_times.size:
+                continue
+            if reference_timestamps is None:
+                # Without the main device the first extra one sets the time base and window
+                timestamps = timestamps[-GRAPH_MAX_SAMPLES:]
+                host_times, values = (
+                    host_times[-GRAPH_MAX_SAMPLES:],
+                    values[-GRAPH_MAX_SAMPLES:],
+                )
+                reference_timestamps = timestamps
+            names.append(panel.device.name)
+            series.append((host_times, values))
+
+        if reference_timestamps is None or len(series) < 2:
+            self.terminal_show_message(
+                "Need samples from two devices to save them aligned"
+            )
+            return
+
+        rows, aligned = align_samples(series)
+        folder = f"{SAVEDATA_FOLDER_PATH}/{self.gesture_selected_combobox.get()}/{DEVICE_MULTI_FOLDER}"
+        os.makedirs(folder, exist_ok=True)
+        filename = f"{folder}/{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        with open(filename, mode="w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(
+                ["Time"]
+                + [f"{name}_{column}" for name in names for column in SAMPLE_HEADER[1:]]
+            )
+            for timestamp, row in zip(reference_timestamps[rows], aligned):
+                writer.writerow([int(timestamp)] + row.tolist())
+        self.terminal_show_message(
+            f"Data of {len(names)} devices saved to {filename}, {len(rows)} aligned samples"
+        )
+
+    def add_device(self) -> None:
+        port = self.port_selection_combobox.get()
+        if not port:
+            return
+        if self.detecting:
+            self.terminal_show_message(
+                "Still detecting a baud rate, try again after it"
+            )
+            return
+        if port == self.main_port() or any(
+            panel.device.port == port for panel in self.device_panels
+        ):
+            self.terminal_show_message(f"Port [{port}] is already connected")
+            return
+
+        baudrate = self.selected_baudrate()
+        if baudrate is None and not port.startswith(REPLAY_PORT_PREFIX):
+            self.detect_baudrate_then(port, self.add_device_connect)
+            return
+        self.add_device_connect(port, baudrate or SERIAL_DEFAULT_BAUDRATE)
+
+    def add_device_connect(self, port: str, baudrate: int) -> None:
+        use_process = self.device_process_var.get()
+        if not use_process and self.serial_hub is None:
+            from asyncSerial import asyncSerialHub
+
+            self.serial_hub = asyncSerialHub(log_callback=self.terminal_show_message)
+        device = devicePipeline(
+            port,
+            baudrate=baudrate,
+            use_process=use_process,
+            hub=self.serial_hub if not use_process else None,
+            lines_callback=self.device_lines_received,
+            log_callback=self.terminal_show_message,
+        )
+        try:
+            device.connect()
+        except serial.SerialException as e:
+            device.close()
+            self.terminal_show_message(f"Could not add device [{port}]: {e}")
+            return
+        self.device_panels.append(
+            tkDevicePanel(self.root, device, closed_callback=self.device_panel_closed)
+        )
+
+    def device_panel_closed(self, panel: tkDevicePanel) -> None:
+        if panel in self.device_panels:
+            self.device_panels.remove(panel)
+
+    # Lines of the extra devices, one terminal write per batch
+    def device_lines_received(self, name: str, lines: List[str]) -> None:
+        self.terminal_write_lines(lines, prefix=f"[{name}] ")
+
+    def main_device_lines_received(self, name: str, lines: List[str]) -> None:
+        self.terminal_write_lines(lines)
+
+    # The graphs of the main device are drawn from its ring, only host inference and auto capture
+    # need every sample
+    def main_device_samples_received(self, samples: List[deviceSample]) -> None:
+        if not samples or not (self.inference_worker or self.auto_capture):
+            return
+        timestamps = np.array([timestamp for _, timestamp, _ in samples])
+        values = np.array([values for _, _, values in samples], dtype=np.float64)
+        if self.inference_worker:
+            self.inference_worker.push_samples(timestamps, values)
+        if self.auto_capture:
+            self.segmenter.push(timestamps, values)
+
+    def auto_capture_toggle(self) -> None:
+        # The reader thread may be inside push, it resets before its next batch
+        self.segmenter.request_reset()
+        self.auto_capture = self.auto_capture_var.get()
+
+    # Called from the segment writer thread with the window around a detected gesture
+    def auto_capture_segment(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        filename = save_sample(self.gesture_selected_combobox.get(), timestamps, values)
+        self.terminal_show_message(
+            f"Data saved to {filename}, {len(timestamps)} samples (auto capture)"
+        )
+
+    # Write a batch of lines in one go, with the same filters as update_terminal
+    def terminal_write_lines(self, lines: List[str], prefix: str = "") -> None:
+        shown = [
+            prefix + line
+            for line in lines
+            if (self.show_imu_data or not line.startswith("[IMU]"))
+            and (self.show_model_result or not line.startswith("[Res]"))
+        ]
+        if shown:
+            self.terminal.write("\n".join(shown) + "\n")
+
     def imu_data_toggle(self) -> None:
         self.show_imu_data = not self.show_imu_data
         display_text = "Hide IMU data" if self.show_imu_data else "Show IMU data"
@@ -280,6 +785,16 @@ class SerialPlotterApp:
         )
         self.model_result_toggle_button.configure(text=display_text)
 
+    def perf_panel_toggle(self) -> None:
+        if self.perf_panel.visible:
+            self.perf_panel.grid_remove()
+        else:
+            self.perf_panel.grid(row=3, column=0, columnspan=3, sticky="nsew")
+        display_text = (
+            "Hide performance" if self.perf_panel.visible else "Show performance"
+        )
+        self.perf_panel_toggle_button.configure(text=display_text)
+
     def update_terminal(self, reading: str) -> None:
         is_imu_data: bool = reading.startswith("[IMU]")
         if is_imu_data and not self.show_imu_data:
@@ -289,44 +804,133 @@ class SerialPlotterApp:
         if is_model_result and not self.show_model_result:
             return
 
+        start_time = perf_counter_ns()
         self.terminal.write(reading + "\n")
-
-    def update_graphs(self, reading: str) -> None:
-        match = re.search(
-            SERIAL_IMU_DATA_REGEX,
-            reading,
-        )
-        if match:
-            time, acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z = match.groups()
-
+        if perf_stats.enabled:
+            perf_stats.record_since("terminal_write", start_time)
+
+    def update_graphs(self, reading: str, received_time: float) -> None:
+        start_time = perf_counter_ns()
+        sample = parse_imu_line(reading)
+        if perf_stats.enabled:
+            perf_stats.record_since("parse", start_time)
+        if sample:
+            self.sample_monitor.push(sample.timestamp)
+            self.clock_sync.push(sample.timestamp, received_time)
+            if perf_stats.enabled:
+                perf_stats.count("samples")
+            acc_x, acc_y, acc_z = sample.accelerometer
             accelerometer_data = {
-                "x-axis": float(acc_x),
-                "y-axis": float(acc_y),
-                "z-axis": float(acc_z),
+                "x-axis": acc_x,
+                "y-axis": acc_y,
+                "z-axis": acc_z,
             }
-            self.accelerometer_figure.append_dict(int(time), accelerometer_data)
+            self.accelerometer_figure.append_dict(sample.timestamp, accelerometer_data)
 
+            gyro_x, gyro_y, gyro_z = sample.gyroscope
             gyroscope_data = {
-                "x-axis": float(gyro_x),
-                "y-axis": float(gyro_y),
-                "z-axis": float(gyro_z),
+                "x-axis": gyro_x,
+                "y-axis": gyro_y,
+                "z-axis": gyro_z,
             }
-            self.gyroscope_figure.append_dict(int(time), gyroscope_data)
+            self.gyroscope_figure.append_dict(sample.timestamp, gyroscope_data)
+
+            if self.inference_worker:
+                self.inference_worker.push_sample(sample.timestamp, sample.values())
+            if self.auto_capture:
+                self.segmenter.push_sample(sample.timestamp, sample.values())
 
     def reset_graphs(self) -> None:
         self.accelerometer_figure.clear()
         self.gyroscope_figure.clear()
+        self.sample_monitor.reset()
+        self.clock_sync.reset()
+        self.segmenter.request_reset()
+        if self.inference_worker:
+            self.inference_worker.reset()
+
+    def inference_toggle(self) -> None:
+        if self.inference_enabled_var.get():
+            self.inference_worker = inferenceWorker(
+                model_path=MODEL_TFLITE_PATH,
+                stride=self.inference_stride_var.get(),
+                log_callback=self.terminal_show_message,
+            )
+            self.inference_display_job = self.root.after(
+                INFERENCE_DISPLAY_UPDATE_INTERVAL_MS, self.inference_display_update
+            )
+            return
+
+        # A display update still pending would keep a second loop going after the next enable
+        if self.inference_display_job:
+            self.root.after_cancel(self.inference_display_job)
+            self.inference_display_job = None
+        if self.inference_worker:
+            self.inference_worker.close()
+            self.inference_worker = None
+        self.inference_result_label.configure(text="Host: -")
+
+    def inference_stride_changed(self) -> None:
+        try:
+            stride = self.inference_stride_var.get()
+        except tk.TclError:
+            return
+        if self.inference_worker:
+            self.inference_worker.set_stride(stride)
+
+    # Runs on the Tk thread, only reads the latest result published by the inference thread
+    def inference_display_update(self) -> None:
+        self.inference_display_job = None
+        if self.killed or not self.inference_worker:
+            return
+
+        result = self.inference_worker.latest_result
+        if result:
+            p50, p95, p99 = self.inference_worker.latency_percentiles()
+            self.inference_result_label.configure(
+                text=f"Host: {result.gesture} ({result.confidence:.2f})\n"
+                f"p50 {p50:.2f} ms, p95 {p95:.2f} ms, p99 {p99:.2f} ms"
+            )
+        self.inference_display_job = self.root.after(
+            INFERENCE_DISPLAY_UPDATE_INTERVAL_MS, self.inference_display_update
+        )
 
     def draw_graphs(self) -> None:
+        last_frame_time = perf_counter()
         while not self.killed:
             sleep(THREAD_PLOTTER_DRAW_GRAPH_INTERVAL)
 
+            # A frame is late if drawing the previous one took longer than the interval
+            if perf_stats.enabled:
+                now = perf_counter()
+                if now - last_frame_time > 2 * THREAD_PLOTTER_DRAW_GRAPH_INTERVAL:
+                    perf_stats.count("dropped_frames")
+                last_frame_time = now
+
             # Update graph
             try:
+                start_time = perf_counter_ns()
+                if self.main_device:
+                    set_figure_data(
+                        self.accelerometer_figure,
+                        self.gyroscope_figure,
+                        *self.main_device.latest(GRAPH_MAX_SAMPLES),
+                    )
+                timestamps = self.gyroscope_figure.timestamp
+                newest_timestamp = timestamps[-1] if timestamps else None
                 self.accelerometer_figure.draw()
                 self.gyroscope_figure.draw()
+                if newest_timestamp is not None:
+                    self.main_clock().mark_drawn(int(newest_timestamp), perf_counter())
+                for panel in list(self.device_panels):
+                    panel.draw()
+                if perf_stats.enabled:
+                    perf_stats.record_since("draw", start_time)
+                    perf_stats.count("frames")
 
             except RuntimeError:
+                if perf_stats.enabled:
+                    perf_stats.count("dropped_frames")
                 self.terminal_show_message(str(sys.exc_info()))
                 pass
 
@@ -348,6 +952,12 @@ class GestureData:
     accelerometer_figure: tkPlotGraph
     gyroscope_figure: tkPlotGraph
     selected_file: Optional[str] = None
+    overlay_var: tk.BooleanVar
+    overlay_checkbox: tk.Checkbutton
+    outliers_label: tk.Label
+    accelerometer_overlay: Optional["tkOverlayGraph"] = None
+    gyroscope_overlay: Optional["tkOverlayGraph"] = None
+    overlay_files: Optional[list[str]] = None
 
 
 class DataViewerApp:
@@ -357,20 +967,28 @@ class DataViewerApp:
         self.killed: bool = False
         self.gestures: dict[str, GestureData] = {}
         self.ROW_OFFSET: int = 4
+        # Sample lists and counts come from the catalog instead of listing every folder
+        self.catalog = sampleCatalog()
 
         self.setup_ui()
-        self.populate_tables()
 
+        # The tables are filled by the update thread, so the tab shows up before every file is read
         self.update_thread = threading.Thread(target=self.update)
         self.update_thread.start()
 
     def update(self) -> None:
+        self.catalog.scan()
+        self.populate_tables()
+        last_scan = perf_counter()
         while not self.killed:
             sleep(THREAD_DATA_VIEWER_UPDATE_INTERVAL)
+            if perf_counter() - last_scan > THREAD_DATA_VIEWER_SCAN_INTERVAL:
+                self.catalog.scan()
+                last_scan = perf_counter()
             self.update_contents()
 
             # If new gesture is added, re-populate tables
-            if len(self.gestures) != len(get_gestures()):
+            if len(self.gestures) != len(self.catalog.gestures()):
                 self.populate_tables()
 
     def update_contents(self) -> None:
@@ -382,6 +1000,23 @@ class DataViewerApp:
             self.update_content(gesture)
 
     def setup_ui(self) -> None:
+        # Create a toolbar above the gesture tables
+        self.toolbar_frame = tk.Frame(self.root)
+        self.toolbar_frame.grid(row=0, column=0, columnspan=2, sticky="nsew")
+
+        # Create score button, runs the model over every sample to find mislabeled ones
+        self.score_button = tk.Button(
+            master=self.toolbar_frame,
+            text="Score all samples",
+            command=self.score_samples,
+        )
+        self.score_button.config(width=20)
+        self.score_button.grid(row=0, column=0)
+        self.score_label = tk.Label(master=self.toolbar_frame)
+        self.score_label.grid(row=0, column=1)
+        self.score_window: Optional[tk.Toplevel] = None
+        self.score_table: Optional[tkSortableTable] = None
+
         # Create a canvas and a scrollbar
         self.canvas = tk.Canvas(self.root)
         self.scrollbar = tk.Scrollbar(
@@ -389,15 +1024,15 @@ class DataViewerApp:
         )
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
-        self.scrollbar.grid(row=0, column=1, sticky="ns")
-        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+        self.canvas.grid(row=1, column=0, sticky="nsew")
 
         # Create a frame inside the canvas
         self.frame = tk.Frame(self.canvas)
         self.canvas.create_window((0, 0), window=self.frame, anchor="nw")
 
         # Configure the grid to expand
-        self.root.grid_rowconfigure(0, weight=1)
+        self.root.grid_rowconfigure(1, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
 
         # Update the scroll region
@@ -409,6 +1044,7 @@ class DataViewerApp:
         self.update_thread.join(timeout=1)
         if self.update_thread.is_alive():
             print("update_thread did not exit in time")
+        self.catalog.close()
 
     def populate_tables(self) -> None:
         # Cleanup whatever is left off
@@ -417,10 +1053,14 @@ class DataViewerApp:
                 self.gestures[gesture].accelerometer_figure.close()
             if self.gestures[gesture].gyroscope_figure:
                 self.gestures[gesture].gyroscope_figure.close()
+            if self.gestures[gesture].accelerometer_overlay:
+                self.gestures[gesture].accelerometer_overlay.close()
+            if self.gestures[gesture].gyroscope_overlay:
+                self.gestures[gesture].gyroscope_overlay.close()
         self.gestures.clear()
 
         # Make new
-        gestures = get_gestures()
+        gestures = self.catalog.gestures()
         for gesture in gestures:
             self.gestures[gesture] = GestureData()
             self.populate_table(gesture)
@@ -483,6 +1123,28 @@ class DataViewerApp:
             row=index * self.ROW_OFFSET + 2, column=1, sticky="nsew"
         )
 
+        # Toggle between the selected sample and all samples overlaid
+        self.gestures[gesture].overlay_var = tk.BooleanVar(
+            master=self.frame, value=False
+        )
+        self.gestures[gesture].overlay_checkbox = tk.Checkbutton(
+            self.frame,
+            text="Overlay all samples",
+            variable=self.gestures[gesture].overlay_var,
+            command=lambda: self.overlay_toggle(gesture),
+        )
+        self.gestures[gesture].overlay_checkbox.grid(
+            row=index * self.ROW_OFFSET + 3, column=0, sticky="nsew"
+        )
+
+        # Files that are furthest from the mean in overlay mode
+        self.gestures[gesture].outliers_label = tk.Label(
+            self.frame, wraplength=200, justify="left"
+        )
+        self.gestures[gesture].outliers_label.grid(
+            row=index * self.ROW_OFFSET + 3, column=1, sticky="nsew"
+        )
+
         # Draw graphs with the default selected sample
         selected_gesture_sample = self.gestures[gesture].selected_combobox.get()
         self.load_graph_data(gesture, selected_gesture_sample)
@@ -493,6 +1155,11 @@ class DataViewerApp:
             text=f"{len(self.gestures[gesture].selected_combobox.get_completion_list())} item"
         )
 
+        # Draw every sample of the gesture instead of the selected one
+        if self.gestures[gesture].overlay_var.get():
+            self.update_overlay(gesture)
+            return
+
         # Get the selected file
         selected_gesture_sample = self.gestures[gesture].selected_combobox.get()
 
@@ -512,53 +1179,164 @@ class DataViewerApp:
         if not file_name:
             return
 
-        # load data to DataFrame
-        df = pd.read_csv(f"{SAVEDATA_FOLDER_PATH}/{gesture}/{file_name}")
+        # Load the Time, aX, aY, aZ, gX, gY, gZ columns and replace what the figures show
+        data = load_sample(f"{SAVEDATA_FOLDER_PATH}/{gesture}/{file_name}")
+        if not data.size:
+            data = np.empty((0, len(SAMPLE_HEADER)))
+        set_figure_data(
+            self.gestures[gesture].accelerometer_figure,
+            self.gestures[gesture].gyroscope_figure,
+            data[:, 0].astype(np.int64),
+            data[:, 1:],
+        )
+
+        self.gestures[gesture].accelerometer_figure.draw()
+        self.gestures[gesture].gyroscope_figure.draw()
 
-        # Clear figure for reuse
-        self.gestures[gesture].accelerometer_figure.clear()
-        self.gestures[gesture].gyroscope_figure.clear()
+        # Show the number of samples for this graph, and why it is left out of training
+        entry = self.catalog.entry(gesture, file_name)
+        problem = (
+            f", invalid: {entry['problem']}" if entry and not entry["valid"] else ""
+        )
+        self.gestures[gesture].selected_samples_label.configure(
+            text=f"{len(data)} samples{problem}"
+        )
 
-        # Load data to plot
-        for _, row in df.iterrows():
-            accelerometer_data = {
-                "x-axis": float(row["aX"]),
-                "y-axis": float(row["aY"]),
-                "z-axis": float(row["aZ"]),
-            }
-            self.gestures[gesture].accelerometer_figure.append_dict(
-                row["Time"], accelerometer_data
+    def overlay_toggle(self, gesture: str) -> None:
+        gesture_data = self.gestures[gesture]
+        index = list(self.gestures.keys()).index(gesture)
+
+        if not gesture_data.overlay_var.get():
+            if gesture_data.accelerometer_overlay:
+                gesture_data.accelerometer_overlay.grid_remove()
+            if gesture_data.gyroscope_overlay:
+                gesture_data.gyroscope_overlay.grid_remove()
+            gesture_data.accelerometer_figure.grid(
+                row=index * self.ROW_OFFSET, column=2, rowspan=self.ROW_OFFSET
             )
+            gesture_data.gyroscope_figure.grid(
+                row=index * self.ROW_OFFSET, column=3, rowspan=self.ROW_OFFSET
+            )
+            gesture_data.outliers_label.configure(text="")
+            return
 
-            gyroscope_data = {
-                "x-axis": float(row["gX"]),
-                "y-axis": float(row["gY"]),
-                "z-axis": float(row["gZ"]),
-            }
-            self.gestures[gesture].gyroscope_figure.append_dict(
-                row["Time"], gyroscope_data
+        # Overlay figures are only created the first time they are needed
+        from tkOverlayGraph import tkOverlayGraph
+
+        if gesture_data.accelerometer_overlay is None:
+            gesture_data.accelerometer_overlay = tkOverlayGraph(
+                master=self.frame, title="Acceleration (G)"
+            )
+            gesture_data.accelerometer_overlay.set_ylim(
+                -GRAPH_ACCEL_Y_LIMIT, GRAPH_ACCEL_Y_LIMIT
+            )
+        if gesture_data.gyroscope_overlay is None:
+            gesture_data.gyroscope_overlay = tkOverlayGraph(
+                master=self.frame, title="Angular Velocity (DPS)"
+            )
+            gesture_data.gyroscope_overlay.set_ylim(
+                -GRAPH_GYRO_Y_LIMIT, GRAPH_GYRO_Y_LIMIT
             )
 
-        self.gestures[gesture].accelerometer_figure.draw()
-        self.gestures[gesture].gyroscope_figure.draw()
+        gesture_data.accelerometer_figure.grid_remove()
+        gesture_data.gyroscope_figure.grid_remove()
+        gesture_data.accelerometer_overlay.grid(
+            row=index * self.ROW_OFFSET, column=2, rowspan=self.ROW_OFFSET
+        )
+        gesture_data.gyroscope_overlay.grid(
+            row=index * self.ROW_OFFSET, column=3, rowspan=self.ROW_OFFSET
+        )
 
-        # Show the number of samples for this graph
-        self.gestures[gesture].selected_samples_label.configure(
-            text=f"{len(df)} samples"
+        # Force a reload on the next update
+        gesture_data.overlay_files = None
+
+    def update_overlay(self, gesture: str) -> None:
+        gesture_data = self.gestures[gesture]
+        if not gesture_data.accelerometer_overlay or not gesture_data.gyroscope_overlay:
+            return
+
+        # Skip if no sample was added or removed since the last draw
+        files = sorted(gesture_data.selected_combobox.get_completion_list())
+        if gesture_data.overlay_files == files:
+            return
+        gesture_data.overlay_files = files
+
+        # Stack all samples as (N, 120, 6) and find the ones furthest from the mean
+        from tkOverlayGraph import find_outliers, overlay_statistics
+
+        sample_files, samples = load_gesture_samples(
+            gesture, file_names=self.catalog.files(gesture, valid_only=True)
         )
+        _, _, distance = overlay_statistics(samples)
+        outliers = find_outliers(distance, OVERLAY_OUTLIER_SIGMA)
+        outliers = outliers[np.argsort(distance[outliers])[::-1]]
 
-    # Returns a list of files names that is inside the [gesture] folder
-    @staticmethod
-    def get_gesture_files(gesture: str) -> list[str]:
-        folder_path = f"{SAVEDATA_FOLDER_PATH}/{gesture}"
-        if not os.path.exists(folder_path) or not os.listdir(folder_path):
-            return []
-        else:
-            return [
-                name
-                for name in os.listdir(folder_path)
-                if os.path.isfile(os.path.join(folder_path, name))
-            ]
+        gesture_data.accelerometer_overlay.set_samples(samples[:, :, 0:3], outliers)
+        gesture_data.gyroscope_overlay.set_samples(samples[:, :, 3:6], outliers)
+        gesture_data.accelerometer_overlay.draw()
+        gesture_data.gyroscope_overlay.draw()
+
+        gesture_data.outliers_label.configure(
+            text=f"Outliers: {', '.join(sample_files[i] for i in outliers) or 'none'}"
+        )
+
+    def score_samples(self) -> None:
+        self.score_button.configure(state="disabled")
+        self.score_label.configure(text="Scoring...")
+        threading.Thread(target=self.score_samples_thread, daemon=True).start()
+
+    def score_samples_thread(self) -> None:
+        from batchScore import score_savedata, write_report
+
+        try:
+            scores, _ = score_savedata(MODEL_TFLITE_PATH)
+            write_report(scores)
+        except Exception as err:
+            message = f"Scoring failed: {err}"
+            self.root.after(0, lambda: self.score_samples_done([], message))
+            return
+
+        accuracy = sum(score.correct for score in scores) / max(1, len(scores))
+        message = f"{len(scores)} samples, accuracy {accuracy:.2%}"
+        rows = [score.as_row() for score in scores]
+        self.root.after(0, lambda: self.score_samples_done(rows, message))
+
+    # Runs on the Tk thread, shows the scores in a sortable table
+    def score_samples_done(self, rows: list[list[str]], message: str) -> None:
+        self.score_button.configure(state="normal")
+        self.score_label.configure(text=message)
+        if not rows:
+            return
+
+        if self.score_window is None or not self.score_window.winfo_exists():
+            from batchScore import SCORE_REPORT_HEADER
+
+            self.score_window = tk.Toplevel(self.root)
+            self.score_window.title("Sample scores")
+            self.score_table = tkSortableTable(
+                self.score_window,
+                columns=SCORE_REPORT_HEADER,
+                row_activated_callback=self.score_row_activated,
+            )
+            self.score_table.pack(expand=1, fill="both")
+
+        if self.score_table:
+            self.score_table.set_rows(rows)
+            # Samples the model disagrees with the most go first
+            self.score_table.sort("gesture_confidence", descending=False)
+        self.score_window.deiconify()
+
+    # Show the double clicked sample in its gesture table
+    def score_row_activated(self, row: list[str]) -> None:
+        gesture, file_name = row[0], row[1]
+        if gesture in self.gestures:
+            self.gestures[gesture].overlay_var.set(False)
+            self.overlay_toggle(gesture)
+            self.gestures[gesture].selected_combobox.select_item(file_name)
+
+    # Returns a list of files names that is inside the [gesture] folder, as of the last scan or save
+    def get_gesture_files(self, gesture: str) -> list[str]:
+        return self.catalog.files(gesture)
 
     def on_frame_configure(self, event=None):
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
@@ -567,13 +1345,35 @@ class DataViewerApp:
 def on_closing():
     print("Exiting")
     serial_app.close()
-    viewer_app.close()
+    if viewer_app:
+        viewer_app.close()
     root.quit()  # This will exit the main loop
     root.destroy()
 
 
 if __name__ == "__main__":
 
+    parser = argparse.ArgumentParser(description="IMU Plotter")
+    parser.add_argument(
+        "--replay",
+        nargs="+",
+        default=[],
+        help="offer saved .csv samples, raw logs or folders as a replay port",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="1 = real time, 0 = as fast as possible",
+    )
+    parser.add_argument("--replay-loop", action="store_true")
+    args = parser.parse_args()
+
+    replay_ports = [
+        make_replay_port_name(path, args.replay_speed, args.replay_loop)
+        for path in args.replay
+    ]
+
     root = tk.Tk()
     root.title("IMU Plotter")
     root.geometry("1280x720")
@@ -586,7 +1386,15 @@ if __name__ == "__main__":
     tabControl.add(tab2, text="Data Viewer")
     tabControl.pack(expand=1, fill="both")
 
-    serial_app = SerialPlotterApp(tab1)
-    viewer_app = DataViewerApp(tab2)
+    serial_app = SerialPlotterApp(tab1, virtual_ports=replay_ports)
+    viewer_app: Optional[DataViewerApp] = None
+
+    # The Data Viewer reads and draws every gesture, it is only built when its tab is first shown
+    def tab_changed(event: tk.Event) -> None:
+        global viewer_app
+        if viewer_app is None and tabControl.select() == str(tab2):
+            viewer_app = DataViewerApp(tab2)
+
+    tabControl.bind("<<NotebookTabChanged>>", tab_changed)
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
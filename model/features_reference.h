@@ -0,0 +1,25 @@
+#pragma once
+
+const unsigned int feature_len = 70;
+
+const char *feature_names[70] = {"aX_mean", "aX_std", "aX_min", "aX_max", "aX_rms", "aX_crossings", "aX_band_1_3hz", "aX_band_3_6hz", "aX_band_6_12hz", "aX_band_12_30hz", "aY_mean", "aY_std", "aY_min", "aY_max", "aY_rms", "aY_crossings", "aY_band_1_3hz", "aY_band_3_6hz", "aY_band_6_12hz", "aY_band_12_30hz", "aZ_mean", "aZ_std", "aZ_min", "aZ_max", "aZ_rms", "aZ_crossings", "aZ_band_1_3hz", "aZ_band_3_6hz", "aZ_band_6_12hz", "aZ_band_12_30hz", "gX_mean", "gX_std", "gX_min", "gX_max", "gX_rms", "gX_crossings", "gX_band_1_3hz", "gX_band_3_6hz", "gX_band_6_12hz", "gX_band_12_30hz", "gY_mean", "gY_std", "gY_min", "gY_max", "gY_rms", "gY_crossings", "gY_band_1_3hz", "gY_band_3_6hz", "gY_band_6_12hz", "gY_band_12_30hz", "gZ_mean", "gZ_std", "gZ_min", "gZ_max", "gZ_rms", "gZ_crossings", "gZ_band_1_3hz", "gZ_band_3_6hz", "gZ_band_6_12hz", "gZ_band_12_30hz", "accel_magnitude_mean", "accel_magnitude_std", "accel_magnitude_min", "accel_magnitude_max", "accel_magnitude_rms", "gyro_magnitude_mean", "gyro_magnitude_std", "gyro_magnitude_min", "gyro_magnitude_max", "gyro_magnitude_rms"};
+
+const float feature_sample_interval_ms = 8.33333333f;
+
+const float feature_bands_hz[4][2] = {{1f, 3f}, {3f, 6f}, {6f, 12f}, {12f, 30f}};
+
+const unsigned int feature_test_len = 4;
+
+const float feature_test_windows[4][720] = {
+    {-0.86500001f, -0.144999996f, -0.444999993f, -0.699999988f, 1.04999995f, -3.22000003f, -0.865925908f, -0.166296303f, -0.46907407f, -0.894444466f, 1.69814813f, -3.93296289f, -0.864296317f, -0.173111111f, -0.471851856f, -0.0751851872f, 0.557407379f, -2.91666675f, -0.862999976f, -0.165999994f, -0.462000012f, 1.39999998f, -0.769999981f, -1.04999995f, -0.863925934f, -0.154888883f, -0.462000012f, 1.20555556f, -0.251481473f, -0.790740728f, -0.864958346f, -0.152083337f, -0.470625013f, 1.05583334f, 0.930416644f, -1.17250001f, -0.869000018f, -0.160999998f, -0.476999998f, 1.19000006f, 1.04999995f, -1.39999998f, -0.865296304f, -0.150814816f, -0.473296285f, 0.606666684f, 0.466666669f, -0.168518513f, -0.861166656f, -0.128916666f, -0.464374989f, 1.36500001f, -0.720416665f, 0.667916656f, -0.861000001f, -0.127111107f, -0.448000014f, 1.08888888f, -1.08111107f, -0.668888867f, -0.859166682f, -0.141666666f, -0.451499999f, -0.297500014f, 0.0350000001f, -2.89333344f, -0.863791645f, -0.16504167f, -0.46254167f, -0.82249999f, 0.140000001f, -4.22041655f, -0.867555559f, -0.185555562f, -0.463888884f, -1.08888888f, -0.357777774f, -3.77222228f, -0.867999971f, -0.184333339f, -0.464916676f, -1.3125f, -0.548333347f, -1.7208333f, -0.863208354f, -0.169624999f, -0.46116668f, -1.06166661f, -0.895416677f, 0.27125001f, -0.862999976f, -0.163666666f, -0.453888893f, -1.11222219f, -0.785555542f, 0.785555542f, -0.862999976f, -0.162083328f, -0.453916669f, -2.14666677f, 0.192499995f, 1.09666669f, -0.865555584f, -0.167111114f, -0.463370383f, -4.38666677f, 1.23407412f, 1.65666664f, -0.864444435f, -0.171111107f, -0.468111098f, -7.7544446f, 1.99888885f, 2.78444433f, -0.857666671f, -0.156619042f, -0.462666661f, -8.92666626f, 1.91666663f, 4.72666645f, -0.856999993f, -0.127740741f, -0.451777786f, -6.45555544f, 1.88999999f, 5.61555576f, -0.853500009f, -0.0976250023f, -0.446500003f, -3.01874995f, 2.625f, 4.45375013f, -0.850555539f, -0.102962963f, -0.419925928f, 0.432962954f, 3.58555555f, 1.30407405f, -0.858333349f, -0.105833337f, -0.445666671f, 2.92833328f, 6.05499983f, -1.64499998f, -0.853874981f, -0.139249995f, -0.439749986f, 0.104999997f, 6.81624985f, -4.30499983f, -0.868481457f, -0.165185183f, -0.464074075f, -0.806296289f, 7.60148144f, -4.33481503f, -0.872833312f, -0.19083333f, -0.497500002f, -13.9183331f, 9.5783329f, -2.86999989f, -0.879999995f, -0.227375001f, -0.526624978f, -24.6049995f, 9.08250046f, 0.0437499993f, -0.883444428f, -0.253185183f, -0.553629637f, -42.9851837f, 7.99037027f, 5.26814795f, -0.879833341f, -0.238833338f, -0.574000001f, -72.7416687f, 5.67000008f, 12.8450003f, -0.871999979f, -0.203111112f, -0.580111086f, -113.734444f, 2.63666677f, 18.9311104f, -0.884249985f, -0.197166666f, -0.561999977f, -171.683746f, 0.892499983f, 22.239584f, -0.917999983f, -0.187166661f, -0.585333347f, -254.065002f, 5.70499992f, 23.2166672f, -0.883555532f, -0.185000002f, -0.605000019f, -386.228882f, 17.1188889f, 19.4444447f, -0.833296299f, -0.208222225f, -0.57099998f, -565.856689f, 31.0748158f, 15.877037f, -0.824285686f, -0.0957619026f, -0.763047636f, -872.409973f, 60.123333f, 10.3633337f, -0.758333325f, -0.126111105f, -0.545222223f, -1376.42554f, 100.986664f, -3.26666665f, -0.890208304f, -0.00287500001f, -0.564791679f, -1728.99707f, 139.393326f, -11.2933331f, -0.912222207f, -0.560074091f, -0.721851826f, -1977.47925f, 163.452591f, 21.2437038f, -0.731999993f, -0.108000003f, -0.906000018f, -2197.22998f, 133.612503f, 101.8675f, -0.658958316f, -0.00358333322f, 0.275875002f, -2284.08838f, 70.5804138f, 99.6508331f, -0.838703692f, -0.370296299f, 2.01085186f, -2203.77637f, 62.7200012f, 60.2077789f, -0.944249988f, 0.0332500003f, 2.14199996f, -1499.43506f, 111.247498f, 63.4199982f, -0.805999994f, 0.708037019f, 0.869037032f, -828.880371f, 155.980743f, 63.0492592f, -0.743416667f, 0.777333319f, -0.00416666688f, -673.467102f, 161.090424f, 26.2208328f, -0.792750001f, 0.461750001f, -0.129500002f, -711.094971f, 113.032501f, -11.9174995f, -0.844888866f, 0.121962965f, 0.140962958f, -653.812988f, 50.9081497f, -28.0077782f, -0.880541682f, -0.0969166681f, 0.388833344f, -514.28125f, 3.80916667f, -24.2404175f, -0.896499991f, -0.13775f, 0.627499998f, -414.820007f, -15.7150002f, -5.63500023f, -0.898999989f, -0.115592591f, 0.74359262f, -371.425171f, -9.81037045f, 11.8948145f, -0.875703692f, -0.0396296307f, 0.645481467f, -322.956665f, 6.40111113f, 20.0329628f, -0.840333343f, -0.0299999993f, 0.479000002f, -293.167786f, 19.8566666f, 18.3477783f, -0.839095235f, -0.0527619049f, 0.297761917f, -260.853333f, 18.9899998f, 16.1299992f, -0.843333304f, -0.034291666f, 0.291083336f, -227.514587f, -1.48749995f, 17.7391663f, -0.829666674f, 0.00300000003f, 0.456999987f, -219.029999f, -17.0100002f, 19.3433342f, -0.819333315f, 0.0920000002f, 0.593999982f, -208.156662f, -19.1333332f, 17.7333336f, -0.821407378f, 0.11388889f, 0.662888885f, -201.17482f, -10.9640741f, 8.19777775f, -0.842750013f, 0.0112500004f, 0.632749975f, -196.516251f, 1.69749999f, -5.35500002f, -0.860000014f, -0.141000003f, 0.539333344f, -189.396667f, 10.0566664f, -11.5266666f, -0.859851837f, -0.188999996f, 0.476518512f, -165.347778f, 7.19444466f, -6.17814827f, -0.846125007f, -0.162125006f, 0.479250014f, -130.794998f, -2.40625f, 1.38250005f, -0.83433336f, -0.126666665f, 0.509333313f, -103.529999f, -8.53999996f, 5.01666689f, -0.832000017f, -0.119518518f, 0.511074066f, -92.4051819f, -7.9333334f, 4.67444468f, -0.82950002f, -0.126000002f, 0.488249987f, -81.5762482f, -6.38749981f, 2.64249992f, -0.828000009f, -0.130777776f, 0.466925919f, -63.4018517f, -8.13555527f, 0.629999995f, -0.826250017f, -0.133166671f, 0.481583327f, -43.8549995f, -12.6525002f, -0.834166646f, -0.823333323f, -0.120111108f, 0.52144444f, -31.0799999f, -15.6566668f, -1.01888883f, -0.823444426f, -0.100814812f, 0.550629616f, -26.6440735f, -14.9281483f, -1.37666667f, -0.825523794f, -0.0956666693f, 0.551047623f, -23.8966675f, -11.8633337f, -3.97333336f, -0.833500028f, -0.127749994f, 0.531374991f, -15.0237503f, -10.4737501f, -8.18999958f, -0.840370357f, -0.174629629f, 0.516703725f, -3.71777773f, -11.3296299f, -10.1577778f, -0.842583358f, -0.196166664f, 0.508083344f, 4.26999998f, -12.7983332f, -8.7033329f, -0.842999995f, -0.188111112f, 0.517111123f, 6.71999979f, -14.2955551f, -5.74777794f, -0.837583363f, -0.167999998f, 0.52654165f, 10.3366671f, -15.4729166f, -4.37208319f, -0.830083311f, -0.157583326f, 0.531083345f, 15.7325001f, -16.1350002f, -5.19750023f, -0.825777769f, -0.154111117f, 0.537888885f, 17.8422222f, -15.7655554f, -5.80999994f, -0.81858331f, -0.142333329f, 0.54641664f, 17.6429157f, -14.6475f, -5.80999994f, -0.815037012f, -0.128777772f, 0.548407435f, 20.5566673f, -13.1988888f, -5.62851858f, -0.81400001f, -0.123999998f, 0.549000025f, 24.3950005f, -11.7950001f, -5.67000008f, -0.813624978f, -0.125541672f, 0.567708313f, 21.1049995f, -10.2520838f, -5.53875017f, -0.818111122f, -0.129629627f, 0.587222219f, 12.0140743f, -6.90925932f, -4.92333317f, -0.82099998f, -0.142499998f, 0.572000027f, 5.73999977f, -2.41499996f, -5.00500011f, -0.822925925f, -0.166444451f, 0.535111129f, 4.35296297f, -0.280000001f, -5.25518513f, -0.825814843f, -0.186481476f, 0.522481501f, 3.47666669f, -1.50629628f, -4.16888905f, -0.827000022f, -0.187857136f, 0.548285723f, 0.779999971f, -4.01000023f, -1.57000005f, -0.827481508f, -0.17425926f, 0.581222236f, -4.04444456f, -4.26222229f, 0.710370362f, -0.82341665f, -0.160125002f, 0.57570833f, -5.92666674f, -2.95458341f, 1.14333332f, -0.815999985f, -0.147f, 0.550000012f, -4.76000023f, -2.7650001f, 0.524999976f, -0.811592579f, -0.137185186f, 0.54674077f, -4.30111122f, -3.72555566f, 0.445925921f, -0.811749995f, -0.131083339f, 0.565458357f, -7.26541662f, -3.40374994f, 1.05291665f, -0.815888882f, -0.133111104f, 0.576777756f, -12.7866669f, -0.637777805f, 1.2833333f, -0.816583335f, -0.14033334f, 0.561500013f, -15.9366665f, 2.61916661f, 1.02083337f, -0.816458344f, -0.149124995f, 0.539416671f, -16.1408329f, 3.90541673f, 1.07624996f, -0.81655556f, -0.154444441f, 0.533999979f, -14.4277782f, 3.07999992f, 1.47000003f, -0.816416681f, -0.157916665f, 0.531499982f, -12.541667f, 2.05916667f, 1.76166666f, -0.815625012f, -0.163833335f, 0.527083337f, -11.3924999f, 0.968333304f, 1.67999995f, -0.814888895f, -0.166888893f, 0.536222219f, -12.2966671f, -0.474444449f, 1.99111116f, -0.815583348f, -0.161750004f, 0.552333355f, -14.8050003f, -1.0675f, 2.90499997f, -0.814185202f, -0.147296295f, 0.554555535f, -14.8555555f, -0.386296302f, 3.55444455f, -0.81099999f, -0.13666667f, 0.547666669f, -12.46f, 0.0466666669f, 2.96333337f, -0.808333337f, -0.135666668f, 0.542333305f, -9.65999985f, 0.0933333337f, 1.70333338f, -0.813851833f, -0.147888884f, 0.539703727f, -9.68851852f, 0.878888905f, 0.964444458f, -0.818374991f, -0.158749998f, 0.527875006f, -9.49374962f, 1.72375f, 0.892499983f, -0.818259239f, -0.162777781f, 0.521740735f, -8.99629593f, 1.26518524f, 1.21333337f, -0.817333341f, -0.158000007f, 0.529333353f, -8.7033329f, 0.163333327f, 1.61000001f, -0.816500008f, -0.156749994f, 0.541625023f, -7.28875017f, -0.65625f, 1.13750005f, -0.815111101f, -0.163925931f, 0.541370392f, -5.5792594f, -0.777777791f, -0.272222221f, -0.819666684f, -0.180999994f, 0.541333318f, -5.69333315f, -0.956666648f, -1.16666663f, -0.824249983f, -0.193124995f, 0.538500011f, -5.22375011f, -1.12874997f, -0.131249994f, -0.822259247f, -0.182222217f, 0.539703727f, -6.85222244f, -1.25999999f, 1.67222226f, -0.820333362f, -0.162333339f, 0.546999991f, -9.28666687f, -1.12f, 2.73000002f, -0.819000006f, -0.149333328f, 0.544666648f, -8.7966671f, -0.769999981f, 2.0999999f, -0.816083312f, -0.148833334f, 0.528416693f, -5.98791647f, -0.956666648f, 0.30916667f, -0.810000002f, -0.147666663f, 0.52033335f, -1.88999999f, -2.73000002f, -0.560000002f, -0.814666688f, -0.150666669f, 0.555666685f, 0.839999974f, -4.57333326f, 0.980000019f, -0.818444431f, -0.147407413f, 0.582925916f, 1.14592588f, -3.57777786f, 2.36185193f, -0.813047647f, -0.139285713f, 0.570333362f, 3.83666658f, -1.04999995f, 1.97666669f, -0.812666655f, -0.146333337f, 0.545666695f, 7.04666662f, -0.25666666f, 0.0700000003f, -0.819458306f, -0.17491667f, 0.535208344f, 10.6837502f, -1.35916662f, -2.03874993f, -0.820925951f, -0.194851846f, 0.527185202f, 12.1203699f, -2.927037f, -2.41629624f},
+    {-0.870000005f, 0.133000001f, 0.308999985f, -374.640015f, 59.3600006f, 11.8999996f, -0.902407408f, 0.0718888864f, 0.263629615f, -380.927032f, 50.8044434f, 1.20555556f, -0.916074097f, -0.0488518514f, 0.293222219f, -423.409271f, 43.2625923f, -5.01666689f, -0.928888917f, -0.138999999f, 0.332444459f, -468.058899f, 38.8033333f, -3.22777772f, -0.939238071f, -0.175285712f, 0.355571419f, -518.946655f, 38.5666656f, 5.34000015f, -0.931375027f, -0.169333339f, 0.350291669f, -550.885437f, 41.6587486f, 11.59375f, -0.936333358f, -0.153888896f, 0.332222223f, -544.312195f, 42.5988884f, 13.7588892f, -0.909500003f, -0.156583339f, 0.319916666f, -502.722504f, 40.8391685f, 11.4333334f, -0.920416653f, -0.228874996f, 0.276833326f, -451.467926f, 40.4016685f, 10.4620829f, -0.941444457f, -0.29066667f, 0.201222226f, -409.142212f, 37.9011116f, 16.6522217f, -0.954999983f, -0.297083348f, 0.159916669f, -374.144165f, 30.2749996f, 26.2208328f, -0.95685184f, -0.256962955f, 0.12888889f, -351.622955f, 22.5140743f, 34.4140739f, -0.942125022f, -0.203624994f, 0.128374994f, -341.565002f, 14.9099998f, 40.2324982f, -0.937250018f, -0.167666674f, 0.163833335f, -332.599152f, 8.35333347f, 38.8266678f, -0.941259265f, -0.171814814f, 0.21129629f, -310.880371f, 3.84481478f, 30.3514824f, -0.952499986f, -0.242125005f, 0.230375007f, -281.627502f, 3.21125007f, 17.8850002f, -0.962962985f, -0.303333342f, 0.216518521f, -266.334442f, 6.24296284f, 11.5759258f, -0.964999974f, -0.359166652f, 0.201333329f, -280.081665f, 11.8883333f, 12.4250002f, -0.964999974f, -0.387444437f, 0.169444442f, -302.905548f, 18.8688889f, 20.6499996f, -0.941074073f, -0.347962976f, 0.103296295f, -307.603333f, 22.9444447f, 34.170372f, -0.938285708f, -0.211619049f, 0.035285715f, -299.013336f, 19.2933331f, 48.7799988f, -0.935625017f, -0.113124996f, 0.0293749999f, -303.940002f, 12.7487497f, 49.3237495f, -0.947222233f, -0.112777777f, 0.0414074063f, -313.874817f, 9.97370338f, 40.4003716f, -0.957499981f, -0.158333331f, 0.0456666648f, -314.743347f, 9.17000008f, 30.3216667f, -0.959777772f, -0.202000007f, 0.0335555561f, -304.982208f, 8.93666649f, 24.2355556f, -0.948916674f, -0.236541674f, 0.0165416673f, -294.945007f, 7.44916677f, 19.9675007f, -0.951833308f, -0.291333348f, 0.0413333327f, -294.070007f, 5.43666649f, 16.2633343f, -0.966222227f, -0.338333338f, 0.073444441f, -292.483337f, 7.07000017f, 15.2444448f, -0.96920836f, -0.348208338f, 0.0770416632f, -286.982513f, 13.3379164f, 19.1100006f, -0.960111082f, -0.305777788f, 0.0337777771f, -276.388519f, 19.9733334f, 25.7600002f, -0.953999996f, -0.243750006f, -0.023f, -263.42749f, 22.5049992f, 30.2399998f, -0.942708313f, -0.193958327f, -0.058375001f, -250.602921f, 20.1454163f, 29.3066673f, -0.948888898f, -0.178333327f, -0.0654814839f, -242.946671f, 16.0377769f, 25.417778f, -0.971499979f, -0.170750007f, -0.0592500009f, -238.945007f, 13.2124996f, 22.3299999f, -0.96462965f, -0.156333327f, -0.0548888892f, -232.791489f, 13.5566664f, 20.7148151f, -0.960888863f, -0.139666662f, -0.0817037001f, -225.3974f, 15.1640739f, 18.4048157f, -0.960571408f, -0.147285715f, -0.123000003f, -232.389999f, 16.2399998f, 14.4899998f, -0.976185203f, -0.188888893f, -0.142851844f, -254.665192f, 16.5770378f, 12.1385183f, -0.98724997f, -0.234458327f, -0.163291663f, -282.094177f, 17.7508335f, 13.7025003f, -0.982249975f, -0.256000012f, -0.171499997f, -309.434998f, 18.2000008f, 19.7049999f, -0.978592575f, -0.232962966f, -0.148074076f, -325.445557f, 16.6729622f, 27.2818527f, -0.976583362f, -0.153291672f, -0.133750007f, -317.689178f, 13.7491665f, 33.1712494f, -0.967750013f, -0.074000001f, -0.137999997f, -300.125f, 11.7075005f, 32.0600014f, -0.961481452f, -0.0584074073f, -0.13085185f, -292.983704f, 11.9311113f, 25.6537037f, -0.962833345f, -0.0689166635f, -0.138333336f, -284.074585f, 14.1137505f, 18.5499992f, -0.966666639f, -0.0869999975f, -0.159666672f, -275.309998f, 16.3566666f, 13.8833332f, -0.958000004f, -0.0960000008f, -0.158000007f, -262.98999f, 17.1733341f, 12.2033329f, -0.952291667f, -0.083541669f, -0.126083329f, -235.471252f, 17.6662502f, 12.1391668f, -0.945333362f, -0.0673333332f, -0.146333337f, -208.320007f, 20.9766674f, 11.1066666f, -0.955333352f, -0.109999999f, -0.151333332f, -199.476669f, 26.6466675f, 10.4766665f, -0.962000012f, -0.151629627f, -0.163629636f, -199.103333f, 32.5785179f, 16.1155548f, -0.957000017f, -0.144222215f, -0.17233333f, -204.508896f, 37.3488884f, 26.5766659f, -0.953619063f, -0.0780000016f, -0.180285707f, -206.896667f, 40.8133316f, 38.1199989f, -0.950851858f, 0.0138148144f, -0.237000003f, -200.874069f, 42.6014824f, 42.5133324f, -0.950874984f, 0.0783749968f, -0.280750006f, -198.318756f, 40.1887512f, 38.4737511f, -0.962000012f, 0.0953333303f, -0.300999999f, -187.296661f, 33.25f, 29.003334f, -0.963222206f, 0.0968888924f, -0.301333338f, -161.578156f, 24.7981472f, 20.2870369f, -0.954124987f, 0.0823749974f, -0.274250001f, -124.573753f, 16.1875f, 11.7250004f, -0.951777756f, 0.0451481491f, -0.229185179f, -83.4711075f, 10.3522224f, 4.77814817f, -0.951833308f, 0.0207499992f, -0.206249997f, -44.2750015f, 8.87833309f, 1.62750006f, -0.95599997f, 0.0344999991f, -0.226875007f, -21.3937492f, 11.0512505f, 2.1087501f, -0.953666687f, 0.06277778f, -0.261333346f, -17.6711121f, 12.4288893f, 2.74296308f, -0.950583339f, 0.0697500035f, -0.297583342f, -24.9258327f, 11.6199999f, 0.921666682f, -0.945444465f, 0.0309999995f, -0.298000008f, -36.0966682f, 8.93666649f, -1.70333338f, -0.943166673f, -0.00620833319f, -0.297374994f, -39.4858322f, 5.64375019f, -1.70624995f, -0.949666679f, -0.00524999993f, -0.318666667f, -42.501667f, 2.28083324f, 0.997500002f, -0.956888914f, 0.0171111114f, -0.314222217f, -49.9488907f, -1.19000006f, 3.94333339f, -0.960481465f, 0.0535925925f, -0.289074063f, -48.1159248f, -4.55518532f, 5.68814802f, -0.962047637f, 0.0941904783f, -0.2625238f, -34.6433334f, -7.0666666f, 4.69333315f, -0.961333334f, 0.102444448f, -0.239666671f, -21.3655548f, -6.88333321f, 0.715555549f, -0.95783335f, 0.0779583305f, -0.243083328f, -10.9899998f, -4.56166649f, -3.78874993f, -0.95599997f, 0.0355925933f, -0.275222212f, -6.58777761f, -2.06111121f, -6.39074087f, -0.955500007f, -0.00300000003f, -0.294f, -7.07000017f, -1.43499994f, -5.49499989f, -0.953374982f, -0.00554166688f, -0.281541675f, -4.01333332f, -3.52624989f, -1.44375002f, -0.946814835f, 0.0231481474f, -0.249222219f, -0.681851864f, -5.69592571f, 2.04037046f, -0.944000006f, 0.0489999987f, -0.222499996f, -1.78499997f, -5.49499989f, 2.90499997f, -0.948888898f, 0.0536666662f, -0.220814809f, -7.23592615f, -2.90111113f, 1.81481481f, -0.954291642f, 0.0471666679f, -0.235624999f, -14.8429165f, -0.0874999985f, 0.659166694f, -0.952499986f, 0.0384999998f, -0.238000005f, -20.5100002f, 0.944999993f, 0.209999993f, -0.946074069f, 0.0281481482f, -0.223703697f, -18.9518528f, 0.907407403f, 0.274814814f, -0.943541646f, 0.0285833329f, -0.228541672f, -13.3262501f, 1.81416667f, 0.612500012f, -0.948000014f, 0.0350000001f, -0.277500004f, -14.2449999f, 4.0250001f, 0.735000014f, -0.954925954f, 0.0297407415f, -0.322185189f, -24.3522224f, 3.96925926f, 0.899629653f, -0.957814813f, 0.0262592584f, -0.31348148f, -31.7151852f, 0.337037027f, 2.33074069f, -0.954999983f, 0.0379999988f, -0.270000011f, -30.5900002f, -3.5f, 4.71333313f, -0.94599998f, 0.0593333319f, -0.228333339f, -25.6200008f, -3.71000004f, 6.27666664f, -0.944916666f, 0.0859166682f, -0.234416664f, -22.7383327f, -0.478333324f, 5.64375019f, -0.948666692f, 0.0937777758f, -0.263444453f, -32.044445f, 1.78111112f, 3.0333333f, -0.953249991f, 0.0785000026f, -0.279833347f, -48.0666656f, 2.49083328f, 0.524999976f, -0.954083323f, 0.0592916682f, -0.281583339f, -60.4333344f, 1.93666661f, -0.0816666633f, -0.952555537f, 0.0450000018f, -0.263333321f, -65.621109f, 1.04999995f, 0.692222238f, -0.951166689f, 0.0395833328f, -0.247916669f, -63.1808319f, 1.10833335f, 2.25749993f, -0.949999988f, 0.0414444432f, -0.244592592f, -54.4625931f, 1.93666661f, 3.95888901f, -0.948499978f, 0.0517500006f, -0.25f, -39.9787483f, 1.96875f, 5.01375008f, -0.945166647f, 0.0646666661f, -0.262083322f, -23.2808342f, 0.583333313f, 4.88250017f, -0.94685185f, 0.0686296299f, -0.267851859f, -12.9525928f, -1.92888892f, 3.95629621f, -0.952875018f, 0.078125f, -0.249125004f, -6.84250021f, -4.76000023f, 3.89374995f, -0.954518497f, 0.107037038f, -0.205814809f, -1.26518524f, -5.12296295f, 4.47222233f, -0.951333344f, 0.132666662f, -0.202000007f, 2.61333323f, -1.70333338f, 2.94000006f, -0.951333344f, 0.111333333f, -0.221000001f, 2.49666667f, 2.58999991f, -0.933333337f, -0.954777777f, 0.0744814798f, -0.248592585f, 4.26740742f, 4.8585186f, -2.95296288f, -0.956523836f, 0.053952381f, -0.28171429f, 5.04333353f, 5.40666676f, -1.95666671f, -0.953499973f, 0.063000001f, -0.300000012f, 2.21374989f, 3.15875006f, 0.568750024f, -0.951740742f, 0.0718888864f, -0.294074088f, -1.42074072f, 0.204814821f, 1.29629624f, -0.953000009f, 0.0689999983f, -0.286333323f, -4.10666656f, -1.75f, 1.09666669f, -0.954333305f, 0.0666666701f, -0.287333339f, -7.07000017f, -2.84666657f, 1.14333332f, -0.957291663f, 0.0671666637f, -0.27125001f, -9.6833334f, -4.53249979f, 1.59541667f, -0.958666682f, 0.0769999996f, -0.239333332f, -8.07333374f, -6.01999998f, 2.73000002f, -0.956666648f, 0.0956666693f, -0.208333328f, -5.36666679f, -5.22666645f, 3.6400001f, -0.950291693f, 0.102666669f, -0.194833338f, -1.01499999f, -2.5374999f, 2.7854166f, -0.952481508f, 0.0892962962f, -0.218185186f, 5.25259256f, 0.865925908f, 0.676666677f, -0.954750001f, 0.0715000033f, -0.243000001f, 7.875f, 2.45000005f, 0.280000001f, -0.95129168f, 0.081749998f, -0.254916668f, 8.66833305f, 1.5604167f, 2.09708333f, -0.953481495f, 0.107740737f, -0.262592584f, 4.87407398f, 0.212592587f, 2.52518511f, -0.956749976f, 0.115000002f, -0.262499988f, -1.87249994f, -0.349999994f, 0.944999993f, -0.95574075f, 0.095740743f, -0.256703705f, -4.08074093f, -0.723333359f, -1.16666663f, -0.954999983f, 0.0731481463f, -0.251518518f, -0.969629645f, -1.25481486f, -1.90555561f, -0.954857171f, 0.0661428571f, -0.244000003f, 1.67999995f, -1.45000005f, -0.75999999f, -0.950370371f, 0.0768888891f, -0.239037037f, 2.70148158f, -0.474444449f, 1.23407412f, -0.940208316f, 0.0892499983f, -0.248249993f, 2.81166673f, 0.988749981f, 1.50791669f},
+    {-0.989000022f, -0.0379999988f, -0.00700000022f, -1.33000004f, -1.53999996f, -0.839999974f, -0.995037019f, -0.05185185f, -0.0268148147f, 1.25740743f, 0.847777784f, -0.567777753f, -0.995962977f, -0.0481481478f, -0.0471851863f, 4.69259262f, 1.04222226f, 0.98777777f, -0.992999971f, -0.0430000015f, -0.0540000014f, 2.66000009f, -0.140000001f, 1.75f, -0.98777777f, -0.0396666676f, -0.047703702f, -0.150370374f, -1.57111108f, 1.97296298f, -0.982222199f, -0.0313333347f, -0.0402962975f, -0.409629643f, -2.34888887f, 2.29703712f, -0.981000006f, -0.0280000009f, -0.0320000015f, -2.0999999f, -2.30999994f, 1.88999999f, -0.978222251f, -0.0270740744f, -0.0329259261f, -2.42407417f, -1.40259254f, 1.56592596f, -0.976083338f, -0.022208333f, -0.039708335f, -0.303333342f, -0.457916677f, 1.47291672f, -0.972000003f, -0.0179999992f, -0.0500000007f, 0.910000026f, -0.0700000003f, 0.980000019f, -0.971074045f, -0.0207777787f, -0.055555556f, 0.715555549f, -0.523703694f, 0.202222228f, -0.974407434f, -0.0269629639f, -0.0542962961f, 2.19074082f, -1.63333333f, -0.396666676f, -0.981000006f, -0.0359999985f, -0.0439999998f, 4.13000011f, -3.3599999f, -0.839999974f, -0.987481475f, -0.040629629f, -0.0310370363f, 3.09296298f, -3.61925936f, -0.969629645f, -0.992791653f, -0.0486666672f, -0.0252083335f, -0.344166666f, -2.02999997f, -1.11416662f, -0.986777782f, -0.0525555573f, -0.0338888876f, -0.863333344f, 0.280000001f, -0.622222245f, -0.986916661f, -0.0456666648f, -0.057f, 2.17000008f, 1.7791667f, 0.466666669f, -0.993708313f, -0.0392500013f, -0.0820000023f, 2.24874997f, 1.48749995f, 0.962499976f, -0.993111134f, -0.0398888886f, -0.0803333297f, -3.98222232f, -0.0233333334f, 0.668888867f, -0.991166651f, -0.0409166664f, -0.063500002f, -9.1875f, -1.81416667f, 0.56583333f, -0.99483335f, -0.0381250009f, -0.0457083322f, -8.44958305f, -2.69791675f, 0.358749986f, -0.992333353f, -0.0424444452f, -0.0405555554f, -6.40888882f, -1.98333335f, -0.272222221f, -0.993833363f, -0.0430000015f, -0.0445833318f, -5.83916664f, -0.735000014f, -0.606666684f, -0.992296278f, -0.0447037034f, -0.0509629622f, -5.27333355f, -0.0933333337f, -0.98777777f, -0.991999984f, -0.0485000014f, -0.0607500002f, -3.40374994f, 0.0612500012f, -1.35625005f, -0.995666683f, -0.0462500006f, -0.0803333297f, -5.7166667f, 0.262499988f, -1.07916665f, -0.989185214f, -0.0417407416f, -0.091370374f, -15.4311113f, 0.399259269f, -0.513333321f, -0.981000006f, -0.0355555564f, -0.0898888856f, -21.9255562f, -0.832222223f, -0.0933333337f, -0.980407417f, -0.0269629639f, -0.0798518509f, -23.5562954f, -3.06185174f, -0.0985185206f, -0.984238088f, -0.0167142861f, -0.0622380935f, -33.6899986f, -4.75666666f, -1.15999997f, -0.983250022f, -0.0219999999f, -0.0476250015f, -61.7137489f, -2.7650001f, -2.86999989f, -0.98299998f, -0.0270740744f, -0.0500740744f, -83.0614853f, 0.57296294f, -4.10666656f, -0.980499983f, -0.0363333337f, -0.0643333346f, -97.871666f, 3.59333324f, -5.68166685f, -0.97299999f, -0.0432499982f, -0.0705000013f, -106.644997f, 4.91750002f, -6.31750011f, -0.98829627f, -0.02362963f, -0.0775185153f, -108.616669f, 4.52666664f, -5.28629637f, -0.985333323f, -0.0140000004f, -0.0948333368f, -105.23333f, 4.29333353f, -6.44000006f, -0.986333311f, -0.024666667f, -0.0948888883f, -108.048889f, 1.54777777f, -9.33333302f, -0.990166664f, -0.0525416657f, -0.0757916644f, -125.574165f, -1.5575f, -11.6870832f, -0.990999997f, -0.0748333335f, -0.100166664f, -165.503326f, 1.85500002f, -10.5933332f, -0.994111121f, -0.0616666675f, -0.166666672f, -227.717773f, 10.0644445f, -6.36999989f, -0.996583343f, -0.044333335f, -0.240208328f, -316.609985f, 15.6158333f, -4.52958345f, -1.0103333f, -0.0735925958f, -0.266851842f, -410.993347f, 12.7866669f, -7.13999987f, -0.996249974f, -0.0909999982f, -0.300249994f, -493.622498f, 1.66250002f, -9.80000019f, -1.02518523f, -0.184481487f, -0.339555562f, -558.703674f, -15.0085182f, -9.96592617f, -1.01922226f, -0.25196296f, -0.298481494f, -615.398499f, -33.9603691f, -3.67370367f, -0.987714291f, -0.248285711f, -0.187000006f, -684.47998f, -51.6399994f, 8.13000011f, -0.973666668f, -0.220208332f, -0.0599999987f, -761.215027f, -52.5320816f, 19.6670837f, -0.974222243f, -0.202407405f, -0.0357407406f, -806.825195f, -44.7818527f, 31.0177784f, -0.995999992f, -0.0989999995f, -0.0307500008f, -843.919983f, -37.7299995f, 43.8375015f, -0.968518496f, 0.0416666679f, 0.0850000009f, -879.340027f, -29.7370377f, 49.5522232f, -0.956125021f, 0.138708338f, 0.259791672f, -868.177917f, -15.467083f, 43.9658318f, -0.961499989f, 0.176499993f, 0.365249991f, -773.55249f, 6.71999979f, 30.3624992f, -0.963f, 0.165814817f, 0.307000011f, -633.359985f, 28.2437038f, 14.917778f, -0.980000019f, 0.0803750008f, 0.11704167f, -493.103333f, 44.6775017f, -3.49708343f, -0.996999979f, -0.0486666672f, -0.0566666685f, -407.353333f, 48.7200012f, -16.5433331f, -1.00733328f, -0.137666672f, -0.145666674f, -349.51001f, 40.2266655f, -17.873333f, -0.988749981f, -0.120458335f, -0.134666666f, -294.201263f, 23.2370834f, -9.86708355f, -0.967999995f, -0.044333335f, -0.0636666641f, -241.686661f, 8.14333344f, -4.40999985f, -0.965333343f, 0.0140000004f, 0.0293333326f, -189.559998f, -1.21333337f, -6.44000006f, -0.97077775f, 0.0116296299f, 0.0817777812f, -148.052597f, -0.565185189f, -13.3207407f, -0.973555565f, -0.0291111115f, 0.0706666633f, -119.598892f, 6.91444445f, -18.9466667f, -0.978952408f, -0.08866667f, 0.00433333311f, -107.389999f, 17.1833324f, -21.2166672f, -0.982629657f, -0.145259261f, -0.0514444448f, -117.592224f, 23.1622219f, -18.6174068f, -0.98299998f, -0.166624993f, -0.0844999999f, -126.026253f, 23.1087494f, -10.9724998f, -0.989000022f, -0.136999995f, -0.103f, -122.73333f, 18.3166676f, -1.33000004f, -0.993259251f, -0.0949259251f, -0.0962962955f, -116.767776f, 13.2066669f, 4.67703724f, -0.995249987f, -0.0458750017f, -0.0806249976f, -106.714996f, 9.06499958f, 8.10249996f, -0.988666654f, 0.0106666666f, -0.0643333346f, -89.4366684f, 5.46000004f, 8.91333294f, -0.980592608f, 0.0422222205f, -0.0470370352f, -70.3785172f, 2.0040741f, 5.99925947f, -0.978625f, 0.0375000015f, -0.0256249998f, -50.8725014f, -0.857500017f, 0.796249986f, -0.981962979f, 0.0110370368f, -0.0134444442f, -35.1762962f, -1.99888885f, -3.3211112f, -0.989250004f, -0.00841666665f, -0.00983333308f, -23.9808331f, -1.51666665f, -4.36333323f, -0.995500028f, 0.000750000007f, -0.018375f, -11.4099998f, -0.481249988f, -2.86124992f, -0.994037032f, 0.0226296298f, -0.039407406f, 2.96592593f, -0.430370361f, -2.18296289f, -0.98908335f, 0.0320000015f, -0.0581666678f, 14.7116671f, -2.30416656f, -3.22000003f, -0.989777803f, 0.0286666658f, -0.0695555583f, 16.5977783f, -5.13333321f, -4.34777784f, -0.98718518f, 0.0207037032f, -0.0532962978f, 5.71148157f, -7.78814793f, -3.94851851f, -0.983047605f, 0.013952381f, -0.00428571412f, -8.44999981f, -9.75333309f, -1.86666667f, -0.984555542f, 0.0157777779f, 0.0250000004f, -10.1499996f, -8.66444397f, 0.233333334f, -0.980666637f, 0.0174583327f, 0.0203333329f, -6.49833345f, -5.52416658f, 1.2833333f, -0.970000029f, 0.0129166665f, 0.00366666657f, -1.76750004f, -2.57249999f, 1.49916661f, -0.977777779f, -0.00555555569f, -0.0268888883f, 2.20888901f, -0.482222229f, 0.808888912f, -0.984208345f, -0.0391249992f, -0.0524999984f, -3.37458324f, 0.268333346f, 1.07624996f, -0.98411113f, -0.0564814806f, -0.0465925932f, -13.1937037f, -1.09407413f, 4.32703686f, -0.986999989f, -0.0324999988f, -0.0250000004f, -15.6099997f, -2.90499997f, 9.23999977f, -0.986458361f, 0.014833333f, -0.0058749998f, -11.9174995f, -2.77375007f, 12.1391668f, -0.988074064f, 0.0557407402f, -0.00262962957f, -4.82740736f, -0.757037044f, 11.3711109f, -0.99000001f, 0.0930000022f, -0.0160000008f, 4.96999979f, 0.875f, 8.68000031f, -0.990962982f, 0.109555557f, -0.0255185179f, 12.6103706f, 0.653333306f, 4.67444468f, -0.992916644f, 0.0937916636f, -0.0176666658f, 17.8266659f, -0.577499986f, 0.277083337f, -0.994000018f, 0.061999999f, -0.000500000024f, 26.0400009f, -1.505f, -2.73000002f, -0.994481504f, 0.0421851836f, 0.00318518514f, 36.1744461f, -1.21074069f, -3.56740737f, -0.996629655f, 0.0272222217f, -0.0256296303f, 37.5459251f, 0.73888886f, -4.15333319f, -0.992571414f, -0.00757142855f, -0.0561428554f, 19.8099995f, 2.88000011f, -4.84000015f, -0.98496294f, -0.0350000001f, -0.0413703695f, 3.27703714f, 1.46222222f, -2.67037034f, -0.983708322f, -0.0189583339f, -0.0277916659f, 5.19458342f, -1.11416662f, 1.44083333f, -0.981000006f, 0.012444444f, -0.0168888886f, 6.57222223f, -1.9133333f, 4.13777781f, -0.980166674f, 0.0421666652f, -0.00508333324f, 5.7458334f, -1.41750002f, 4.67250013f, -0.979916692f, 0.0716250017f, -0.00191666663f, 9.28083324f, -0.729166687f, 3.45916677f, -0.983222246f, 0.075888887f, -0.00166666671f, 11.6044445f, 0.272222221f, 0.49000001f, -0.986000001f, 0.0603333339f, -0.00249999994f, 14.4724998f, 1.57500005f, -2.60166669f, -0.985592604f, 0.0477407426f, -0.0198518522f, 21.9488888f, 2.5666666f, -4.50333357f, -0.98724997f, 0.0313749984f, -0.0478749983f, 25.9349995f, 2.78250003f, -5.93249989f, -0.99391669f, -0.00216666656f, -0.0610000007f, 21.1808338f, 2.11166668f, -6.95333338f, -0.996777773f, -0.0252592601f, -0.0642592609f, 16.3125935f, 1.08370376f, -5.62074089f, -0.99575001f, -0.0277500004f, -0.0648749992f, 11.7862501f, -0.104999997f, -2.66000009f, -0.995333314f, -0.0152500002f, -0.0542499982f, 6.52166653f, -1.38833332f, 0.665000021f, -0.990555584f, 0.00514814816f, -0.0465555564f, 5.02703714f, -2.18814826f, 2.86481476f, -0.989333332f, 0.0170000009f, -0.0439999998f, 4.69000006f, -2.51999998f, 3.19666672f, -0.994518518f, 0.0133703705f, -0.0457407422f, 1.9625926f, -2.37481475f, 2.30481482f, -0.994571447f, 0.00204761908f, -0.0450000018f, -4.78000021f, -1.96000004f, 2.1400001f, -0.988125026f, 0.000500000024f, -0.0397499986f, -10.2550001f, -2.40625f, 3.4124999f, -0.986111104f, 0.00966666639f, -0.025074074f, -11.9985189f, -3.22777772f, 4.64074087f, -0.986666679f, 0.0283333343f, -0.0140000004f, -10.3833332f, -2.91666675f, 5.38999987f, -0.984000027f, 0.0460000001f, -0.01425f, -5.67000008f, -1.63625002f, 4.60249996f, -0.986592591f, 0.0498888902f, -0.0213333331f, 0.137407407f, -0.850370347f, 2.38259268f, -0.989000022f, 0.0430000015f, -0.0293333326f, 4.52666664f, -0.769999981f, 0.233333334f, -0.983333349f, 0.0253333338f, -0.0309999995f, 4.45666647f, -1.33000004f, -1.21333337f, -0.982333362f, 0.00708333356f, -0.0203333329f, 1.02083337f, -2.01250005f, -1.21041667f, -0.988333344f, 0.00866666622f, -0.00666666683f, -3.07999992f, -1.93666661f, 1.09666669f},
+    {0.625999987f, 0.609000027f, -0.509000003f, 7f, -7.69999981f, -3.5f, 0.615999997f, 0.598185182f, -0.490074068f, 6.31814814f, -6.81333351f, -1.36111116f, 0.591583312f, 0.626583338f, -0.52458334f, 9.10583305f, -5.6875f, -0.157499999f, 0.582333326f, 0.606999993f, -0.520777762f, 8.43111134f, -5.312222f, -2.79999995f, 0.631500006f, 0.57479167f, -0.527541637f, 15.2366667f, -7.14291668f, -3.78583336f, 0.595333338f, 0.570416689f, -0.540000021f, 24.5291672f, -12.3900003f, -0.466666669f, 0.578333318f, 0.574444473f, -0.538888872f, 26.1566658f, -16.5355549f, 2.27888894f, 0.589916646f, 0.569999993f, -0.529583335f, 24.2462502f, -19.0195827f, 3.7974999f, 0.608749986f, 0.571583331f, -0.519166648f, 23.3274994f, -21.9449997f, 5.90333319f, 0.582555532f, 0.590555549f, -0.51111114f, 24.251112f, -23.7611103f, 6.8211112f, 0.571874976f, 0.602374971f, -0.519749999f, 23.6337509f, -22.7966671f, 5.85666656f, 0.593407393f, 0.586740732f, -0.513407409f, 16.3359261f, -20.4114819f, 3.69962955f, 0.611000001f, 0.57099998f, -0.505999982f, 13.1599998f, -17.4300003f, 3.56999993f, 0.612041652f, 0.555625021f, -0.504374981f, 16.5812492f, -12.3608332f, 8.00625038f, 0.630518496f, 0.594629645f, -0.514703691f, 23.001482f, -8.24703693f, 9.95037079f, 0.561999977f, 0.61500001f, -0.536000013f, 25.2700005f, -5.46000004f, 6.57999992f, 0.572185159f, 0.600185156f, -0.56099999f, 15.8718519f, -3.19148159f, 1.65407407f, 0.585703731f, 0.574185193f, -0.564518511f, 8.01888847f, -3.2562964f, -2.48629642f, 0.582000017f, 0.56400001f, -0.57099998f, 9.38000011f, -5.46000004f, -2.94000006f, 0.580185175f, 0.560074091f, -0.564777792f, 10.0074072f, -7.88666677f, -1.91851854f, 0.584814787f, 0.561925948f, -0.559222221f, 8.19259262f, -9.05333328f, -0.881481469f, 0.587000012f, 0.558000028f, -0.536000013f, -3.1500001f, -9.80000019f, -1.04999995f, 0.57518518f, 0.557444453f, -0.49333334f, -26.5662956f, -5.94999981f, -0.99555558f, 0.579814792f, 0.568555534f, -0.476666659f, -44.9737053f, 2.79999995f, 0.365555555f, 0.596000016f, 0.58099997f, -0.488999993f, -52.5699997f, 12.5299997f, 0.560000002f, 0.596000016f, 0.584703684f, -0.513999999f, -49.7181473f, 17.6503696f, 0.235925928f, 0.594083309f, 0.590749979f, -0.557208359f, -40.03125f, 19.8041668f, 0.679583311f, 0.598999977f, 0.597000003f, -0.586000025f, -29.6100006f, 17.1499996f, 0.560000002f, 0.589740753f, 0.601629615f, -0.593407393f, -20.6007404f, 10.7981482f, -0.606666684f, 0.581333339f, 0.591458321f, -0.587291658f, -20.8191662f, 3.38041663f, -2.57833338f, 0.578000009f, 0.578999996f, -0.549000025f, -41.0900002f, 0f, -3.28999996f, 0.587259233f, 0.596592605f, -0.504555583f, -67.9881516f, 2.46296287f, -1.08629632f, 0.595666647f, 0.630370378f, -0.476296306f, -89.4003677f, 7.72851849f, 0.998148143f, 0.628888905f, 0.668666661f, -0.464222223f, -105.054443f, 13.4555559f, 0.295555562f, 0.668761909f, 0.721428573f, -0.460190475f, -131.116669f, 20.0966663f, -1.26666665f, 0.631749988f, 0.733666658f, -0.448500007f, -160.122086f, 25.748333f, -7.16916656f, 0.60688889f, 0.717999995f, -0.438222229f, -185.671112f, 30.3255558f, -13.5799999f, 0.593916655f, 0.695833325f, -0.42324999f, -218.621674f, 34.7200012f, -18.4566669f, 0.595555544f, 0.692296267f, -0.413481474f, -254.07666f, 37.753334f, -20.082222f, 0.604749978f, 0.70162499f, -0.391000003f, -295.417511f, 39.6899986f, -18.7687492f, 0.612416685f, 0.717666686f, -0.358666658f, -323.545837f, 37.269165f, -17.5233326f, 0.609592617f, 0.725814819f, -0.34577778f, -343.648163f, 31.0074081f, -19.9344444f, 0.57662499f, 0.72874999f, -0.329124987f, -393.881256f, 23.40625f, -24.1674995f, 0.572000027f, 0.728083313f, -0.263749987f, -477.545837f, 17.3366661f, -27.2766666f, 0.580518544f, 0.721185207f, -0.14896296f, -555.201111f, 14.2462959f, -27.8081474f, 0.592499971f, 0.699000001f, -0.00925000012f, -612.998779f, 13.7287502f, -27.7374992f, 0.583407402f, 0.669925928f, 0.0666666701f, -643.341492f, 15.3170366f, -27.4918518f, 0.548500001f, 0.641499996f, 0.109999999f, -682.243347f, 19.6466675f, -27.3233337f, 0.55288887f, 0.62611109f, 0.139333338f, -723.72998f, 22.5088882f, -26.0477772f, 0.546148121f, 0.620185196f, 0.165703699f, -761.55072f, 17.8785191f, -25.0496292f, 0.533095241f, 0.580952406f, 0.230666667f, -823.383362f, 5.59333324f, -27.4433327f, 0.432999998f, 0.401666671f, 0.513888896f, -906.002197f, -2.87777781f, -31.6088886f, 0.457249999f, 0.181999996f, 0.963874996f, -933.388733f, 12.5591669f, -18.7104168f, 0.550166667f, 0.15033333f, 0.955333352f, -938.65332f, 52.5466652f, 5.13333321f, 0.591666639f, 0.15144445f, 0.798666656f, -1003.46558f, 78.0422211f, 17.4455547f, 0.638583362f, 0.101125002f, 0.776624978f, -1095.6604f, 84.7408371f, 15.32125f, 0.531499982f, -0.0253333338f, 0.948499978f, -1098.94165f, 81.0366669f, -3.24333334f, 0.398333341f, -0.376222223f, 1.13288891f, -880.817749f, 65.7922211f, -7.48222208f, 0.56491667f, -0.327499986f, 0.891791642f, -540.175415f, 41.0550003f, 12.915f, 0.574037015f, -0.293703705f, 0.879222214f, -399.593689f, 7.21518517f, 19.377037f, 0.462249994f, -0.315250009f, 0.976750016f, -359.204987f, -1.25999999f, 18.8474998f, 0.474333346f, -0.249958336f, 0.910166681f, -289.120422f, 11.1445837f, 17.1091671f, 0.484518528f, -0.238407403f, 0.845259249f, -202.315552f, 11.0651855f, 4.38925934f, 0.483999997f, -0.34224999f, 0.844500005f, -101.745003f, -0.140000001f, -13.2650003f, 0.475555569f, -0.43651852f, 0.869407415f, -29.0811119f, -7.63777781f, -20.7640743f, 0.493407398f, -0.47018519f, 0.888703704f, 1.80444443f, -5.98629618f, -19.0970364f, 0.526000023f, -0.407142848f, 0.862857163f, 17.0599995f, 1.46000004f, -14.5600004f, 0.5192222f, -0.344814807f, 0.805666685f, 18.2648144f, 5.95518541f, -17.3314819f, 0.502375007f, -0.400124997f, 0.789833307f, 1.96875f, 6.78125f, -24.6720829f, 0.492749989f, -0.484499991f, 0.792500019f, -6.70249987f, 4.93499994f, -25.9699993f, 0.486777782f, -0.507925928f, 0.792999983f, -9.55888844f, 3.94592595f, -19.2655563f, 0.479333341f, -0.472458333f, 0.791583359f, -15.3883333f, 5.06916666f, -9.69791698f, 0.492333323f, -0.414999992f, 0.782999992f, -17.5233326f, 6.01999998f, -4.15333319f, 0.500666678f, -0.404666662f, 0.765666664f, -19.9033337f, 5.85666656f, -3.77999997f, 0.500999987f, -0.434791654f, 0.750500023f, -27.8133335f, 5.91791677f, -3.47666669f, 0.502333343f, -0.465666682f, 0.747666657f, -32.503334f, 6.48666668f, -0.676666677f, 0.503666639f, -0.458666652f, 0.730666637f, -28.6066666f, 6.62666655f, 3.73333335f, 0.523124993f, -0.420249999f, 0.709249973f, -24.8412495f, 4.74541664f, 6.16291666f, 0.517666638f, -0.423333347f, 0.715333343f, -24.1499996f, 1.14333332f, 4.13000011f, 0.504999995f, -0.442999989f, 0.733666658f, -17.126667f, -2.79999995f, 1.63333333f, 0.497592598f, -0.438296288f, 0.741888881f, -5.7166667f, -5.02962971f, 1.28851855f, 0.488333344f, -0.421999991f, 0.750222206f, 4.08333349f, -6.72777796f, 0.925555527f, 0.483619034f, -0.420190483f, 0.791285694f, 11.3533335f, -8.97333336f, -0.463333338f, 0.485888898f, -0.435962975f, 0.833148122f, 17.5311108f, -8.69814777f, -1.57888889f, 0.51137501f, -0.453624994f, 0.845000029f, 21.9449997f, -4.8125f, -1.05875003f, 0.533111095f, -0.428592592f, 0.814185202f, 19.6985188f, 1.27814817f, 0.725925922f, 0.528666675f, -0.416916668f, 0.773166656f, 10.7858334f, 5.96750021f, -0.0233333334f, 0.515124977f, -0.427749991f, 0.733375013f, 7.40250015f, 6.01125002f, -1.80250001f, 0.510999978f, -0.426444441f, 0.71325928f, 4.82999992f, 3.4662962f, -1.46481478f, 0.506333351f, -0.425166667f, 0.723416686f, 0.396666676f, -0.250833333f, -0.69416666f, 0.495499998f, -0.437875003f, 0.763625026f, -1.47000003f, -3.99874997f, 0.122500002f, 0.485666662f, -0.444407403f, 0.800962985f, -1.05777776f, -4.80666685f, 2.31518507f, 0.477916658f, -0.433499992f, 0.812250018f, 0.268333346f, -2.18166661f, 5.57083321f, 0.480555564f, -0.408222228f, 0.793777764f, 1.14333332f, 1.49333334f, 7.97222233f, 0.487166673f, -0.393458337f, 0.761583328f, -0.982916653f, 3.83833337f, 8.18124962f, 0.484916657f, -0.404083341f, 0.741916656f, -4.81833315f, 3.86750007f, 6.80166674f, 0.492000014f, -0.414777786f, 0.742333353f, -3.94333339f, 2.26333332f, 6.08222198f, 0.505777776f, -0.40062964f, 0.744037032f, -2.37222219f, 0.824444473f, 5.7503705f, 0.507925928f, -0.389925927f, 0.753185213f, -5.84111118f, -0.233333334f, 3.72037029f, 0.499857157f, -0.421428561f, 0.774857163f, -9.78999996f, -1.88f, -0.159999996f, 0.498083323f, -0.471666664f, 0.792666674f, -9.84958363f, -3.45916677f, -1.27750003f, 0.501074076f, -0.492074072f, 0.814518511f, -12.1592588f, -2.72740746f, 1.73185182f, 0.505999982f, -0.47299999f, 0.815999985f, -13.4750004f, 0.665000021f, 6.26499987f, 0.506833315f, -0.443875015f, 0.781791687f, -12.4104166f, 4.52083349f, 8.80541706f, 0.495666653f, -0.432851851f, 0.743814826f, -11.0444441f, 5.52222204f, 9.06629658f, 0.483999997f, -0.436500013f, 0.725000024f, -12.1800003f, 4.30499983f, 9.34500027f, 0.481000006f, -0.450259268f, 0.723999977f, -11.0574074f, 1.67222226f, 10.1629629f, 0.482833326f, -0.467541665f, 0.739125013f, -6.39333344f, -1.41750002f, 11.5500002f, 0.503000021f, -0.456499994f, 0.758000016f, -4.40999985f, -2.51999998f, 14.2799997f, 0.521962941f, -0.386777788f, 0.744555533f, -11.7288885f, -0.176296294f, 15.7629633f, 0.516125023f, -0.34845832f, 0.725791693f, -20.4545841f, 1.53125f, 10.5233335f, 0.504499972f, -0.404000014f, 0.719500005f, -14.2799997f, -1.505f, 0.209999993f, 0.49666667f, -0.475851864f, 0.729518533f, -7.46925926f, -5.44703722f, -4.57592583f, 0.490370363f, -0.505962968f, 0.75359261f, -9.44740772f, -6.70444441f, -2.77666664f, 0.486666679f, -0.489666671f, 0.774999976f, -10.8033333f, -6.27666664f, 1.63333333f, 0.483666658f, -0.457666665f, 0.793666661f, -7.9333334f, -5.13333321f, 4.73666668f, 0.48254168f, -0.447916657f, 0.801041663f, -4.51499987f, -3.0333333f, 5.02541685f, 0.489555568f, -0.460999995f, 0.795777798f, -8.91333294f, -0.668888867f, 4.79111099f, 0.496499985f, -0.479333341f, 0.797583342f, -15.0383329f, 1.61583328f, 5.29666662f, 0.49137038f, -0.487666667f, 0.786407411f, -12.8385181f, 3.76962972f, 6.43481493f}
+};
+
+const float feature_test_outputs[4][70] = {
+    {-0.837174535f, 0.0352460928f, -0.944249988f, -0.658958316f, 0.837916195f, 11f, 0.00963542238f, 0.0116085308f, 0.0099286167f, 0.022759065f, -0.122335136f, 0.146198735f, -0.560074091f, 0.777333319f, 0.190630421f, 16f, 0.0562229753f, 0.0474843606f, 0.0769842863f, 0.0742694438f, 0.199782267f, 0.554007232f, -0.906000018f, 2.14199996f, 0.58892864f, 3f, 0.199516624f, 0.155356988f, 0.155790433f, 0.242363781f, -191.245056f, 466.816833f, -2284.08838f, 24.3950005f, 504.472626f, 2f, 275.964539f, 222.732544f, 155.194748f, 68.1780396f, 9.70361233f, 36.5758286f, -19.1333332f, 163.452591f, 37.8411293f, 6f, 21.8819981f, 16.9558182f, 7.99755907f, 14.5923271f, 4.33568811f, 17.8429089f, -28.0077782f, 101.8675f, 18.3621235f, 10f, 7.66078281f, 5.40557384f, 11.0076838f, 7.46411085f, 1.02681363f, 0.175881028f, 0.714384973f, 2.3411274f, 1.04176795f, 197.179321f, 466.242493f, 0.783722341f, 2287.35034f, 506.223022f},
+    {-0.951810241f, 0.0142077524f, -0.98724997f, -0.870000005f, 0.951916277f, 34f, 0.0068565011f, 0.00551242195f, 0.00498146564f, 0.00716940779f, -0.0451145247f, 0.139499649f, -0.387444437f, 0.133000001f, 0.146613345f, 2f, 0.0550290011f, 0.0275183786f, 0.0376834571f, 0.0324070565f, -0.125327468f, 0.190126866f, -0.322185189f, 0.355571419f, 0.22771737f, 1f, 0.0871500522f, 0.0497108363f, 0.0482622683f, 0.0301199984f, -154.945587f, 155.772476f, -550.885437f, 8.66833305f, 219.711624f, 1f, 64.1098862f, 47.1825218f, 36.6572609f, 17.6373234f, 10.9941921f, 14.6587563f, -7.0666666f, 59.3600006f, 18.3235207f, 7f, 8.08950043f, 6.08348417f, 4.96490717f, 4.0297122f, 11.190382f, 13.1850319f, -6.39074087f, 49.3237495f, 17.2936325f, 7f, 4.53374767f, 2.92510486f, 5.7762785f, 3.82560301f, 0.989510715f, 0.0190711953f, 0.932775438f, 1.05358887f, 0.989694536f, 157.479843f, 155.267899f, 1.93412447f, 552.579956f, 221.151581f},
+    {-0.986582518f, 0.00991822965f, -1.02518523f, -0.956125021f, 0.986632347f, 26f, 0.00270108297f, 0.00473186746f, 0.00600623153f, 0.00472697895f, -0.0188297238f, 0.0701095238f, -0.25196296f, 0.176499993f, 0.0725940987f, 17f, 0.0074695074f, 0.0327128433f, 0.0405407064f, 0.0326785818f, -0.0424396209f, 0.0866029188f, -0.339555562f, 0.365249991f, 0.0964426622f, 20f, 0.0281109121f, 0.0477126949f, 0.0511298589f, 0.036936f, -107.729836f, 219.252441f, -879.340027f, 37.5459251f, 244.28949f, 6f, 138.02597f, 80.1349792f, 34.6475143f, 14.3617048f, -0.0986245647f, 13.5324039f, -52.5320816f, 48.7200012f, 13.5327635f, 24f, 5.03108978f, 7.44522238f, 9.38728142f, 3.38988614f, 0.464204878f, 10.4452887f, -21.2166672f, 49.5522232f, 10.4555979f, 15f, 3.61362886f, 6.80265999f, 5.96863651f, 3.73367524f, 0.993811607f, 0.0187883265f, 0.965880394f, 1.09559858f, 0.99398917f, 115.553436f, 215.910187f, 0.909493864f, 881.237f, 244.887329f},
+    {0.539565325f, 0.0534151495f, 0.398333341f, 0.668761909f, 0.54220283f, 5f, 0.0149512766f, 0.011480229f, 0.0152590489f, 0.0197890121f, 0.0501881056f, 0.510607183f, -0.507925928f, 0.733666658f, 0.513067782f, 1f, 0.152342141f, 0.0944548398f, 0.0729711577f, 0.0649858862f, 0.278511077f, 0.617052257f, -0.593407393f, 1.13288891f, 0.676994741f, 1f, 0.216371924f, 0.137883484f, 0.0857538134f, 0.0807001144f, -141.297943f, 279.370483f, -1098.94165f, 26.1566658f, 313.070251f, 2f, 179.623749f, 95.6478348f, 42.0336685f, 28.0233555f, 5.93176222f, 18.8601513f, -23.7611103f, 84.7408371f, 19.7709675f, 16f, 7.63525057f, 6.25874662f, 9.65627766f, 5.93459606f, -2.31311727f, 11.6866531f, -31.6088886f, 19.377037f, 11.9133692f, 15f, 4.05243063f, 6.57398987f, 3.80724907f, 4.34910774f, 1.00597644f, 0.0596300922f, 0.782883704f, 1.25843155f, 1.00774217f, 152.559372f, 274.356415f, 0.837931454f, 1101.93018f, 313.920044f}
+};
@@ -0,0 +1,219 @@
+import hashlib
+import os
+import zlib
+from typing import Optional
+
+import numpy as np
+
+from gestureInference import (
+    MODEL_HEADER_PATH,
+    MODEL_TFLITE_PATH,
+    load_gesture_labels,
+    load_model_sample_interval,
+)
+
+HEADER_BYTES_PER_LINE = 16
+# How the model bytes end up in the header
+HEADER_FORMAT_ARRAY = "array"  # Hex byte array, as train.ipynb always did
+HEADER_FORMAT_EMBED = "embed"  # C23 #embed of a binary file next to the header
+HEADER_FORMAT_ZLIB = "zlib"  # Hex byte array of the zlib compressed model
+HEADER_FORMATS = [HEADER_FORMAT_ARRAY, HEADER_FORMAT_EMBED, HEADER_FORMAT_ZLIB]
+HEADER_EMBED_SUFFIX = ".bin"
+HEADER_ZLIB_LEVEL = 9
+
+# "0x00, " to "0xff, " as rows of ASCII bytes, indexed by the byte they show
+HEADER_HEX_TABLE = np.frombuffer(
+    "".join(f"0x{byte:02x}, " for byte in range(256)).encode("ascii"), dtype=np.uint8
+).reshape(256, 6)
+
+
+# Lines of "    0x1c, 0x00, ...,\n", every byte is looked up in HEADER_HEX_TABLE at once
+def format_c_array(data: bytes, bytes_per_line: int = HEADER_BYTES_PER_LINE) -> str:
+    values = np.frombuffer(data, dtype=np.uint8)
+    full = len(values) - len(values) % bytes_per_line
+    text = ""
+    for chunk, columns in (
+        (values[:full], bytes_per_line),
+        (values[full:], len(values) - full),
+    ):
+        if not len(chunk):
+            continue
+        rows = np.empty((len(chunk) // columns, 4 + 6 * columns), dtype=np.uint8)
+        rows[:, :4] = ord(" ")
+        rows[:, 4:] = HEADER_HEX_TABLE[chunk].reshape(len(rows), -1)
+        # The last ", " of every line becomes ",\n"
+        rows[:, -1] = ord("\n")
+        text += rows.tobytes().decode("ascii")
+    return text
+
+
+# C header with the gesture names, parameter count and the .tflite model, by default as the byte
+# array train.ipynb exported for the MCU. `embed_path` is the binary file #embed includes,
+# relative to the header. `sample_interval` is the grid in milliseconds the model was trained on,
+# only written for a model trained on resampled windows.
+def convert_tflite_to_c_array(
+    tflite_model: bytes,
+    gestures: list[str],
+    parameters: int,
+    bytes_per_line: int = HEADER_BYTES_PER_LINE,
+    header_format: str = HEADER_FORMAT_ARRAY,
+    embed_path: str = "model" + HEADER_EMBED_SUFFIX,
+    sample_interval: Optional[float] = None,
+) -> str:
+    gesture_names = ", ".join(f'"{gesture}"' for gesture in gestures)
+    header = (
+        "#pragma once\n\n"
+        f"const unsigned int gesture_len = {len(gestures)};\n\n"
+        f"const char *gestures[{len(gestures)}] = {{{gesture_names}}};\n\n"
+    )
+    if sample_interval:
+        header += (
+            f"const float model_sample_interval_ms = {float(sample_interval)!r};\n\n"
+        )
+    header += (
+        f"const unsigned int model_parameters = {parameters};\n\n"
+        f"const unsigned int model_data_len = {len(tflite_model)};\n\n"
+    )
+    if header_format == HEADER_FORMAT_ARRAY:
+        c_array = format_c_array(tflite_model, bytes_per_line)
+        return (
+            header
+            + f"const unsigned char model_data[{len(tflite_model)}] PROGMEM = {{\n{c_array}}};\n"
+        )
+    if header_format == HEADER_FORMAT_EMBED:
+        return (
+            header
+            + f"const unsigned char model_data[{len(tflite_model)}] PROGMEM = {{\n"
+            + f'#embed "{embed_path}"\n'
+            + "};\n"
+        )
+    if header_format == HEADER_FORMAT_ZLIB:
+        # Inflated into a model_data_len buffer on the MCU before use
+        compressed = zlib.compress(tflite_model, HEADER_ZLIB_LEVEL)
+        c_array = format_c_array(compressed, bytes_per_line)
+        return (
+            header
+            + f"const unsigned int model_data_zlib_len = {len(compressed)};\n\n"
+            + f"const unsigned char model_data_zlib[{len(compressed)}] PROGMEM = {{\n{c_array}}};\n"
+        )
+    raise ValueError(f"Unknown header format: {header_format}")
+
+
+# Write `content` unless the file already holds exactly that, so builds that depend on it are not
+# triggered by an unchanged model. Returns whether the file was written.
+def write_if_changed(path: str, content: bytes) -> bool:
+    if os.path.exists(path) and os.path.getsize(path) == len(content):
+        with open(path, "rb") as file:
+            if hashlib.sha256(file.read()).digest() == hashlib.sha256(content).digest():
+                return False
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(content)
+    return True
+
+
+# Write the header for `tflite_model`, and the binary it embeds for the embed format. Without a
+# parameter count it is read from the model, which works for the dense models numpyModel
+# understands. Returns whether anything was written.
+def write_model_header(
+    tflite_model: bytes,
+    gestures: list[str],
+    parameters: Optional[int] = None,
+    path: str = MODEL_HEADER_PATH,
+    header_format: str = HEADER_FORMAT_ARRAY,
+    sample_interval: Optional[float] = None,
+) -> bool:
+    if parameters is None:
+        import tempfile
+
+        from numpyModel import numpyModel
+
+        with tempfile.NamedTemporaryFile(suffix=".tflite", delete=False) as file:
+            file.write(tflite_model)
+        try:
+            parameters = numpyModel.from_tflite(file.name).count_params()
+        finally:
+            os.remove(file.name)
+
+    embed_path = os.path.splitext(path)[0] + HEADER_EMBED_SUFFIX
+    header = convert_tflite_to_c_array(
+        tflite_model,
+        gestures,
+        parameters,
+        header_format=header_format,
+        embed_path=os.path.basename(embed_path),
+        sample_interval=sample_interval,
+    )
+    written = False
+    if header_format == HEADER_FORMAT_EMBED:
+        written = write_if_changed(embed_path, tflite_model)
+    # Same line endings as a file written in text mode
+    return write_if_changed(path, header.replace("\n", os.linesep).encode()) or written
+
+
+def main():
+    import argparse
+    from time import perf_counter
+
+    parser = argparse.ArgumentParser(
+        description="Generate the MCU model header from a .tflite model"
+    )
+    parser.add_argument("--tflite", default=MODEL_TFLITE_PATH)
+    parser.add_argument("--output", default=MODEL_HEADER_PATH)
+    parser.add_argument(
+        "--gestures",
+        nargs="+",
+        help=f"model output order, read from the existing header or {MODEL_HEADER_PATH} by default",
+    )
+    parser.add_argument("--parameters", type=int, help="read from the model by default")
+    parser.add_argument("--format", choices=HEADER_FORMATS, default=HEADER_FORMAT_ARRAY)
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        help="grid in ms the model was trained on, read from the existing header by default, "
+        "0 for raw rows",
+    )
+    args = parser.parse_args()
+
+    # A new output path has no header to read them from yet
+    gestures = (
+        args.gestures
+        or load_gesture_labels(args.output)
+        or load_gesture_labels(MODEL_HEADER_PATH)
+    )
+    if not gestures:
+        raise SystemExit(
+            f"No gestures in {args.output} or {MODEL_HEADER_PATH}, pass --gestures"
+        )
+    sample_interval = (
+        args.sample_interval
+        if args.sample_interval is not None
+        else load_model_sample_interval(args.tflite, args.output)
+    )
+    with open(args.tflite, "rb") as file:
+        tflite_model = file.read()
+
+    start_time = perf_counter()
+    written = write_model_header(
+        tflite_model,
+        gestures,
+        args.parameters,
+        args.output,
+        args.format,
+        sample_interval,
+    )
+    elapsed = perf_counter() - start_time
+    print(
+        f"{args.output} {'written' if written else 'unchanged'} in {elapsed * 1e3:.1f} ms: "
+        f"{args.format}, gestures {gestures}, sample interval {sample_interval} ms"
+    )
+
+    compressed = len(zlib.compress(tflite_model, HEADER_ZLIB_LEVEL))
+    print(
+        f"Model {len(tflite_model)} bytes, zlib {compressed} bytes "
+        f"({compressed / len(tflite_model):.0%}), header {os.path.getsize(args.output)} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
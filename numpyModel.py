@@ -0,0 +1,343 @@
+import struct
+from typing import Optional
+
+import numpy as np
+
+MODEL_TFLITE_PATH = "./model/model.tflite"
+MODEL_NPZ_PATH = "./model/model.npz"
+MODEL_PREDICT_CHUNK_SIZE = 4096
+
+# Subset of the TFLite schema (tensorflow/lite/schema/schema.fbs) needed for dense models
+TFLITE_TENSOR_TYPES = {
+    0: np.float32,
+    1: np.float16,
+    2: np.int32,
+    3: np.uint8,
+    4: np.int64,
+    7: np.int16,
+    9: np.int8,
+}
+TFLITE_OP_DEQUANTIZE = 6
+TFLITE_OP_FULLY_CONNECTED = 9
+TFLITE_OP_RELU = 19
+TFLITE_OP_RESHAPE = 22
+TFLITE_OP_SOFTMAX = 25
+TFLITE_OP_QUANTIZE = 114
+TFLITE_FUSED_ACTIVATIONS = {0: "linear", 1: "relu", 3: "relu6", 4: "tanh"}
+
+
+# Minimal read-only view of one flatbuffer table
+class flatbufferTable:
+    def __init__(self, buffer: bytes, position: int) -> None:
+        self.buffer = buffer
+        self.position = position
+        vtable = position - struct.unpack_from("<i", buffer, position)[0]
+        vtable_size = struct.unpack_from("<H", buffer, vtable)[0]
+        self.field_offsets = struct.unpack_from(
+            f"<{(vtable_size - 4) // 2}H", buffer, vtable + 4
+        )
+
+    @classmethod
+    def root(cls, buffer: bytes) -> "flatbufferTable":
+        return cls(buffer, struct.unpack_from("<I", buffer, 0)[0])
+
+    def field_position(self, field: int) -> Optional[int]:
+        if field >= len(self.field_offsets) or not self.field_offsets[field]:
+            return None
+        return self.position + self.field_offsets[field]
+
+    def scalar(self, field: int, fmt: str, default: int | float = 0) -> int | float:
+        position = self.field_position(field)
+        if position is None:
+            return default
+        return struct.unpack_from("<" + fmt, self.buffer, position)[0]
+
+    def table(self, field: int) -> Optional["flatbufferTable"]:
+        position = self.field_position(field)
+        if position is None:
+            return None
+        return flatbufferTable(
+            self.buffer, position + struct.unpack_from("<I", self.buffer, position)[0]
+        )
+
+    # Returns (element position, element count) of a vector field
+    def vector(self, field: int) -> tuple[int, int]:
+        position = self.field_position(field)
+        if position is None:
+            return 0, 0
+        position += struct.unpack_from("<I", self.buffer, position)[0]
+        return position + 4, struct.unpack_from("<I", self.buffer, position)[0]
+
+    def vector_array(self, field: int, dtype) -> np.ndarray:
+        position, count = self.vector(field)
+        return np.frombuffer(self.buffer, dtype=dtype, count=count, offset=position)
+
+    def vector_tables(self, field: int) -> list["flatbufferTable"]:
+        position, count = self.vector(field)
+        tables = []
+        for i in range(count):
+            element = position + 4 * i
+            tables.append(
+                flatbufferTable(
+                    self.buffer,
+                    element + struct.unpack_from("<I", self.buffer, element)[0],
+                )
+            )
+        return tables
+
+
+def apply_activation(x: np.ndarray, activation: str) -> np.ndarray:
+    if activation == "linear":
+        return x
+    if activation == "relu":
+        return np.maximum(x, 0, out=x)
+    if activation == "relu6":
+        return np.clip(x, 0, 6, out=x)
+    if activation == "tanh":
+        return np.tanh(x, out=x)
+    if activation == "sigmoid":
+        return 1 / (1 + np.exp(-x))
+    if activation == "softmax":
+        x = np.exp(x - x.max(axis=-1, keepdims=True))
+        return x / x.sum(axis=-1, keepdims=True)
+    raise ValueError(f"Unsupported activation: {activation}")
+
+
+# A Flatten followed by a stack of Dense layers, evaluated with batched NumPy matmuls
+class numpyModel:
+    def __init__(
+        self,
+        weights: list[np.ndarray],
+        biases: list[np.ndarray],
+        activations: list[str],
+        input_shape: tuple[int, ...],
+        sample_interval: Optional[float] = None,
+    ) -> None:
+        self.weights = [np.ascontiguousarray(w, dtype=np.float32) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.activations = activations
+        self.input_shape = tuple(int(d) for d in input_shape)
+        # Grid in milliseconds the training windows were resampled to, None for raw rows
+        self.sample_interval = sample_interval
+
+    def count_params(self) -> int:
+        return sum(w.size + b.size for w, b in zip(self.weights, self.biases))
+
+    # Evaluate (batch, *input_shape) inputs, returns (batch, classes)
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float32)
+        x = x.reshape(x.shape[0], -1)
+        if len(x) <= MODEL_PREDICT_CHUNK_SIZE:
+            return self.predict_flat(x)
+        return np.concatenate(
+            [
+                self.predict_flat(x[i : i + MODEL_PREDICT_CHUNK_SIZE])
+                for i in range(0, len(x), MODEL_PREDICT_CHUNK_SIZE)
+            ]
+        )
+
+    def predict_flat(self, x: np.ndarray) -> np.ndarray:
+        for weight, bias, activation in zip(
+            self.weights, self.biases, self.activations
+        ):
+            x = x @ weight
+            x += bias
+            x = apply_activation(x, activation)
+        return x
+
+    def save(self, path: str = MODEL_NPZ_PATH) -> None:
+        arrays: dict[str, np.ndarray] = {
+            "input_shape": np.array(self.input_shape),
+            "activations": np.array(self.activations),
+            "sample_interval_ms": np.array(self.sample_interval or 0.0),
+        }
+        for i, (weight, bias) in enumerate(zip(self.weights, self.biases)):
+            arrays[f"weight_{i}"] = weight
+            arrays[f"bias_{i}"] = bias
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str = MODEL_NPZ_PATH) -> "numpyModel":
+        with np.load(path) as arrays:
+            activations = [str(a) for a in arrays["activations"]]
+            return cls(
+                [arrays[f"weight_{i}"] for i in range(len(activations))],
+                [arrays[f"bias_{i}"] for i in range(len(activations))],
+                activations,
+                tuple(arrays["input_shape"]),
+                (
+                    float(arrays["sample_interval_ms"]) or None
+                    if "sample_interval_ms" in arrays.files
+                    else None
+                ),
+            )
+
+    # Extract the dense layers from a Keras model, e.g. the one built in train.ipynb
+    @classmethod
+    def from_keras(cls, model) -> "numpyModel":
+        weights, biases, activations = [], [], []
+        for layer in model.layers:
+            config = layer.get_config()
+            if "units" in config:
+                kernel, bias = layer.get_weights()
+                weights.append(kernel)
+                biases.append(bias)
+                activations.append(config.get("activation", "linear"))
+            elif layer.__class__.__name__ in ("Activation", "Softmax", "ReLU"):
+                name = config.get("activation", layer.__class__.__name__.lower())
+                if not activations or activations[-1] != "linear":
+                    raise ValueError(f"Unsupported layer: {layer.name}")
+                activations[-1] = name
+            elif layer.__class__.__name__ not in ("Flatten", "InputLayer", "Dropout"):
+                raise ValueError(f"Unsupported layer: {layer.name}")
+        return cls(weights, biases, activations, tuple(model.input_shape[1:]))
+
+    # Extract the dense layers directly from a .tflite flatbuffer, no TensorFlow needed
+    @classmethod
+    def from_tflite(cls, path: str = MODEL_TFLITE_PATH) -> "numpyModel":
+        with open(path, "rb") as file:
+            buffer = file.read()
+
+        model = flatbufferTable.root(buffer)
+        opcodes = [
+            max(int(op.scalar(0, "b")), int(op.scalar(3, "i")))
+            for op in model.vector_tables(1)
+        ]
+        buffers = model.vector_tables(4)
+        subgraph = model.vector_tables(2)[0]
+        tensors = subgraph.vector_tables(0)
+        input_tensor = int(subgraph.vector_array(1, np.int32)[0])
+        input_shape = tuple(tensors[input_tensor].vector_array(0, np.int32)[1:])
+
+        # Constant tensors, dequantized to float32. Outputs of DEQUANTIZE ops are constants too.
+        def constant(index: int) -> np.ndarray:
+            if index in dequantized:
+                return dequantized[index]
+            tensor = tensors[index]
+            dtype = TFLITE_TENSOR_TYPES[int(tensor.scalar(1, "b"))]
+            shape = tuple(tensor.vector_array(0, np.int32))
+            data = buffers[int(tensor.scalar(2, "I"))].vector_array(0, np.uint8)
+            if not data.size:
+                raise ValueError(f"Tensor {index} is not a constant")
+            array = np.frombuffer(data.tobytes(), dtype=dtype).reshape(shape)
+            quantization = tensor.table(4)
+            if quantization is not None and dtype in (np.int8, np.uint8, np.int32):
+                scale = quantization.vector_array(2, np.float32)
+                zero_point = quantization.vector_array(3, np.int64)
+                if scale.size:
+                    # Per-channel scales apply along the output dimension
+                    scale = scale.reshape((-1,) + (1,) * (array.ndim - 1))
+                    zero_point = zero_point.reshape((-1,) + (1,) * (array.ndim - 1))
+                    return ((array - zero_point) * scale).astype(np.float32)
+            return array.astype(np.float32)
+
+        dequantized: dict[int, np.ndarray] = {}
+        weights, biases, activations = [], [], []
+        for operator in subgraph.vector_tables(3):
+            opcode = opcodes[int(operator.scalar(0, "I"))]
+            inputs = operator.vector_array(1, np.int32)
+            outputs = operator.vector_array(2, np.int32)
+
+            if opcode == TFLITE_OP_FULLY_CONNECTED:
+                weight = constant(int(inputs[1]))
+                if len(inputs) > 2 and inputs[2] >= 0:
+                    bias = constant(int(inputs[2]))
+                else:
+                    bias = np.zeros(weight.shape[0], dtype=np.float32)
+                options = operator.table(4)
+                activation = int(options.scalar(0, "b")) if options else 0
+                if activation not in TFLITE_FUSED_ACTIVATIONS:
+                    raise ValueError(f"Unsupported fused activation: {activation}")
+                weights.append(weight.T)
+                biases.append(bias)
+                activations.append(TFLITE_FUSED_ACTIVATIONS[activation])
+            elif opcode in (TFLITE_OP_SOFTMAX, TFLITE_OP_RELU):
+                if not activations or activations[-1] != "linear":
+                    raise ValueError("Activation must follow a linear dense layer")
+                activations[-1] = "softmax" if opcode == TFLITE_OP_SOFTMAX else "relu"
+            elif opcode == TFLITE_OP_DEQUANTIZE:
+                # Float16 models store their weights as constants followed by DEQUANTIZE
+                try:
+                    dequantized[int(outputs[0])] = constant(int(inputs[0]))
+                except ValueError:
+                    pass
+            elif opcode not in (TFLITE_OP_RESHAPE, TFLITE_OP_QUANTIZE):
+                raise ValueError(f"Unsupported TFLite operator: {opcode}")
+
+        return cls(weights, biases, activations, input_shape)
+
+
+# Load a model from .npz, or extract it from a .tflite file
+def load_model(path: str) -> numpyModel:
+    if path.endswith(".npz"):
+        return numpyModel.load(path)
+    return numpyModel.from_tflite(path)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Export a dense .tflite model to .npz and check it against the TFLite interpreter"
+    )
+    parser.add_argument("--tflite", default=MODEL_TFLITE_PATH)
+    parser.add_argument("--npz", default=MODEL_NPZ_PATH)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="compare outputs with the TFLite interpreter on every savedata sample",
+    )
+    args = parser.parse_args()
+
+    from gestureInference import load_model_sample_interval
+
+    model = numpyModel.from_tflite(args.tflite)
+    # The .tflite file does not know its grid, the header exported with it does
+    model.sample_interval = load_model_sample_interval(args.tflite)
+    model.save(args.npz)
+    print(
+        f"Saved {args.npz}: {len(model.weights)} dense layers, {model.count_params()} parameters, "
+        f"activations {model.activations}, sample interval {model.sample_interval} ms"
+    )
+
+    if not args.check:
+        return
+
+    from time import perf_counter
+    from gestureInference import load_tflite_interpreter, run_tflite
+    from sampleData import get_gestures, load_gesture_samples
+
+    samples = np.concatenate(
+        [
+            load_gesture_samples(g, resample_interval=model.sample_interval)[1]
+            for g in get_gestures()
+        ]
+    )
+    model = numpyModel.load(args.npz)
+
+    start_time = perf_counter()
+    numpy_output = model.predict(samples)
+    numpy_time = perf_counter() - start_time
+
+    interpreter = load_tflite_interpreter(args.tflite)
+    start_time = perf_counter()
+    tflite_output = np.concatenate(
+        [
+            run_tflite(interpreter, sample[np.newaxis])
+            for sample in samples.astype(np.float32)
+        ]
+    )
+    tflite_time = perf_counter() - start_time
+
+    max_error = float(np.abs(numpy_output - tflite_output).max())
+    agreement = float(np.mean(numpy_output.argmax(1) == tflite_output.argmax(1)))
+    print(
+        f"{len(samples)} samples, max abs error {max_error:.2e}, argmax agreement {agreement:.2%}"
+    )
+    print(f"NumPy {numpy_time * 1000:.1f} ms, TFLite {tflite_time * 1000:.1f} ms")
+    if max_error > 1e-4 or agreement < 1:
+        raise SystemExit("Parity check failed")
+
+
+if __name__ == "__main__":
+    main()
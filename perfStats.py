@@ -0,0 +1,171 @@
+import csv
+import json
+from time import perf_counter, perf_counter_ns
+from typing import Callable
+
+PERF_HISTOGRAM_SUB_BUCKETS = 4  # Buckets per power of two, about 19% resolution
+PERF_HISTOGRAM_MAX_BITS = 40  # Up to ~18 minutes in nanoseconds
+PERF_PERCENTILES = (50, 90, 99, 99.9)
+
+
+# Fixed size log-linear histogram of durations in nanoseconds, recording is O(1) and allocation free
+class latencyHistogram:
+    def __init__(self) -> None:
+        self.counts: list[int] = [0] * (
+            PERF_HISTOGRAM_MAX_BITS * PERF_HISTOGRAM_SUB_BUCKETS
+        )
+        self.count: int = 0
+        self.total: int = 0
+        self.max: int = 0
+
+    @staticmethod
+    def bucket(duration: int) -> int:
+        bits = duration.bit_length()
+        if bits <= 2:
+            return duration
+        # Top two bits after the leading one pick the sub bucket
+        index = (bits - 2) * PERF_HISTOGRAM_SUB_BUCKETS + ((duration >> (bits - 3)) & 3)
+        return min(index, PERF_HISTOGRAM_MAX_BITS * PERF_HISTOGRAM_SUB_BUCKETS - 1)
+
+    # Smallest duration that falls in a bucket
+    @staticmethod
+    def bucket_floor(index: int) -> int:
+        if index < PERF_HISTOGRAM_SUB_BUCKETS:
+            return index
+        bits = index // PERF_HISTOGRAM_SUB_BUCKETS + 2
+        return (4 + index % PERF_HISTOGRAM_SUB_BUCKETS) << (bits - 3)
+
+    def record(self, duration: int) -> None:
+        self.counts[self.bucket(duration)] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def percentile(self, percentile: float) -> int:
+        if not self.count:
+            return 0
+        target = self.count * percentile / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.bucket_floor(index + 1), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def clear(self) -> None:
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+
+# Monotonic event counter, the rate is measured between two snapshots
+class perfCounter:
+    def __init__(self) -> None:
+        self.total: int = 0
+        self.last_total: int = 0
+        self.last_time: float = perf_counter()
+        self.rate: float = 0.0
+
+    def add(self, count: int = 1) -> None:
+        self.total += count
+
+    def update_rate(self, now: float) -> float:
+        elapsed = now - self.last_time
+        if elapsed > 0:
+            self.rate = (self.total - self.last_total) / elapsed
+        self.last_total = self.total
+        self.last_time = now
+        return self.rate
+
+
+# Named histograms, counters and gauges. Hooks check `enabled` before timing anything.
+class perfStats:
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.stages: dict[str, latencyHistogram] = {}
+        self.counters: dict[str, perfCounter] = {}
+        self.gauges: dict[str, float] = {}
+        self.sources: dict[str, Callable[[], dict[str, float]]] = {}
+
+    def record(self, stage: str, duration: int) -> None:
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = latencyHistogram()
+        histogram.record(duration)
+
+    # Record the time since `start_time`, which came from perf_counter_ns()
+    def record_since(self, stage: str, start_time: int) -> None:
+        self.record(stage, perf_counter_ns() - start_time)
+
+    def count(self, counter: str, count: int = 1) -> None:
+        stat = self.counters.get(counter)
+        if stat is None:
+            stat = self.counters[counter] = perfCounter()
+        stat.add(count)
+
+    def gauge(self, name: str, value: float) -> None:
+        self.gauges[name] = value
+
+    # Gauges computed when a snapshot is taken, named "<source>_<gauge>"
+    def add_source(self, name: str, source: Callable[[], dict[str, float]]) -> None:
+        self.sources[name] = source
+
+    def remove_source(self, name: str) -> None:
+        self.sources.pop(name, None)
+
+    def clear(self) -> None:
+        self.stages.clear()
+        self.counters.clear()
+        self.gauges.clear()
+
+    # Current numbers, latencies in milliseconds. Rates are measured since the previous snapshot.
+    def snapshot(self) -> dict:
+        now = perf_counter()
+        stages = {}
+        for name, histogram in list(self.stages.items()):
+            stage = {
+                "count": histogram.count,
+                "mean_ms": histogram.mean() / 1e6,
+                "max_ms": histogram.max / 1e6,
+            }
+            for percentile in PERF_PERCENTILES:
+                stage[f"p{percentile:g}_ms"] = histogram.percentile(percentile) / 1e6
+            stages[name] = stage
+
+        counters = {
+            name: {"total": counter.total, "per_second": counter.update_rate(now)}
+            for name, counter in list(self.counters.items())
+        }
+        gauges = dict(self.gauges)
+        for source_name, source in list(self.sources.items()):
+            for name, value in source().items():
+                gauges[f"{source_name}_{name}"] = value
+        return {"stages": stages, "counters": counters, "gauges": gauges}
+
+    def export_json(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(self.snapshot(), file, indent=2)
+
+    # One row per stage, counter and gauge
+    def export_csv(self, path: str) -> None:
+        snapshot = self.snapshot()
+        with open(path, mode="w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["kind", "name", "metric", "value"])
+            for name, stage in snapshot["stages"].items():
+                for metric, value in stage.items():
+                    writer.writerow(["stage", name, metric, value])
+            for name, counter in snapshot["counters"].items():
+                for metric, value in counter.items():
+                    writer.writerow(["counter", name, metric, value])
+            for name, value in snapshot["gauges"].items():
+                writer.writerow(["gauge", name, "value", value])
+
+
+# Shared by every module of the app
+perf_stats = perfStats()
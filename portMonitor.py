@@ -0,0 +1,176 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from time import sleep
+from typing import Callable, List, Optional
+
+PORT_MONITOR_DEV_FOLDER = "/dev"
+PORT_MONITOR_POLL_INTERVAL = 1.0  # Seconds between two scans without inotify
+PORT_MONITOR_WAKE_INTERVAL = 0.5  # Seconds between two checks of `killed`
+PORT_MONITOR_SETTLE_TIME = 0.1  # Let udev finish with a new node before scanning
+PORT_MONITOR_PREFIXES = ("tty", "cu.", "rfcomm", "serial")
+
+# From <sys/inotify.h>
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+# Watch `folder` with inotify, returns the file descriptor or None where inotify is not available
+def open_inotify(folder: str) -> Optional[int]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    mask = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+    if libc.inotify_add_watch(fd, folder.encode(), mask) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+# Names of the nodes created or removed in a buffer of inotify events
+def inotify_names(buffer: bytes) -> List[str]:
+    names: List[str] = []
+    offset = 0
+    while offset + IN_EVENT_HEADER.size <= len(buffer):
+        _, _, _, length = IN_EVENT_HEADER.unpack_from(buffer, offset)
+        offset += IN_EVENT_HEADER.size
+        names.append(
+            buffer[offset : offset + length].rstrip(b"\0").decode(errors="replace")
+        )
+        offset += length
+    return names
+
+
+# Calls `ports_changed_callback(added, removed)` when serial ports come and go.
+# On Linux it sleeps on inotify events for `/dev` and only enumerates the ports when a serial-like
+# node is created or removed; elsewhere it falls back to enumerating every second.
+class portMonitor:
+    def __init__(
+        self,
+        get_ports: Callable[[], List[str]],
+        ports_changed_callback: Optional[Callable[[List[str], List[str]], None]] = None,
+        log_callback: Optional[Callable[[str], None]] = None,
+        folder: str = PORT_MONITOR_DEV_FOLDER,
+        use_inotify: bool = True,
+    ) -> None:
+        self.get_ports = get_ports
+        self.ports_changed_callback = ports_changed_callback
+        self.log_callback = log_callback
+        self.folder = folder
+        self.killed: bool = False
+        self.current_ports: List[str] = get_ports()
+
+        self.inotify_fd: Optional[int] = open_inotify(folder) if use_inotify else None
+        self.backend: str = "inotify" if self.inotify_fd is not None else "polling"
+        self.thread = threading.Thread(
+            target=(
+                self.watch_inotify
+                if self.inotify_fd is not None
+                else self.watch_polling
+            ),
+            daemon=True,
+        )
+        self.thread.start()
+
+    def log(self, message: str) -> None:
+        if self.log_callback:
+            self.log_callback(message)
+
+    # Compare with the last scan and report the difference, if any
+    def scan(self) -> None:
+        ports = self.get_ports()
+        added = [port for port in ports if port not in self.current_ports]
+        removed = [port for port in self.current_ports if port not in ports]
+        self.current_ports = ports
+        if (added or removed) and self.ports_changed_callback:
+            self.ports_changed_callback(added, removed)
+
+    def watch_polling(self) -> None:
+        while not self.killed:
+            sleep(PORT_MONITOR_POLL_INTERVAL)
+            self.scan()
+
+    def watch_inotify(self) -> None:
+        assert self.inotify_fd is not None
+        while not self.killed:
+            readable, _, _ = select.select(
+                [self.inotify_fd], [], [], PORT_MONITOR_WAKE_INTERVAL
+            )
+            if not readable:
+                continue
+            try:
+                names = inotify_names(os.read(self.inotify_fd, 4096))
+            except BlockingIOError:
+                continue
+            except OSError as err:
+                self.log(f"Port monitor falls back to polling: {err}")
+                self.backend = "polling"
+                self.watch_polling()
+                return
+
+            if any(name.startswith(PORT_MONITOR_PREFIXES) for name in names):
+                sleep(PORT_MONITOR_SETTLE_TIME)
+                # Drain the events of the same plug, one scan covers them all
+                try:
+                    os.read(self.inotify_fd, 4096)
+                except BlockingIOError:
+                    pass
+                self.scan()
+
+    # Re-scan now, e.g. after a virtual port was added
+    def refresh(self) -> None:
+        self.scan()
+
+    def close(self) -> None:
+        self.killed = True
+        self.thread.join(timeout=1)
+        if self.thread.is_alive():
+            print("port_monitor_thread did not exit in time")
+        if self.inotify_fd is not None:
+            os.close(self.inotify_fd)
+            self.inotify_fd = None
+
+
+if __name__ == "__main__":
+    import tempfile
+    from time import perf_counter
+
+    # Nodes created in a scratch folder stand in for plugged boards
+    folder = tempfile.mkdtemp()
+    changes: List[tuple[float, List[str], List[str]]] = []
+    monitor = portMonitor(
+        get_ports=lambda: sorted(f"{folder}/{name}" for name in os.listdir(folder)),
+        ports_changed_callback=lambda added, removed: changes.append(
+            (perf_counter(), added, removed)
+        ),
+        folder=folder,
+    )
+    print(f"Backend: {monitor.backend}")
+    for action in ("add", "remove"):
+        start_time = perf_counter()
+        if action == "add":
+            open(f"{folder}/ttyACM0", "w").close()
+        else:
+            os.remove(f"{folder}/ttyACM0")
+        while len(changes) < (1 if action == "add" else 2):
+            sleep(0.005)
+        change_time, added, removed = changes[-1]
+        print(
+            f"{action}: added {added}, removed {removed} "
+            f"after {(change_time - start_time) * 1000:.0f} ms"
+        )
+    monitor.close()
+    os.rmdir(folder)
@@ -0,0 +1,235 @@
+import os
+import shutil
+from time import perf_counter
+from typing import Iterator, Optional
+
+import numpy as np
+
+from batchScore import SCORE_TFLITE_BATCH_SIZE, load_savedata
+from gestureInference import (
+    MODEL_HEADER_PATH,
+    MODEL_TFLITE_PATH,
+    load_gesture_labels,
+    load_model_sample_interval,
+    load_tflite_interpreter,
+    run_tflite,
+)
+from modelHeader import HEADER_FORMAT_ARRAY, HEADER_FORMATS, write_model_header
+from sampleData import SAVEDATA_FOLDER_PATH, get_gestures
+from sweepRunner import import_keras, measure_latency
+
+QUANT_KERAS_PATH = "./model/model.keras"
+QUANT_VARIANT_PATH = "./model/model_{variant}.tflite"
+# float32 is the reference the others are compared with, it is always exported
+QUANT_VARIANTS = ["float32", "float16", "int8"]
+QUANT_REPRESENTATIVE_SAMPLES = 200
+QUANT_MAX_ACCURACY_DROP = 0.01  # Larger drops against float32 are flagged
+
+
+# Samples the int8 converter calibrates its value ranges on, drawn evenly from savedata
+def representative_dataset(
+    samples: np.ndarray,
+    count: int = QUANT_REPRESENTATIVE_SAMPLES,
+    seed: Optional[int] = None,
+) -> Iterator[list[np.ndarray]]:
+    rng = np.random.default_rng(seed)
+    chosen = rng.choice(len(samples), min(count, len(samples)), replace=False)
+    for index in chosen:
+        yield [samples[index : index + 1].astype(np.float32)]
+
+
+# .tflite bytes of a Keras model, float16 only stores the weights as half floats, int8 runs the
+# whole model including its input and output in 8 bit integers
+def convert_variant(
+    model,
+    variant: str,
+    samples: np.ndarray,
+    representative_samples: int = QUANT_REPRESENTATIVE_SAMPLES,
+    seed: Optional[int] = None,
+) -> bytes:
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if variant == "float16":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif variant == "int8":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = lambda: representative_dataset(
+            samples, representative_samples, seed
+        )
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+    elif variant != "float32":
+        raise ValueError(f"Unknown variant: {variant}")
+    return converter.convert()
+
+
+# (N, classes) probabilities of a .tflite model, quantized inputs and outputs are converted
+def predict_tflite(path: str, samples: np.ndarray) -> np.ndarray:
+    interpreter = load_tflite_interpreter(path)
+    return np.concatenate(
+        [
+            run_tflite(interpreter, samples[i : i + SCORE_TFLITE_BATCH_SIZE])
+            for i in range(0, len(samples), SCORE_TFLITE_BATCH_SIZE)
+        ]
+    )
+
+
+# Accuracy, agreement with the reference and cost of one exported variant, along with its
+# probabilities for every sample
+def evaluate_variant(
+    path: str,
+    samples: np.ndarray,
+    classes: np.ndarray,
+    reference: Optional[np.ndarray] = None,
+) -> dict:
+    from numpyModel import numpyModel
+
+    with open(path, "rb") as file:
+        tflite_model = file.read()
+    probabilities = predict_tflite(path, samples)
+    predicted = probabilities.argmax(axis=1)
+    result = {
+        "probabilities": probabilities,
+        "bytes": len(tflite_model),
+        "accuracy": float(np.mean(predicted == classes)),
+        "latency_us": measure_latency(tflite_model, samples[:1]),
+    }
+    try:
+        result["parameters"] = numpyModel.from_tflite(path).count_params()
+    except ValueError:
+        result["parameters"] = None
+    if reference is None:
+        result["agreement"], result["max_error"] = float("nan"), float("nan")
+    else:
+        result["agreement"] = float(np.mean(predicted == reference.argmax(axis=1)))
+        result["max_error"] = float(np.abs(probabilities - reference).max())
+    return result
+
+
+# Make `variant` the model the app and the MCU use, ./model/model.tflite and ./model/model.h
+def select_variant(
+    variant: str,
+    gestures: list[str],
+    parameters: Optional[int] = None,
+    tflite_path: str = MODEL_TFLITE_PATH,
+    header_path: str = MODEL_HEADER_PATH,
+    header_format: str = HEADER_FORMAT_ARRAY,
+) -> None:
+    path = QUANT_VARIANT_PATH.format(variant=variant)
+    with open(path, "rb") as file:
+        tflite_model = file.read()
+    # The variants are trained on the same grid as the model they replace
+    write_model_header(
+        tflite_model,
+        gestures,
+        parameters,
+        header_path,
+        header_format,
+        load_model_sample_interval(tflite_path, header_path),
+    )
+    if os.path.abspath(path) != os.path.abspath(tflite_path):
+        shutil.copyfile(path, tflite_path)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Export float16 and int8 variants of the model and compare them with float32"
+    )
+    parser.add_argument("--keras", default=QUANT_KERAS_PATH)
+    parser.add_argument(
+        "--variants", nargs="+", choices=QUANT_VARIANTS, default=QUANT_VARIANTS
+    )
+    parser.add_argument(
+        "--representative", type=int, default=QUANT_REPRESENTATIVE_SAMPLES
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--savedata", default=SAVEDATA_FOLDER_PATH)
+    parser.add_argument(
+        "--skip-convert",
+        action="store_true",
+        help="only evaluate the variants exported earlier, no TensorFlow needed",
+    )
+    parser.add_argument(
+        "--header",
+        choices=QUANT_VARIANTS,
+        help="variant written to model.tflite and model.h",
+    )
+    parser.add_argument(
+        "--header-format", choices=HEADER_FORMATS, default=HEADER_FORMAT_ARRAY
+    )
+    args = parser.parse_args()
+
+    # Model output order, kept from the exported header
+    gestures = load_gesture_labels() or get_gestures(args.savedata)
+    # Calibrated and scored on the grid the exported model was trained on
+    names, samples = load_savedata(args.savedata, load_model_sample_interval())
+    if not names:
+        raise SystemExit(f"No samples found in {args.savedata}")
+    samples = samples.astype(np.float32)
+    classes = np.array([gestures.index(g) if g in gestures else -1 for g, _ in names])
+    variants = ["float32"] + [v for v in args.variants if v != "float32"]
+
+    parameters: Optional[int] = None
+    if not args.skip_convert:
+        model = import_keras().models.load_model(args.keras)
+        parameters = model.count_params()
+        for variant in variants:
+            start_time = perf_counter()
+            tflite_model = convert_variant(
+                model, variant, samples, args.representative, args.seed
+            )
+            path = QUANT_VARIANT_PATH.format(variant=variant)
+            with open(path, "wb") as file:
+                file.write(tflite_model)
+            print(f"Converted {path} in {perf_counter() - start_time:.1f} s")
+
+    print(f"\n{len(samples)} samples, latency of one window on this host")
+    print(
+        f"{'variant':>8s} {'bytes':>8s} {'params':>7s} {'accuracy':>9s} "
+        f"{'agree':>7s} {'max err':>8s} {'latency':>10s}"
+    )
+    reference: Optional[np.ndarray] = None
+    results: dict[str, dict] = {}
+    for variant in variants:
+        path = QUANT_VARIANT_PATH.format(variant=variant)
+        if not os.path.exists(path):
+            print(f"{variant:>8s} missing {path}")
+            continue
+        result = evaluate_variant(path, samples, classes, reference)
+        results[variant] = result
+        if variant == "float32":
+            reference = result["probabilities"]
+            result["agreement"], result["max_error"] = 1.0, 0.0
+        params = result["parameters"] if result["parameters"] is not None else "-"
+        print(
+            f"{variant:>8s} {result['bytes']:8d} {params:>7} {result['accuracy']:9.2%} "
+            f"{result['agreement']:7.2%} {result['max_error']:8.4f} "
+            f"{result['latency_us']:8.1f}us"
+        )
+
+    baseline = results.get("float32")
+    if baseline:
+        for variant, result in results.items():
+            drop = baseline["accuracy"] - result["accuracy"]
+            if drop > QUANT_MAX_ACCURACY_DROP:
+                print(f"Warning: {variant} loses {drop:.2%} accuracy against float32")
+
+    if args.header:
+        if args.header not in results:
+            raise SystemExit(f"No {args.header} variant to select")
+        select_variant(
+            args.header,
+            gestures,
+            parameters or results[args.header]["parameters"],
+            header_format=args.header_format,
+        )
+        print(f"\n{args.header} written to {MODEL_TFLITE_PATH} and {MODEL_HEADER_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+import csv
+import os
+import queue
+import threading
+from time import perf_counter, sleep
+from typing import Callable, Iterable, Iterator, Optional
+from urllib.parse import parse_qs
+
+from imuParser import SERIAL_RESULT_PREFIX, format_imu_line, parse_imu_line
+from serialHandler import REPLAY_PORT_PREFIX
+
+REPLAY_SAMPLE_GAP_MS = 500
+REPLAY_QUEUE_SIZE = 10000
+REPLAY_MIN_SLEEP = 0.001
+
+
+# Expand files and folders to the list of files to replay, folders are walked recursively
+def find_replay_files(paths: Iterable[str]) -> list[str]:
+    files: list[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, names in sorted(os.walk(path)):
+                files.extend(
+                    os.path.join(folder, name)
+                    for name in sorted(names)
+                    if name.endswith((".csv", ".log", ".txt"))
+                )
+        else:
+            files.append(path)
+    return files
+
+
+# Yields (device timestamp in ms, [aX, aY, aZ, gX, gY, gZ]) for a saved .csv sample
+def csv_sample_rows(path: str) -> Iterator[tuple[int, list[float]]]:
+    with open(path, mode="r", newline="") as file:
+        reader = csv.reader(file)
+        next(reader, None)
+        for row in reader:
+            if len(row) < 7:
+                continue
+            yield int(float(row[0])), [float(value) for value in row[1:7]]
+
+
+# Yields (device timestamp in ms, line) for a raw serial log, lines without a timestamp yield None
+def log_lines(path: str) -> Iterator[tuple[Optional[int], str]]:
+    with open(path, mode="r", encoding="utf-8", errors="replace") as file:
+        for line in file:
+            line = line.rstrip("\r\n")
+            sample = parse_imu_line(line)
+            yield (sample.timestamp if sample else None), line
+
+
+# Every file one after another, the device clock keeps running between .csv samples
+def replay_lines(
+    files: list[str], results: bool = False
+) -> Iterator[tuple[Optional[int], str]]:
+    last_timestamp: Optional[int] = None
+    for path in files:
+        if not path.endswith(".csv"):
+            yield from log_lines(path)
+            continue
+
+        rows = list(csv_sample_rows(path))
+        if not rows:
+            continue
+        offset = 0
+        if last_timestamp is not None:
+            offset = last_timestamp + REPLAY_SAMPLE_GAP_MS - rows[0][0]
+        for timestamp, values in rows:
+            last_timestamp = timestamp + offset
+            yield last_timestamp, format_imu_line(last_timestamp, values)
+
+        # The folder name is the gesture the sample was saved as
+        if results:
+            gesture = os.path.basename(os.path.dirname(os.path.abspath(path)))
+            yield last_timestamp, f"{SERIAL_RESULT_PREFIX} {gesture}"
+
+
+class replaySource:
+    def __init__(
+        self,
+        files: list[str],
+        speed: float = 1.0,
+        loop: bool = False,
+        results: bool = False,
+    ) -> None:
+        self.files = files
+        self.speed = speed  # 0 replays as fast as possible
+        self.loop = loop
+        self.results = results
+        self.killed: bool = False
+        self.lines_sent: int = 0
+
+    # Yields (seconds after the first line the line is due, line), the due time is None when the
+    # line is not paced. Due times never go back: when the timestamps of a raw log do (a device
+    # reset or an out of order line), the replay carries on from the latest due time instead of
+    # bursting. Loops keep counting up, with a gap between two passes.
+    def timed_lines(self) -> Iterator[tuple[Optional[float], str]]:
+        pass_offset: float = 0.0
+        while not self.killed:
+            first_timestamp: Optional[float] = None
+            latest: float = pass_offset
+            for timestamp, line in replay_lines(self.files, self.results):
+                if self.killed:
+                    return
+
+                due = None
+                if self.speed > 0 and timestamp is not None:
+                    if first_timestamp is None:
+                        first_timestamp = timestamp
+                    due = (
+                        pass_offset + (timestamp - first_timestamp) / 1000 / self.speed
+                    )
+                    if due < latest:
+                        first_timestamp -= (latest - due) * 1000 * self.speed
+                        due = latest
+                    latest = due
+                yield due, line
+
+            if not self.loop:
+                return
+            if self.speed > 0:
+                pass_offset = latest + REPLAY_SAMPLE_GAP_MS / 1000 / self.speed
+
+    # Write every line with `write`, paced by the device timestamps
+    def run(self, write: Callable[[str], None]) -> None:
+        start_time = perf_counter()
+        for due, line in self.timed_lines():
+            if due is not None:
+                delay = start_time + due - perf_counter()
+                if delay > REPLAY_MIN_SLEEP:
+                    sleep(delay)
+
+            write(line + "\n")
+            self.lines_sent += 1
+
+    def close(self) -> None:
+        self.killed = True
+
+
+# In-process transport, has the parts of serial.Serial that serialHandler uses
+class replayPort:
+    def __init__(self, source: replaySource, name: str = "replay") -> None:
+        self.source = source
+        self.name = name
+        self.is_open: bool = True
+        self.lines: queue.Queue[bytes] = queue.Queue(maxsize=REPLAY_QUEUE_SIZE)
+        self.replay_thread = threading.Thread(target=self.run, daemon=True)
+        self.replay_thread.start()
+
+    def run(self) -> None:
+        def write(line: str) -> None:
+            # Block like a full UART buffer would, but give up once closed
+            data = line.encode("utf-8")
+            while self.is_open:
+                try:
+                    self.lines.put(data, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        self.source.run(write)
+
+    def readline(self) -> bytes:
+        if not self.is_open:
+            return b""
+        try:
+            return self.lines.get(timeout=1.0)
+        except queue.Empty:
+            return b""
+
+    @property
+    def in_waiting(self) -> int:
+        return self.lines.qsize()
+
+    def close(self) -> None:
+        self.is_open = False
+        self.source.close()
+
+
+# Pseudo-terminal transport (POSIX only), any serial client can open `port`
+class ptyReplay:
+    def __init__(self, source: replaySource) -> None:
+        import tty
+
+        self.source = source
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        self.port: str = os.ttyname(self.slave_fd)
+        self.replay_thread = threading.Thread(target=self.run, daemon=True)
+        self.replay_thread.start()
+
+    def run(self) -> None:
+        def write(line: str) -> None:
+            data = line.encode("utf-8")
+            while data:
+                written = os.write(self.master_fd, data)
+                data = data[written:]
+
+        try:
+            self.source.run(write)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self.source.close()
+        self.replay_thread.join(timeout=1)
+        os.close(self.master_fd)
+        os.close(self.slave_fd)
+
+
+# Port name understood by serialHandler.connect, e.g. "replay:./savedata/left?speed=2&loop=1"
+def make_replay_port_name(
+    path: str, speed: float = 1.0, loop: bool = False, results: bool = False
+) -> str:
+    return f"{REPLAY_PORT_PREFIX}{path}?speed={speed:g}&loop={int(loop)}&results={int(results)}"
+
+
+def open_replay_port(name: str) -> replayPort:
+    return replayPort(open_replay_source(name), name=name)
+
+
+# Source described by a replay port name, see make_replay_port_name
+def open_replay_source(name: str) -> replaySource:
+    path, _, query = name[len(REPLAY_PORT_PREFIX) :].partition("?")
+    options = {key: values[-1] for key, values in parse_qs(query).items()}
+    files = find_replay_files(path.split(","))
+    if not files:
+        raise FileNotFoundError(f"Nothing to replay in [{path}]")
+
+    return replaySource(
+        files,
+        speed=float(options.get("speed", 1.0)),
+        loop=options.get("loop", "0") == "1",
+        results=options.get("results", "0") == "1",
+    )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Replay saved .csv samples or raw serial logs as if they came from the MCU"
+    )
+    parser.add_argument("paths", nargs="+", help=".csv samples, raw logs or folders")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="1 = real time, 0 = as fast as possible",
+    )
+    parser.add_argument("--loop", action="store_true")
+    parser.add_argument(
+        "--results",
+        action="store_true",
+        help="emit a [Res] line after each .csv sample",
+    )
+    parser.add_argument(
+        "--stdout", action="store_true", help="print lines instead of opening a pty"
+    )
+    args = parser.parse_args()
+
+    source = replaySource(
+        find_replay_files(args.paths), args.speed, args.loop, args.results
+    )
+
+    if args.stdout:
+        source.run(lambda line: print(line, end=""))
+        return
+
+    pty = ptyReplay(source)
+    print(f"Replaying {len(source.files)} files on [{pty.port}], Ctrl+C to stop")
+    try:
+        while pty.replay_thread.is_alive():
+            sleep(0.5)
+    except KeyboardInterrupt:
+        print("Exiting...")
+    print(f"{source.lines_sent} lines sent")
+    pty.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+from typing import Optional
+
+import numpy as np
+
+# The saved 120 sample windows span about one second, 120 Hz keeps them at 120 rows
+RESAMPLE_INTERVAL_MS = 1000 / 120
+RESAMPLE_MAX_GAP_MS = 50.0  # Longer steps are gaps, nothing is interpolated across them
+
+
+# Turns samples with jittery device timestamps into samples on an exact time grid.
+# Grid points are linearly interpolated between the two samples around them, the last sample of a
+# batch is kept so the next batch continues the same grid. A gap longer than `max_gap` or a
+# timestamp going backwards (device reset) starts a new grid at the next sample.
+class streamResampler:
+    def __init__(
+        self,
+        interval: float = RESAMPLE_INTERVAL_MS,
+        max_gap: float = RESAMPLE_MAX_GAP_MS,
+    ) -> None:
+        self.interval = interval
+        self.max_gap = max_gap
+        self.reset()
+
+    def reset(self) -> None:
+        self.last_timestamp: Optional[float] = None
+        self.last_values: Optional[np.ndarray] = None
+        # Grid point `index` is at `origin + index * interval`, no accumulated rounding
+        self.origin: float = 0.0
+        self.index: int = 0
+        self.gaps: int = 0
+        self.resets: int = 0
+
+    # `timestamps` is (N,) in device milliseconds, `values` (N, C).
+    # Returns the grid timestamps (M,) and the interpolated (M, C) values up to the newest sample.
+    def push(
+        self, timestamps: np.ndarray, values: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        times = np.asarray(timestamps, dtype=np.float64)
+        rows = np.asarray(values, dtype=np.float64)
+        if self.last_timestamp is None:
+            if not len(times):
+                return times, rows
+            self.origin, self.index = float(times[0]), 0
+        else:
+            times = np.concatenate(([self.last_timestamp], times))
+            rows = np.vstack((self.last_values, rows))
+
+        # Repeated timestamps carry no new time, only the first one is kept
+        keep = np.concatenate(([True], np.diff(times) != 0))
+        times, rows = times[keep], rows[keep]
+        self.last_timestamp, self.last_values = float(times[-1]), rows[-1]
+
+        steps = np.diff(times)
+        breaks = np.flatnonzero((steps < 0) | (steps > self.max_gap)) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [len(times)]))
+        grid_times: list[np.ndarray] = []
+        grid_rows: list[np.ndarray] = []
+        for start, end in zip(starts, ends):
+            if start > 0:
+                if times[start] < times[start - 1]:
+                    self.resets += 1
+                else:
+                    self.gaps += 1
+                self.origin, self.index = float(times[start]), 0
+
+            segment_times = times[start:end]
+            first = self.origin + self.index * self.interval
+            count = int(np.floor((segment_times[-1] - first) / self.interval)) + 1
+            if count <= 0:
+                continue
+            grid = self.origin + (self.index + np.arange(count)) * self.interval
+            self.index += count
+
+            if len(segment_times) == 1:
+                # A segment of a single sample only has the grid point on that sample
+                grid_rows.append(rows[start:end].repeat(count, axis=0))
+            else:
+                # Linear interpolation of every column at once
+                right = np.clip(
+                    np.searchsorted(segment_times, grid, side="right"),
+                    1,
+                    len(segment_times) - 1,
+                )
+                left = right - 1
+                before, after = rows[start + left], rows[start + right]
+                fraction = (grid - segment_times[left]) / (
+                    segment_times[right] - segment_times[left]
+                )
+                grid_rows.append(before + fraction[:, np.newaxis] * (after - before))
+            grid_times.append(grid)
+
+        if not grid_times:
+            return np.empty(0), np.empty((0, rows.shape[1]))
+        return np.concatenate(grid_times), np.concatenate(grid_rows)
+
+
+# Resample a whole recording at once, see streamResampler
+def resample(
+    timestamps: np.ndarray,
+    values: np.ndarray,
+    interval: float = RESAMPLE_INTERVAL_MS,
+    max_gap: float = RESAMPLE_MAX_GAP_MS,
+) -> tuple[np.ndarray, np.ndarray]:
+    return streamResampler(interval, max_gap).push(timestamps, values)
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    # A 1 kHz device with 20% timestamp jitter, a 200 ms gap and a reset, fed in 16 sample batches
+    rng = np.random.default_rng(0)
+    intervals = rng.uniform(0.8, 1.2, 100_000)
+    intervals[40_000] = 200
+    timestamps = np.cumsum(intervals)
+    timestamps[70_000:] -= timestamps[70_000]
+    values = np.column_stack([np.sin(timestamps / 50 + phase) for phase in range(6)])
+
+    resampler = streamResampler(interval=1.0)
+    grid_times: list[np.ndarray] = []
+    grid_rows: list[np.ndarray] = []
+    start_time = perf_counter()
+    for offset in range(0, len(timestamps), 16):
+        batch_times, batch_rows = resampler.push(
+            timestamps[offset : offset + 16], values[offset : offset + 16]
+        )
+        grid_times.append(batch_times)
+        grid_rows.append(batch_rows)
+    elapsed = perf_counter() - start_time
+    times, rows = np.concatenate(grid_times), np.concatenate(grid_rows)
+
+    steps = np.diff(times)
+    error = np.abs(rows[:, 0] - np.sin(times / 50)).max()
+    print(
+        f"{len(timestamps)} samples -> {len(times)} grid points in {elapsed * 1e3:.1f} ms "
+        f"({elapsed / len(timestamps) * 1e6:.2f} us per sample)"
+    )
+    print(
+        f"steps {np.unique(np.round(steps[(steps > 0) & (steps < 2)], 9))} ms, "
+        f"{resampler.gaps} gaps, {resampler.resets} resets, max error {error:.4f}"
+    )
@@ -0,0 +1,319 @@
+import multiprocessing
+import os
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from sampleData import SAMPLE_HEADER, SAMPLE_LENGTH, SAVEDATA_FOLDER_PATH, load_sample
+
+CATALOG_FILE_NAME = "catalog.sqlite"  # Inside the savedata folder
+CATALOG_SCHEMA_VERSION = 1  # A catalog of another version is rebuilt
+CATALOG_TIMEOUT = 5.0  # Seconds to wait for another process writing the catalog
+# Fewer changed files are inspected without a process pool
+CATALOG_PARALLEL_MIN_FILES = 64
+CATALOG_RANGE_COLUMNS = [
+    f"{axis}_{bound}" for axis in SAMPLE_HEADER[1:] for bound in ("min", "max")
+]
+CATALOG_COLUMNS = [
+    "path",  # "{gesture}/{file}", relative to the savedata folder
+    "gesture",
+    "file",
+    "size",
+    "mtime_ns",
+    "rows",
+    "start_ms",
+    "end_ms",
+    *CATALOG_RANGE_COLUMNS,
+    "valid",
+    "problem",  # Why the sample is not valid
+]
+
+
+def catalog_path(folder_path: str = SAVEDATA_FOLDER_PATH) -> str:
+    return f"{folder_path}/{CATALOG_FILE_NAME}"
+
+
+# Metadata of one sample file and whether it can be stacked with the others: the expected header,
+# at least `min_rows` rows, strictly increasing Time and no NaN or infinite values
+def inspect_sample(path: str, min_rows: int = SAMPLE_LENGTH) -> dict:
+    entry: dict = {
+        "size": 0,
+        "mtime_ns": 0,
+        "rows": 0,
+        "start_ms": None,
+        "end_ms": None,
+        **{column: None for column in CATALOG_RANGE_COLUMNS},
+        "valid": 0,
+        "problem": None,
+    }
+    try:
+        stat = os.stat(path)
+        entry["size"], entry["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+        with open(path, "r", newline="") as file:
+            header = file.readline().strip().split(",")
+        if header != SAMPLE_HEADER:
+            entry["problem"] = f"header {','.join(header)}"
+            return entry
+        data = load_sample(path)
+    except (OSError, ValueError) as err:
+        entry["problem"] = f"unreadable: {err}"
+        return entry
+    if not data.size:
+        entry["problem"] = "no rows"
+        return entry
+    if data.shape[1] != len(SAMPLE_HEADER):
+        entry["problem"] = f"{data.shape[1]} columns"
+        return entry
+
+    entry["rows"] = len(data)
+    entry["start_ms"], entry["end_ms"] = float(data[0, 0]), float(data[-1, 0])
+    finite = np.isfinite(data)
+    minimum = np.where(finite, data, np.inf).min(axis=0)[1:]
+    maximum = np.where(finite, data, -np.inf).max(axis=0)[1:]
+    for axis, low, high in zip(SAMPLE_HEADER[1:], minimum, maximum):
+        entry[f"{axis}_min"] = float(low) if np.isfinite(low) else None
+        entry[f"{axis}_max"] = float(high) if np.isfinite(high) else None
+
+    problems: list[str] = []
+    if len(data) < min_rows:
+        problems.append(f"{len(data)} rows, expected {min_rows}")
+    if not finite.all():
+        problems.append(f"{int((~finite).sum())} NaN or infinite values")
+    if (np.diff(data[:, 0]) <= 0).any():
+        problems.append("Time is not increasing")
+    entry["problem"] = "; ".join(problems) or None
+    entry["valid"] = int(not problems)
+    return entry
+
+
+# Rows of (relative path, full path) of every sample file, the same files get_gesture_files lists
+def list_sample_files(folder_path: str) -> list[tuple[str, str]]:
+    files: list[tuple[str, str]] = []
+    if not os.path.isdir(folder_path):
+        return files
+    for gesture in os.scandir(folder_path):
+        if not gesture.is_dir():
+            continue
+        for sample in os.scandir(gesture.path):
+            if sample.is_file() and sample.name.endswith(".csv"):
+                files.append((f"{gesture.name}/{sample.name}", sample.path))
+    return files
+
+
+# SQLite catalog of the samples in a savedata folder, so the sample list, counts and lengths do not
+# need every file to be listed and parsed.
+# scan() brings it up to date and only inspects files whose size or modification time changed,
+# saving a sample adds it right away (see catalog_sample). One connection is shared by the
+# threads of the app, other processes can use the same file at the same time.
+class sampleCatalog:
+    def __init__(
+        self, folder_path: str = SAVEDATA_FOLDER_PATH, path: Optional[str] = None
+    ) -> None:
+        self.folder_path = folder_path
+        self.path = path or catalog_path(folder_path)
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(
+            self.path, timeout=CATALOG_TIMEOUT, check_same_thread=False
+        )
+        self.connection.row_factory = sqlite3.Row
+        with self.lock, self.connection:
+            # Readers are not blocked while another process writes
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != CATALOG_SCHEMA_VERSION:
+                self.connection.execute("DROP TABLE IF EXISTS samples")
+            columns = ", ".join(
+                f"{column} {self.column_type(column)}" for column in CATALOG_COLUMNS
+            )
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS samples ({columns})")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS samples_gesture ON samples (gesture, file)"
+            )
+            self.connection.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+
+    @staticmethod
+    def column_type(column: str) -> str:
+        if column == "path":
+            return "TEXT PRIMARY KEY"
+        if column in ("gesture", "file", "problem"):
+            return "TEXT"
+        if column in ("size", "mtime_ns", "rows", "valid"):
+            return "INTEGER"
+        return "REAL"
+
+    def store(self, entries: list[dict]) -> None:
+        placeholders = ", ".join("?" for _ in CATALOG_COLUMNS)
+        with self.lock, self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO samples VALUES ({placeholders})",
+                [[entry[column] for column in CATALOG_COLUMNS] for entry in entries],
+            )
+
+    # Bring the catalog up to date with the folder, returns the number of (updated, removed) samples
+    def scan(self, jobs: Optional[int] = None) -> tuple[int, int]:
+        with self.lock:
+            known = {
+                row["path"]: (row["size"], row["mtime_ns"])
+                for row in self.connection.execute(
+                    "SELECT path, size, mtime_ns FROM samples"
+                )
+            }
+        changed: list[tuple[str, str]] = []
+        present: set[str] = set()
+        for relative, full in list_sample_files(self.folder_path):
+            present.add(relative)
+            try:
+                stat = os.stat(full)
+            except OSError:
+                continue
+            if known.get(relative) != (stat.st_size, stat.st_mtime_ns):
+                changed.append((relative, full))
+
+        full_paths = [full for _, full in changed]
+        if len(changed) < CATALOG_PARALLEL_MIN_FILES:
+            inspected = [inspect_sample(path) for path in full_paths]
+        else:
+            # Spawned, the app calling this has threads of its own running
+            with ProcessPoolExecutor(
+                max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                inspected = list(executor.map(inspect_sample, full_paths, chunksize=16))
+        entries = [
+            {
+                "path": relative,
+                "gesture": relative.split("/", 1)[0],
+                "file": relative.split("/", 1)[1],
+                **entry,
+            }
+            for (relative, _), entry in zip(changed, inspected)
+        ]
+        self.store(entries)
+
+        removed = [path for path in known if path not in present]
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "DELETE FROM samples WHERE path = ?", [(path,) for path in removed]
+            )
+        return len(entries), len(removed)
+
+    # Add or update one sample file of this folder, e.g. right after it was saved
+    def add(self, path: str) -> dict:
+        relative = os.path.relpath(path, self.folder_path).replace(os.sep, "/")
+        gesture, file = relative.split("/", 1)
+        entry = {
+            "path": relative,
+            "gesture": gesture,
+            "file": file,
+            **inspect_sample(path),
+        }
+        self.store([entry])
+        return entry
+
+    def clear(self) -> None:
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM samples")
+
+    def query(self, sql: str, parameters: tuple = ()) -> list[sqlite3.Row]:
+        with self.lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def gestures(self) -> list[str]:
+        return [
+            row["gesture"]
+            for row in self.query(
+                "SELECT DISTINCT gesture FROM samples ORDER BY gesture"
+            )
+        ]
+
+    def files(self, gesture: str, valid_only: bool = False) -> list[str]:
+        condition = " AND valid = 1" if valid_only else ""
+        return [
+            row["file"]
+            for row in self.query(
+                f"SELECT file FROM samples WHERE gesture = ?{condition} ORDER BY file",
+                (gesture,),
+            )
+        ]
+
+    def counts(self) -> dict[str, int]:
+        return {
+            row["gesture"]: row["count"]
+            for row in self.query(
+                "SELECT gesture, COUNT(*) AS count FROM samples GROUP BY gesture"
+            )
+        }
+
+    def entry(self, gesture: str, file: str) -> Optional[dict]:
+        rows = self.query(
+            "SELECT * FROM samples WHERE gesture = ? AND file = ?", (gesture, file)
+        )
+        return dict(rows[0]) if rows else None
+
+    def invalid(self) -> list[dict]:
+        return [
+            dict(row)
+            for row in self.query("SELECT * FROM samples WHERE valid = 0 ORDER BY path")
+        ]
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+
+# Record a sample that was just saved to `folder_path`. A catalog that is busy is left alone, the
+# next scan picks the file up.
+def catalog_sample(path: str, folder_path: str = SAVEDATA_FOLDER_PATH) -> None:
+    try:
+        catalog = sampleCatalog(folder_path)
+        try:
+            catalog.add(path)
+        finally:
+            catalog.close()
+    except sqlite3.Error as err:
+        print(f"Catalog not updated for {path}: {err}")
+
+
+def main():
+    import argparse
+    from time import perf_counter
+
+    parser = argparse.ArgumentParser(
+        description="Update the savedata catalog and list the samples that fail the checks"
+    )
+    parser.add_argument("--savedata", default=SAVEDATA_FOLDER_PATH)
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument(
+        "--rebuild", action="store_true", help="inspect every file again"
+    )
+    args = parser.parse_args()
+
+    catalog = sampleCatalog(args.savedata)
+    if args.rebuild:
+        catalog.clear()
+    start_time = perf_counter()
+    updated, removed = catalog.scan(args.jobs)
+    elapsed = perf_counter() - start_time
+    print(
+        f"{catalog.path}: {updated} samples inspected, {removed} removed "
+        f"in {elapsed * 1e3:.0f} ms"
+    )
+
+    start_time = perf_counter()
+    counts = catalog.counts()
+    valid = {gesture: len(catalog.files(gesture, True)) for gesture in counts}
+    elapsed = perf_counter() - start_time
+    for gesture, count in sorted(counts.items()):
+        print(f"  {gesture:12s} {count:5d} samples, {valid[gesture]:5d} valid")
+    print(f"Counted from the catalog in {elapsed * 1e3:.1f} ms")
+
+    for entry in catalog.invalid():
+        print(f"Invalid {entry['path']}: {entry['problem']}")
+    catalog.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import csv
+import os
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from resampler import resample
+
+SAVEDATA_FOLDER_PATH = "./savedata"
+SAVEDATA_SESSION_FOLDER = "session"  # Continuous recordings of a gesture
+SAMPLE_HEADER = ["Time", "aX", "aY", "aZ", "gX", "gY", "gZ"]
+SAMPLE_LENGTH = 120
+
+
+# Return a list of gestures
+def get_gestures(folder_path: str = SAVEDATA_FOLDER_PATH) -> list[str]:
+    if not os.path.exists(folder_path) or not os.listdir(folder_path):
+        return ["idle"]
+    else:
+        return [
+            name
+            for name in os.listdir(folder_path)
+            if os.path.isdir(os.path.join(folder_path, name))
+        ]
+
+
+# Returns a list of files names that is inside the [gesture] folder
+def get_gesture_files(
+    gesture: str, folder_path: str = SAVEDATA_FOLDER_PATH
+) -> list[str]:
+    gesture_path = f"{folder_path}/{gesture}"
+    if not os.path.exists(gesture_path) or not os.listdir(gesture_path):
+        return []
+    else:
+        return [
+            name
+            for name in os.listdir(gesture_path)
+            if os.path.isfile(os.path.join(gesture_path, name))
+        ]
+
+
+# Load one sample file as a (rows, 7) array: Time, aX, aY, aZ, gX, gY, gZ
+def load_sample(path: str) -> np.ndarray:
+    return np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2, dtype=np.float64)
+
+
+# Load every sample of a gesture stacked as a (N, length, 6) array, the `Time` column is dropped.
+# Files shorter than `length` are skipped, longer files keep their last `length` rows.
+# With `resample_interval` every file is first resampled onto a grid of that many milliseconds.
+def load_gesture_samples(
+    gesture: str,
+    length: int = SAMPLE_LENGTH,
+    folder_path: str = SAVEDATA_FOLDER_PATH,
+    resample_interval: Optional[float] = None,
+    file_names: Optional[list[str]] = None,
+) -> tuple[list[str], np.ndarray]:
+    if file_names is None:
+        file_names = get_gesture_files(gesture, folder_path)
+    files: list[str] = []
+    samples: list[np.ndarray] = []
+    for file_name in sorted(file_names):
+        try:
+            data = load_sample(f"{folder_path}/{gesture}/{file_name}")
+        except ValueError:
+            continue
+        if data.shape[1] != len(SAMPLE_HEADER):
+            continue
+        if resample_interval:
+            timestamps, values = resample(data[:, 0], data[:, 1:], resample_interval)
+            data = np.column_stack((timestamps, values))
+        if data.shape[0] < length:
+            continue
+        files.append(file_name)
+        samples.append(data[-length:, 1:])
+
+    if not samples:
+        return files, np.empty((0, length, len(SAMPLE_HEADER) - 1))
+    return files, np.stack(samples)
+
+
+# "{folder}/[datetime].csv", with a counter appended when two samples are saved in the same second
+def new_sample_filename(folder: str) -> str:
+    os.makedirs(folder, exist_ok=True)
+    stem = f"{folder}/{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    filename = f"{stem}.csv"
+    index = 1
+    while os.path.exists(filename):
+        filename = f"{stem}_{index}.csv"
+        index += 1
+    return filename
+
+
+# Save (N,) timestamps and (N, 6) values as a new sample of `gesture`, returns the file name
+def save_sample(
+    gesture: str,
+    timestamps: np.ndarray,
+    values: np.ndarray,
+    folder_path: str = SAVEDATA_FOLDER_PATH,
+) -> str:
+    filename = new_sample_filename(f"{folder_path}/{gesture}")
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(SAMPLE_HEADER)
+        for timestamp, row in zip(timestamps, values):
+            writer.writerow([int(timestamp)] + row.tolist())
+    # Imported here, sampleCatalog depends on this module
+    from sampleCatalog import catalog_sample
+
+    catalog_sample(filename, folder_path)
+    return filename
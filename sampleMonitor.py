@@ -0,0 +1,132 @@
+from collections import deque
+from typing import Callable, Optional
+
+import numpy as np
+
+MONITOR_HISTORY = 2000  # Intervals kept for the jitter percentiles
+MONITOR_GAP_FACTOR = 1.5  # An interval this many times the expected one is a gap
+MONITOR_ESTIMATE_EVERY = 100  # Re-estimate the expected interval every N samples
+MONITOR_TIMESTAMP_WRAP = 2**32  # `millis()` is an unsigned 32 bit counter
+MONITOR_WRAP_MARGIN = 60_000  # How close to the wrap the previous timestamp has to be
+MONITOR_LOG_GAP_INTERVALS = 10  # Only gaps of at least this many samples are logged
+
+
+# Tracks the device timestamps of incoming samples to detect gaps, duplicates and resets
+class sampleMonitor:
+    def __init__(
+        self,
+        expected_interval: Optional[float] = None,
+        gap_factor: float = MONITOR_GAP_FACTOR,
+        log_callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.nominal_interval = expected_interval  # ms, estimated from the data if None
+        self.gap_factor = gap_factor
+        self.log_callback = log_callback
+        self.reset()
+
+    def reset(self) -> None:
+        self.intervals: deque[int] = deque(maxlen=MONITOR_HISTORY)
+        self.expected_interval: Optional[float] = self.nominal_interval
+        self.last_timestamp: Optional[int] = None
+        self.elapsed: int = 0  # Device milliseconds covered since the first sample
+        self.received: int = 0
+        self.missing: int = 0
+        self.gaps: int = 0
+        self.duplicates: int = 0
+        self.resets: int = 0
+        self.wraparounds: int = 0
+
+    def log(self, message: str) -> None:
+        if self.log_callback:
+            self.log_callback(message)
+
+    def push(self, timestamp: int) -> None:
+        self.received += 1
+        last_timestamp = self.last_timestamp
+        self.last_timestamp = timestamp
+        if last_timestamp is None:
+            return
+
+        interval = timestamp - last_timestamp
+        if interval < 0:
+            if last_timestamp > MONITOR_TIMESTAMP_WRAP - MONITOR_WRAP_MARGIN:
+                # The millisecond counter rolled over, the interval is still valid
+                self.wraparounds += 1
+                interval += MONITOR_TIMESTAMP_WRAP
+            else:
+                # The MCU rebooted, there is no way to tell how many samples were lost
+                self.resets += 1
+                self.log(
+                    f"Device timestamp went back from {last_timestamp} ms to {timestamp} ms, MCU reset?"
+                )
+                return
+
+        if interval == 0:
+            self.duplicates += 1
+            return
+
+        self.elapsed += interval
+        self.intervals.append(interval)
+        if self.nominal_interval is None and (
+            self.expected_interval is None
+            or len(self.intervals) % MONITOR_ESTIMATE_EVERY == 0
+        ):
+            self.expected_interval = float(np.median(self.intervals))
+
+        expected = self.expected_interval
+        if expected and interval > self.gap_factor * expected:
+            lost = max(1, round(interval / expected) - 1)
+            self.gaps += 1
+            self.missing += lost
+            if lost >= MONITOR_LOG_GAP_INTERVALS:
+                self.log(
+                    f"Gap of {interval} ms after {last_timestamp} ms, about {lost} samples missing"
+                )
+
+    # Expected vs received rate and interval jitter, suitable for perfStats gauges
+    def stats(self) -> dict[str, float]:
+        # Copied first, the reader thread keeps appending
+        intervals = list(self.intervals)
+        expected = self.expected_interval or 0.0
+        stats = {
+            "received": float(self.received),
+            "missing": float(self.missing),
+            "gaps": float(self.gaps),
+            "duplicates": float(self.duplicates),
+            "resets": float(self.resets),
+            "wraparounds": float(self.wraparounds),
+            "expected_hz": 1000 / expected if expected else 0.0,
+            "received_hz": (
+                1000 * len(intervals) / sum(intervals) if intervals else 0.0
+            ),
+            "loss_ratio": (
+                self.missing / (self.received + self.missing) if self.received else 0.0
+            ),
+        }
+
+        if intervals and expected:
+            jitter = np.abs(np.asarray(intervals) - expected)
+            p50, p95, p99 = np.percentile(jitter, [50, 95, 99])
+            stats.update(
+                {
+                    "jitter_p50_ms": float(p50),
+                    "jitter_p95_ms": float(p95),
+                    "jitter_p99_ms": float(p99),
+                }
+            )
+        return stats
+
+
+if __name__ == "__main__":
+    # 100 Hz stream with jitter, a dropped burst, a duplicate and an MCU reset
+    rng = np.random.default_rng(0)
+    timestamps = np.cumsum(rng.choice([9, 10, 10, 11], size=1000)).tolist()
+    del timestamps[500:530]
+    timestamps.insert(700, timestamps[699])
+    timestamps += [5, 15, 25]
+
+    monitor = sampleMonitor(log_callback=print)
+    for timestamp in timestamps:
+        monitor.push(int(timestamp))
+    for name, value in monitor.stats().items():
+        print(f"{name:>15s}: {value:.3f}")
@@ -1,32 +1,89 @@
 import threading
 import serial
 import serial.tools.list_ports
-from time import sleep
+from time import perf_counter, perf_counter_ns, sleep
 from typing import Callable, Optional, List
 
+from imuParser import parse_imu_line
+from perfStats import perf_stats, perfCounter
+from portMonitor import portMonitor
+
+REPLAY_PORT_PREFIX = "replay:"
+SERIAL_BATCH_MAX_LINES = 256  # Most lines in one `lines_received_callback` call
+SERIAL_DEFAULT_BAUDRATE = 115200
+SERIAL_BAUDRATES = [115200, 230400, 460800, 921600, 1000000, 2000000]
+SERIAL_BITS_PER_BYTE = 10  # 8N1: start bit, 8 data bits, stop bit
+SERIAL_DETECT_TIMEOUT = 0.5  # Seconds listened to at each candidate baud rate
+SERIAL_DETECT_MIN_LINES = 5  # Valid [IMU] lines that settle the detection early
+
+
+# Try every candidate rate and return the one that yields the most valid [IMU] lines, None if none did
+def detect_baudrate(
+    port: str,
+    candidates: List[int] = SERIAL_BAUDRATES,
+    timeout: float = SERIAL_DETECT_TIMEOUT,
+    log_callback: Optional[Callable[[str], None]] = None,
+) -> Optional[int]:
+    best_rate: Optional[int] = None
+    best_lines: int = 0
+    for baudrate in candidates:
+        valid_lines = 0
+        with serial.Serial(port, baudrate=baudrate, timeout=timeout / 4) as serial_port:
+            serial_port.reset_input_buffer()
+            # The first line is usually cut in half by the reset
+            serial_port.readline()
+            end_time = perf_counter() + timeout
+            while perf_counter() < end_time and valid_lines < SERIAL_DETECT_MIN_LINES:
+                line = serial_port.readline()
+                if parse_imu_line(line.decode("utf-8", errors="replace")):
+                    valid_lines += 1
+        if log_callback:
+            log_callback(f"Baud rate {baudrate}: {valid_lines} valid lines")
+        if valid_lines > best_lines:
+            best_rate, best_lines = baudrate, valid_lines
+        if valid_lines >= SERIAL_DETECT_MIN_LINES:
+            break
+    return best_rate
+
 
 class serialHandler:
     def __init__(
         self,
         line_received_callback: Optional[Callable[[str], None]] = None,
         log_callback: Optional[Callable[[str], None]] = None,
-        ports_changed_callback: Optional[Callable[[List[str]], None]] = None,
+        ports_changed_callback: Optional[Callable[[List[str], List[str]], None]] = None,
         interval: float = 0.05,
+        lines_received_callback: Optional[Callable[[List[str]], None]] = None,
+        monitor_ports: bool = True,
     ):
         self.serial_port: Optional[serial.Serial] = None
         self.killed: bool = False
         self.line_received_callback: Optional[Callable[[str], None]] = (
             line_received_callback
         )
+        # Gets every line already buffered in one call, instead of one call per line
+        self.lines_received_callback: Optional[Callable[[List[str]], None]] = (
+            lines_received_callback
+        )
         self.log_callback: Optional[Callable[[str], None]] = log_callback
-        self.ports_changed_callback: Optional[Callable[[List[str]], None]] = (
-            ports_changed_callback
+        # Called with the (added, removed) ports on hotplug
+        self.ports_changed_callback: Optional[
+            Callable[[List[str], List[str]], None]
+        ] = ports_changed_callback
+        self.virtual_ports: List[str] = []
+        self.port_monitor: Optional[portMonitor] = (
+            portMonitor(
+                get_ports=self.get_ports,
+                ports_changed_callback=self.ports_changed,
+                log_callback=self.log,
+            )
+            if monitor_ports
+            else None
         )
-        self.current_ports: List[str] = self.get_ports()
-        self.port_monitor_thread = threading.Thread(target=self.monitor_ports)
-        self.port_monitor_thread.start()
         self.read_serial_thread: Optional[threading.Thread] = None
         self.interval = interval
+        self.baudrate: int = SERIAL_DEFAULT_BAUDRATE
+        self.bytes_received = perfCounter()
 
     def log(self, message: str) -> None:
         if self.log_callback:
@@ -34,27 +91,70 @@ class serialHandler:
 
     def get_ports(self) -> List[str]:
         ports = serial.tools.list_ports.comports()
-        return [port.device for port in ports]
+        return [port.device for port in ports] + self.virtual_ports
 
-    def connect(self, port: str, baudrate: int = 115200) -> None:
-        self.serial_port = serial.Serial(port)
-        self.serial_port.close()
-        self.serial_port = serial.Serial(port, baudrate=baudrate, timeout=1.0)
+    # Add a port that is not a real device, e.g. a replay source
+    def add_virtual_port(self, port: str) -> None:
+        if port not in self.virtual_ports:
+            self.virtual_ports.append(port)
+            if self.port_monitor:
+                self.port_monitor.refresh()
+
+    # Buffer sizes are only honoured on Windows, low latency mode only by Linux USB serial drivers
+    def connect(
+        self,
+        port: str,
+        baudrate: int = SERIAL_DEFAULT_BAUDRATE,
+        read_buffer_size: Optional[int] = None,
+        write_buffer_size: Optional[int] = None,
+        low_latency: bool = False,
+    ) -> None:
+        self.baudrate = baudrate
+        self.bytes_received = perfCounter()
+        if port.startswith(REPLAY_PORT_PREFIX):
+            # Recorded data replayed through the same reader thread
+            from replaySource import open_replay_port
+
+            try:
+                self.serial_port = open_replay_port(port)  # type: ignore[assignment]
+            except OSError as err:
+                raise serial.SerialException(str(err))
+        else:
+            self.serial_port = serial.Serial(port, baudrate=baudrate, timeout=1.0)
+            if read_buffer_size and hasattr(self.serial_port, "set_buffer_size"):
+                self.serial_port.set_buffer_size(
+                    rx_size=read_buffer_size, tx_size=write_buffer_size
+                )
+            if low_latency:
+                try:
+                    self.serial_port.set_low_latency_mode(True)  # type: ignore[attr-defined]
+                except (AttributeError, ValueError, OSError) as err:
+                    self.log(f"Low latency mode not available on [{port}]: {err}")
         if self.log:
-            self.log(f"Port [{self.serial_port.name}] Connected")
+            self.log(f"Port [{self.serial_port.name}] Connected at {baudrate} baud")
 
-        self.read_thread = threading.Thread(target=self.read_from_port)
-        self.read_thread.start()
+        self.read_serial_thread = threading.Thread(target=self.read_from_port)
+        self.read_serial_thread.start()
 
     def disconnect(self) -> None:
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
             if not self.serial_port.is_open:
                 self.log(f"Port [{self.serial_port.name}] Disconnected")
-                # self.read_thread.join()
+                # self.read_serial_thread.join()
             else:
                 self.log(f"Failed to close port [{self.serial_port.name}]")
 
+    # Bytes per second received since the previous call, and how much of the baud rate that uses.
+    # A utilization close to 1 means the link is saturated, well below 1 with lost samples means the host is.
+    def link_stats(self) -> dict[str, float]:
+        bytes_per_second = self.bytes_received.update_rate(perf_counter())
+        return {
+            "baudrate": float(self.baudrate),
+            "bytes_per_second": bytes_per_second,
+            "link_utilization": bytes_per_second * SERIAL_BITS_PER_BYTE / self.baudrate,
+        }
+
     def is_connected(self) -> bool:
         return self.serial_port is not None and self.serial_port.is_open
 
@@ -62,16 +162,32 @@ class serialHandler:
         try:
             while not self.killed and self.is_connected():
                 sleep(self.interval)
+                if perf_stats.enabled and self.serial_port is not None:
+                    perf_stats.gauge("serial_queue_bytes", self.serial_port.in_waiting)
                 line: bytes | None = b"empty"
+                lines: List[str] = []
                 while self.is_connected() and line:
                     try:
                         if self.serial_port is not None:
+                            start_time = perf_counter_ns()
                             line = self.serial_port.readline()
                             if not line:
                                 break
+                            self.bytes_received.add(len(line))
+                            if perf_stats.enabled:
+                                perf_stats.record_since("readline", start_time)
+                                perf_stats.count("lines")
                             reading = line.decode("utf-8").rstrip("\n")
                             if self.line_received_callback:
                                 self.line_received_callback(reading)
+                            if self.lines_received_callback:
+                                lines.append(reading)
+                                if (
+                                    len(lines) >= SERIAL_BATCH_MAX_LINES
+                                    or not self.serial_port.in_waiting
+                                ):
+                                    self.lines_received_callback(lines)
+                                    lines = []
                     except serial.SerialException as serr:
                         self.disconnect()
                         self.log(
@@ -83,6 +199,8 @@ class serialHandler:
                         )
                     except Exception as err:
                         self.log(f"Serial Exception: {err}")
+                if lines and self.lines_received_callback:
+                    self.lines_received_callback(lines)
             print("Serial Port thread exiting")
         except Exception as err:
             self.log(f"### Serial Port thread killed, trying to restart: {err} ###")
@@ -97,27 +215,28 @@ class serialHandler:
                 self.read_serial_thread.join(timeout=1)
             if self.read_serial_thread.is_alive():
                 print("read_serial_thread did not exit in time")
-        self.port_monitor_thread.join(timeout=1)
-        if self.port_monitor_thread.is_alive():
-            print("port_monitor_thread did not exit in time")
+        if self.port_monitor:
+            self.port_monitor.close()
 
     def set_line_received_callback(self, callback: Callable[[str], None]) -> None:
         self.line_received_callback = callback
 
+    def set_lines_received_callback(
+        self, callback: Callable[[List[str]], None]
+    ) -> None:
+        self.lines_received_callback = callback
+
     def set_log_callback(self, callback: Callable[[str], None]) -> None:
         self.log_callback = callback
 
-    def set_ports_changed_callback(self, callback: Callable[[List[str]], None]) -> None:
+    def set_ports_changed_callback(
+        self, callback: Callable[[List[str], List[str]], None]
+    ) -> None:
         self.ports_changed_callback = callback
 
-    def monitor_ports(self) -> None:
-        while not self.killed:
-            sleep(1)
-            new_ports = self.get_ports()
-            if new_ports != self.current_ports:
-                self.current_ports = new_ports
-                if self.ports_changed_callback:
-                    self.ports_changed_callback(new_ports)
+    def ports_changed(self, added: List[str], removed: List[str]) -> None:
+        if self.ports_changed_callback:
+            self.ports_changed_callback(added, removed)
 
 
 # Test code
@@ -129,8 +248,8 @@ def my_log(message: str) -> None:
     print(f"Log: {message}")
 
 
-def my_ports_changed(ports: Optional[List[str]]) -> None:
-    print(f"Ports changed: {ports}")
+def my_ports_changed(added: List[str], removed: List[str]) -> None:
+    print(f"Ports added: {added}, removed: {removed}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+RING_CAPACITY = 8192  # Rows, about 80 s of IMU samples at 100 Hz
+RING_HEADER_SIZE = (
+    64  # Bytes before the rows, the first 8 hold the number of rows ever written
+)
+RING_READ_RETRIES = 4
+
+
+# Single writer, many readers ring of float64 rows in shared memory.
+# The writer copies rows in and only then publishes the new row count, a reader copies the rows it
+# wants and checks the count again, so rows overwritten during the copy are never returned.
+class sharedRing:
+    def __init__(
+        self,
+        columns: int,
+        capacity: int = RING_CAPACITY,
+        name: Optional[str] = None,
+    ) -> None:
+        self.columns = columns
+        self.capacity = capacity
+        size = RING_HEADER_SIZE + capacity * columns * 8
+        # Without a name a new ring is created, with one an existing ring is attached
+        self.owner: bool = name is None
+        self.memory = shared_memory.SharedMemory(
+            name=name, create=self.owner, size=size if self.owner else 0
+        )
+        self.header = np.ndarray((1,), dtype=np.int64, buffer=self.memory.buf)
+        self.rows = np.ndarray(
+            (capacity, columns),
+            dtype=np.float64,
+            buffer=self.memory.buf,
+            offset=RING_HEADER_SIZE,
+        )
+        if self.owner:
+            self.header[0] = 0
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    # Number of rows ever written, readers use it as a cursor
+    @property
+    def count(self) -> int:
+        return int(self.header[0])
+
+    def write(self, rows: np.ndarray) -> None:
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, self.columns)
+        if len(rows) > self.capacity:
+            rows = rows[-self.capacity :]
+        count = self.count
+        start = count % self.capacity
+        first = min(len(rows), self.capacity - start)
+        self.rows[start : start + first] = rows[:first]
+        self.rows[: len(rows) - first] = rows[first:]
+        self.header[0] = count + len(rows)
+
+    # Copy of the rows written since `cursor`, the new cursor and how many rows were overwritten unread
+    def read_since(self, cursor: int) -> tuple[np.ndarray, int, int]:
+        for _ in range(RING_READ_RETRIES):
+            count = self.count
+            lost = max(0, count - cursor - self.capacity)
+            start = cursor + lost
+            rows = self.copy(start, count)
+            # A row is only valid if the writer did not lap it while it was copied
+            overwritten = max(0, self.count - self.capacity - start)
+            if overwritten == 0:
+                return rows, count, lost
+        return rows[overwritten:], count, lost + overwritten
+
+    # Copy of the newest `length` rows
+    def latest(self, length: int) -> np.ndarray:
+        count = self.count
+        rows, _, _ = self.read_since(max(0, count - min(length, self.capacity)))
+        return rows[-length:]
+
+    def copy(self, start: int, end: int) -> np.ndarray:
+        length = end - start
+        first = start % self.capacity
+        if first + length <= self.capacity:
+            return self.rows[first : first + length].copy()
+        return np.concatenate(
+            (self.rows[first:], self.rows[: first + length - self.capacity])
+        )
+
+    def close(self) -> None:
+        # Unlinked first, so the memory is freed with the last mapping even if closing fails below
+        if self.owner:
+            self.memory.unlink()
+        # Views have to go before the memory can be closed
+        del self.header, self.rows
+        try:
+            self.memory.close()
+        except BufferError:
+            # A copy still running in another thread holds the buffer, it is unmapped after it
+            pass
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    ring = sharedRing(columns=8, capacity=1000)
+    reader = sharedRing(columns=8, capacity=1000, name=ring.name)
+    cursor = 0
+    start_time = perf_counter()
+    for i in range(1000):
+        ring.write(np.full((7, 8), i, dtype=np.float64))
+        if i % 3 == 0:
+            rows, cursor, lost = reader.read_since(cursor)
+            assert lost == 0 and (np.diff(rows[:, 0]) >= 0).all()
+    elapsed = perf_counter() - start_time
+    rows, cursor, lost = reader.read_since(0)
+    print(f"{ring.count} rows written in {elapsed * 1e3:.1f} ms, lost {lost} from 0")
+    print(f"latest(3) = {reader.latest(3)[:, 0]}")
+    reader.close()
+    ring.close()
@@ -0,0 +1,204 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from time import perf_counter
+
+import numpy as np
+
+STARTUP_MODULES = [
+    "numpy",
+    "serial",
+    "matplotlib",
+    "tkPlotGraph",
+    "serialHandler",
+    "headless",
+    "main",
+]
+STARTUP_RUNS = 5
+STARTUP_HEAVIEST_IMPORTS = 10
+STARTUP_RESULTS_PATH = "./startup_results.json"
+STARTUP_FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+# Printed by the child after the import, peak resident memory in MB where it can be read
+PEAK_MEMORY_PROBE = """
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(peak / (2**20 if sys.platform == "darwin" else 2**10))
+except ImportError:
+    print(0)
+"""
+
+
+# Run `code` in a fresh interpreter next to the app's modules
+def run_child(code: str, import_time: bool = False) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable] + (["-X", "importtime"] if import_time else []) + ["-c", code],
+        cwd=STARTUP_FOLDER,
+        capture_output=True,
+        text=True,
+    )
+
+
+# `-X importtime` lines as (depth, cumulative ms, module), depth 0 is an import of the code itself
+def parse_import_times(stderr: str) -> list[tuple[int, float, str]]:
+    imports: list[tuple[int, float, str]] = []
+    for line in stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((depth, int(fields[1]) / 1000, name.strip()))
+    return imports
+
+
+# Import time and peak memory of `module`, the median of `runs` fresh interpreters
+def measure_import(module: str, runs: int) -> dict:
+    times: list[float] = []
+    peaks: list[float] = []
+    direct_imports: dict[str, list[float]] = {}
+    for _ in range(runs):
+        result = run_child(
+            f"import sys\nimport {module}\n{PEAK_MEMORY_PROBE}", import_time=True
+        )
+        if result.returncode != 0:
+            return {"skipped": result.stderr.strip().splitlines()[-1]}
+        imports = parse_import_times(result.stderr)
+        times.append(
+            next(ms for depth, ms, name in reversed(imports) if name == module)
+        )
+        peaks.append(float(result.stdout.strip().splitlines()[-1]))
+        # Whatever the module itself imports, nested under it at depth 1
+        for depth, ms, name in imports:
+            if depth == 1:
+                direct_imports.setdefault(name, []).append(ms)
+
+    heaviest = sorted(
+        ((float(np.median(ms)), name) for name, ms in direct_imports.items()),
+        reverse=True,
+    )[:STARTUP_HEAVIEST_IMPORTS]
+    return {
+        "import_ms": float(np.median(times)),
+        "peak_mb": float(np.median(peaks)),
+        "heaviest_imports": {name: round(ms, 2) for ms, name in heaviest},
+    }
+
+
+# Builds the window the way main.py does and reports once it has been drawn
+WINDOW_CHILD = """
+import tkinter as tk
+from tkinter import ttk
+import main
+
+root = tk.Tk()
+tab_control = ttk.Notebook(root)
+tab1 = ttk.Frame(tab_control)
+tab2 = ttk.Frame(tab_control)
+tab_control.add(tab1, text="Serial Reader")
+tab_control.add(tab2, text="Data Viewer")
+tab_control.pack(expand=1, fill="both")
+app = main.SerialPlotterApp(tab1)
+root.update()
+print("ready", flush=True)
+app.close()
+root.destroy()
+"""
+
+
+# Milliseconds from starting the interpreter until the Serial Reader tab has been drawn, skipped without a display
+def measure_window(runs: int) -> dict:
+    times: list[float] = []
+    for _ in range(runs):
+        start_time = perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-c", WINDOW_CHILD],
+            cwd=STARTUP_FOLDER,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        assert process.stdout is not None
+        for line in process.stdout:
+            if line.strip() == "ready":
+                times.append(perf_counter() - start_time)
+                break
+        _, stderr = process.communicate()
+        if not times:
+            return {"skipped": (stderr.strip().splitlines() or ["no output"])[-1]}
+    return {"window_ms": float(np.median(times)) * 1000}
+
+
+# Print how much each number changed compared to an earlier results file
+def compare_results(current: dict, previous: dict) -> None:
+    print("\nComparison with previous results")
+    for module, now in current["modules"].items():
+        before = previous.get("modules", {}).get(module, {})
+        if "import_ms" in now and "import_ms" in before:
+            print(
+                f"  {module:14s} {before['import_ms']:8.1f} -> {now['import_ms']:8.1f} ms, "
+                f"{before['peak_mb']:6.1f} -> {now['peak_mb']:6.1f} MB"
+            )
+    now, before = current.get("window", {}), previous.get("window", {})
+    if "window_ms" in now and "window_ms" in before:
+        print(
+            f"  window         {before['window_ms']:8.1f} -> {now['window_ms']:8.1f} ms"
+        )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Measure import time, peak memory and time to the first drawn window"
+    )
+    parser.add_argument("--modules", nargs="+", default=STARTUP_MODULES)
+    parser.add_argument("--runs", type=int, default=STARTUP_RUNS)
+    parser.add_argument("--output", default=STARTUP_RESULTS_PATH)
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    results: dict = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "modules": {},
+    }
+
+    print(f"Import time, median of {args.runs} fresh interpreters")
+    for module in args.modules:
+        result = measure_import(module, args.runs)
+        results["modules"][module] = result
+        if "skipped" in result:
+            print(f"  {module:14s} skipped ({result['skipped']})")
+            continue
+        print(
+            f"  {module:14s} {result['import_ms']:8.1f} ms, peak {result['peak_mb']:6.1f} MB"
+        )
+
+    main_result = results["modules"].get("main", {})
+    if main_result.get("heaviest_imports"):
+        print("\nHeaviest imports of main.py")
+        for name, ms in main_result["heaviest_imports"].items():
+            print(f"  {name:24s} {ms:8.1f} ms")
+
+    results["window"] = measure_window(args.runs)
+    if "skipped" in results["window"]:
+        print(f"\nWindow skipped ({results['window']['skipped']})")
+    else:
+        print(f"\nWindow drawn after {results['window']['window_ms']:.0f} ms")
+
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            compare_results(results, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
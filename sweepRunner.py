@@ -0,0 +1,417 @@
+import csv
+import itertools
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from time import perf_counter
+from typing import Optional
+
+import numpy as np
+
+from batchScore import load_savedata
+from gestureInference import MODEL_SAMPLE_INTERVAL_MS
+from sampleData import SAVEDATA_FOLDER_PATH
+
+# Every combination is one configuration, the first entry of "layers" is the notebook's model.
+# "raw" models see the 120x6 window, "features" models the output of featureExtraction.py.
+SWEEP_GRID: dict[str, list] = {
+    "inputs": ["raw", "features"],
+    "layers": [
+        [32, 48, 48, 48, 48, 48, 32],
+        [32, 48, 48, 32],
+        [48, 48],
+        [32, 32],
+        [32],
+        [16],
+    ],
+    "dropout": [0.0, 0.2],
+    "learning_rate": [0.001, 0.003],
+    "batch_size": [32],
+    "epochs": [20],
+}
+SWEEP_FOLDS = 5
+SWEEP_TRIALS = 10  # Configurations drawn from the grid in random mode
+SWEEP_LATENCY_RUNS = 200
+SWEEP_MIN_ACCURACY = 0.95
+SWEEP_RESULTS_PATH = "./model/sweep_results.csv"
+SWEEP_RESULTS_HEADER = [
+    "inputs",
+    "layers",
+    "dropout",
+    "learning_rate",
+    "batch_size",
+    "epochs",
+    "accuracy",
+    "accuracy_std",
+    "parameters",
+    "tflite_bytes",
+    "latency_us",
+    "features_us",
+    "train_s",
+]
+
+
+# Every configuration of `grid`, or `trials` of them drawn without repetition
+def sweep_configs(
+    grid: dict[str, list] = SWEEP_GRID,
+    trials: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> list[dict]:
+    names = list(grid)
+    configs = [
+        dict(zip(names, values))
+        for values in itertools.product(*(grid[name] for name in names))
+    ]
+    if trials is None or trials >= len(configs):
+        return configs
+    chosen = np.random.default_rng(seed).choice(len(configs), trials, replace=False)
+    return [configs[i] for i in sorted(chosen)]
+
+
+# Fold of every sample, each class is spread evenly over the folds
+def fold_indices(
+    classes: np.ndarray, folds: int, seed: Optional[int] = None
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    indices = np.empty(len(classes), dtype=np.intp)
+    for label in np.unique(classes):
+        members = rng.permutation(np.flatnonzero(classes == label))
+        indices[members] = (np.arange(len(members)) + rng.integers(folds)) % folds
+    return indices
+
+
+def import_keras():
+    try:
+        import tf_keras as keras
+    except ImportError:
+        from tensorflow import keras  # type: ignore
+    return keras
+
+
+# Model inputs of `config` for (N, 120, 6) samples
+def config_inputs(config: dict, samples: np.ndarray) -> np.ndarray:
+    if config.get("inputs", "raw") == "features":
+        from featureExtraction import extract_features
+
+        return extract_features(samples)
+    return samples
+
+
+# Flatten followed by the dense layers of `config`, as in train.ipynb
+def build_model(config: dict, input_shape: tuple[int, ...], classes: int):
+    keras = import_keras()
+    model = keras.models.Sequential()
+    model.add(keras.layers.Flatten(input_shape=input_shape))
+    for units in config["layers"]:
+        model.add(keras.layers.Dense(units, activation="relu"))
+        if config["dropout"]:
+            model.add(keras.layers.Dropout(config["dropout"]))
+    model.add(keras.layers.Dense(classes, activation="softmax"))
+    model.compile(
+        optimizer=keras.optimizers.Adam(config["learning_rate"]),
+        loss="categorical_crossentropy",
+        metrics=["accuracy"],
+    )
+    return model
+
+
+# The dataset every worker reads, attached once per process from shared memory
+sweep_memory: Optional[shared_memory.SharedMemory] = None
+sweep_samples: Optional[np.ndarray] = None
+sweep_features: Optional[np.ndarray] = None  # Extracted on first use
+sweep_classes: Optional[np.ndarray] = None
+sweep_folds: Optional[np.ndarray] = None
+sweep_labels: list[str] = []
+
+
+def sweep_worker_init(
+    memory_name: str,
+    shape: tuple[int, ...],
+    classes: np.ndarray,
+    folds: np.ndarray,
+    labels: list[str],
+) -> None:
+    global sweep_memory, sweep_samples, sweep_classes, sweep_folds, sweep_labels
+    # CPU only, one thread per process, the pool provides the parallelism
+    os.environ["CUDA_VISIBLE_DEVICES"] = "-1"
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+    import tensorflow as tf
+
+    tf.config.threading.set_intra_op_parallelism_threads(1)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+    sweep_memory = shared_memory.SharedMemory(name=memory_name)
+    sweep_samples = np.ndarray(shape, dtype=np.float32, buffer=sweep_memory.buf)
+    sweep_classes = classes
+    sweep_folds = folds
+    sweep_labels = labels
+
+
+# Train `config` on every fold but `fold` and return its accuracy on `fold`.
+# The first fold also returns the converted .tflite model, its size only depends on the config.
+def sweep_worker_evaluate(config: dict, fold: int) -> dict:
+    assert sweep_samples is not None
+    assert sweep_classes is not None and sweep_folds is not None
+    import tensorflow as tf
+
+    tf.keras.utils.set_random_seed(fold)
+    keras = import_keras()
+    global sweep_features
+    inputs = sweep_samples
+    if config.get("inputs", "raw") == "features":
+        if sweep_features is None:
+            sweep_features = config_inputs(config, sweep_samples)
+        inputs = sweep_features
+    train = sweep_folds != fold
+    targets = keras.utils.to_categorical(sweep_classes, num_classes=len(sweep_labels))
+    # Features are standardized with the statistics of the training folds, as in train.ipynb
+    statistics = None
+    if config.get("inputs", "raw") == "features":
+        from featureExtraction import feature_statistics
+
+        statistics = feature_statistics(inputs[train])
+        inputs = (inputs - statistics[0]) / statistics[1]
+
+    start_time = perf_counter()
+    model = build_model(config, inputs.shape[1:], len(sweep_labels))
+    model.fit(
+        inputs[train],
+        targets[train],
+        epochs=config["epochs"],
+        batch_size=config["batch_size"],
+        verbose=0,
+    )
+    train_time = perf_counter() - start_time
+    predicted = model.predict(inputs[~train], verbose=0).argmax(axis=1)
+
+    result = {
+        "fold": fold,
+        "accuracy": float(np.mean(predicted == sweep_classes[~train])),
+        "parameters": int(model.count_params()),
+        "train_s": train_time,
+    }
+    if fold == 0:
+        if statistics is not None:
+            # The converted model takes the features as they are, so the latency is comparable
+            from featureExtraction import fold_standardization
+
+            dense = next(layer for layer in model.layers if layer.get_weights())
+            dense.set_weights(fold_standardization(*dense.get_weights(), *statistics))
+        result["tflite"] = tf.lite.TFLiteConverter.from_keras_model(model).convert()
+    return result
+
+
+# Median microseconds of one window through the TFLite interpreter, measured without the sweep
+# running next to it
+def measure_latency(
+    tflite_model: bytes, window: np.ndarray, runs: int = SWEEP_LATENCY_RUNS
+) -> float:
+    from gestureInference import load_tflite_interpreter, run_tflite
+
+    with tempfile.NamedTemporaryFile(suffix=".tflite", delete=False) as file:
+        file.write(tflite_model)
+    try:
+        interpreter = load_tflite_interpreter(file.name)
+        window = window.astype(np.float32)
+        run_tflite(interpreter, window)
+        times: list[float] = []
+        for _ in range(runs):
+            start_time = perf_counter()
+            run_tflite(interpreter, window)
+            times.append(perf_counter() - start_time)
+    finally:
+        os.remove(file.name)
+    return float(np.median(times)) * 1e6
+
+
+# Median microseconds to turn one window into the inputs of `config` on this host
+def measure_inputs_latency(
+    config: dict, window: np.ndarray, runs: int = SWEEP_LATENCY_RUNS
+) -> float:
+    if config.get("inputs", "raw") == "raw":
+        return 0.0
+    config_inputs(config, window)
+    times: list[float] = []
+    for _ in range(runs):
+        start_time = perf_counter()
+        config_inputs(config, window)
+        times.append(perf_counter() - start_time)
+    return float(np.median(times)) * 1e6
+
+
+def format_layers(layers: list[int]) -> str:
+    return "-".join(str(units) for units in layers)
+
+
+# Cross-validate every config with `folds` folds in `jobs` processes.
+# The samples are loaded once and shared with the workers, not copied to each of them.
+def run_sweep(
+    configs: list[dict],
+    folds: int = SWEEP_FOLDS,
+    jobs: Optional[int] = None,
+    seed: Optional[int] = None,
+    folder_path: str = SAVEDATA_FOLDER_PATH,
+) -> list[dict]:
+    # Resampled like the windows train.ipynb trains on
+    names, samples = load_savedata(folder_path, MODEL_SAMPLE_INTERVAL_MS)
+    if not names:
+        return []
+    samples = samples.astype(np.float32)
+    labels = sorted({gesture for gesture, _ in names})
+    classes = np.array([labels.index(gesture) for gesture, _ in names])
+    fold_of_sample = fold_indices(classes, folds, seed)
+    print(
+        f"{len(samples)} samples of {len(labels)} gestures, {len(configs)} configs x {folds} folds"
+    )
+
+    memory = shared_memory.SharedMemory(create=True, size=max(samples.nbytes, 1))
+    shared = np.ndarray(samples.shape, dtype=np.float32, buffer=memory.buf)
+    shared[:] = samples
+    fold_results: dict[int, list[dict]] = {index: [] for index in range(len(configs))}
+    start_time = perf_counter()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=sweep_worker_init,
+            initargs=(memory.name, samples.shape, classes, fold_of_sample, labels),
+        ) as executor:
+            futures = {
+                executor.submit(sweep_worker_evaluate, config, fold): index
+                for index, config in enumerate(configs)
+                for fold in range(folds)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                result = future.result()
+                fold_results[index].append(result)
+                print(
+                    f"[{done}/{len(futures)}] {format_layers(configs[index]['layers'])} "
+                    f"fold {result['fold']}: {result['accuracy']:.2%} "
+                    f"({perf_counter() - start_time:.0f} s)"
+                )
+    finally:
+        del shared
+        memory.close()
+        memory.unlink()
+
+    results: list[dict] = []
+    for index, config in enumerate(configs):
+        accuracies = [result["accuracy"] for result in fold_results[index]]
+        first = next(result for result in fold_results[index] if result["fold"] == 0)
+        results.append(
+            {
+                **config,
+                "accuracy": float(np.mean(accuracies)),
+                "accuracy_std": float(np.std(accuracies)),
+                "parameters": first["parameters"],
+                "tflite_bytes": len(first["tflite"]),
+                "latency_us": measure_latency(
+                    first["tflite"], config_inputs(config, samples[:1])
+                ),
+                "features_us": measure_inputs_latency(config, samples[:1]),
+                "train_s": sum(result["train_s"] for result in fold_results[index]),
+            }
+        )
+    return results
+
+
+# Smallest model that reaches `min_accuracy`, the faster one if two are the same size, feature
+# extraction included
+def pick_model(results: list[dict], min_accuracy: float) -> Optional[dict]:
+    passing = [result for result in results if result["accuracy"] >= min_accuracy]
+    if not passing:
+        return None
+    return min(
+        passing,
+        key=lambda result: (
+            result["tflite_bytes"],
+            result["latency_us"] + result["features_us"],
+        ),
+    )
+
+
+def write_results(results: list[dict], path: str = SWEEP_RESULTS_PATH) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(SWEEP_RESULTS_HEADER)
+        for result in results:
+            writer.writerow(
+                [
+                    result.get("inputs", "raw"),
+                    format_layers(result["layers"]),
+                    result["dropout"],
+                    result["learning_rate"],
+                    result["batch_size"],
+                    result["epochs"],
+                    f"{result['accuracy']:.4f}",
+                    f"{result['accuracy_std']:.4f}",
+                    result["parameters"],
+                    result["tflite_bytes"],
+                    f"{result['latency_us']:.1f}",
+                    f"{result['features_us']:.1f}",
+                    f"{result['train_s']:.1f}",
+                ]
+            )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Cross-validate model architectures and hyperparameters in parallel"
+    )
+    parser.add_argument("--mode", choices=["grid", "random"], default="grid")
+    parser.add_argument(
+        "--trials", type=int, default=SWEEP_TRIALS, help="configs in random mode"
+    )
+    parser.add_argument("--folds", type=int, default=SWEEP_FOLDS)
+    parser.add_argument("--jobs", type=int, default=None, help="training processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-accuracy", type=float, default=SWEEP_MIN_ACCURACY)
+    parser.add_argument("--savedata", default=SAVEDATA_FOLDER_PATH)
+    parser.add_argument("--output", default=SWEEP_RESULTS_PATH)
+    args = parser.parse_args()
+
+    configs = sweep_configs(
+        trials=args.trials if args.mode == "random" else None, seed=args.seed
+    )
+    results = run_sweep(configs, args.folds, args.jobs, args.seed, args.savedata)
+    if not results:
+        print(f"No samples found in {args.savedata}")
+        return
+    write_results(results, args.output)
+    print(f"Results written to {args.output}\n")
+
+    results.sort(key=lambda result: -result["accuracy"])
+    print(
+        f"{'inputs':>8s} {'layers':>22s} {'drop':>5s} {'lr':>6s} {'accuracy':>14s} "
+        f"{'params':>8s} {'tflite':>8s} {'latency':>10s} {'features':>10s}"
+    )
+    for result in results:
+        print(
+            f"{result.get('inputs', 'raw'):>8s} "
+            f"{format_layers(result['layers']):>22s} {result['dropout']:5.2f} "
+            f"{result['learning_rate']:6.4f} "
+            f"{result['accuracy']:7.2%} ±{result['accuracy_std']:5.2%} "
+            f"{result['parameters']:8d} {result['tflite_bytes']:7d}B "
+            f"{result['latency_us']:8.1f}us {result['features_us']:8.1f}us"
+        )
+
+    chosen = pick_model(results, args.min_accuracy)
+    if chosen is None:
+        print(f"\nNo model reached {args.min_accuracy:.0%}")
+    else:
+        print(
+            f"\nSmallest model with at least {args.min_accuracy:.0%}: "
+            f"{chosen.get('inputs', 'raw')} inputs, "
+            f"{format_layers(chosen['layers'])}, dropout {chosen['dropout']}, "
+            f"learning rate {chosen['learning_rate']} "
+            f"({chosen['accuracy']:.2%}, {chosen['tflite_bytes']} bytes, "
+            f"{chosen['latency_us']:.1f} us)"
+        )
+
+
+if __name__ == "__main__":
+    main()
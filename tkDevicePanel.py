@@ -0,0 +1,126 @@
+import tkinter as tk
+from time import perf_counter
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from devicePipeline import deviceSample, devicePipeline
+from tkPlotGraph import tkPlotGraph
+
+DEVICE_PANEL_MAX_SAMPLES = 120
+DEVICE_PANEL_ACCEL_Y_LIMIT = 4
+DEVICE_PANEL_GYRO_Y_LIMIT = 3000
+
+
+# Show the newest (N, 6) samples of a device on its accelerometer and gyroscope graphs
+def set_figure_data(
+    accelerometer_figure: tkPlotGraph,
+    gyroscope_figure: tkPlotGraph,
+    timestamps: np.ndarray,
+    values: np.ndarray,
+) -> None:
+    timestamps_list = timestamps.tolist()
+    for figure, columns in (
+        (accelerometer_figure, values[:, :3]),
+        (gyroscope_figure, values[:, 3:]),
+    ):
+        figure.set_data(
+            timestamps_list,
+            {
+                label: columns[:, axis].tolist()
+                for axis, label in enumerate(("x-axis", "y-axis", "z-axis"))
+            },
+        )
+
+
+# Window showing the graphs and status of one extra device, closing it disconnects the device
+class tkDevicePanel:
+    def __init__(
+        self,
+        master: tk.Misc,
+        device: devicePipeline,
+        closed_callback: Optional[Callable[["tkDevicePanel"], None]] = None,
+        max_samples: int = DEVICE_PANEL_MAX_SAMPLES,
+    ) -> None:
+        self.device = device
+        self.max_samples = max_samples
+        self.closed_callback = closed_callback
+
+        self.window = tk.Toplevel(master)
+        self.window.title(f"Device {device.name}")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.status_label = tk.Label(
+            master=self.window, text=f"{device.name}: connecting", anchor="w"
+        )
+        self.status_label.grid(row=0, column=0, columnspan=2, sticky="ew")
+
+        self.accelerometer_figure = tkPlotGraph(
+            master=self.window,
+            title=f"{device.name} Acceleration (G)",
+            max_samples=max_samples,
+        )
+        self.accelerometer_figure.grid(row=1, column=0)
+        self.accelerometer_figure.set_ylim(
+            low=-DEVICE_PANEL_ACCEL_Y_LIMIT, high=DEVICE_PANEL_ACCEL_Y_LIMIT
+        )
+
+        self.gyroscope_figure = tkPlotGraph(
+            master=self.window,
+            title=f"{device.name} Angular Velocity (DPS)",
+            max_samples=max_samples,
+        )
+        self.gyroscope_figure.grid(row=1, column=1)
+        self.gyroscope_figure.set_ylim(
+            low=-DEVICE_PANEL_GYRO_Y_LIMIT, high=DEVICE_PANEL_GYRO_Y_LIMIT
+        )
+
+        # A device read in its own process is drawn straight from its shared ring instead
+        if not device.use_process:
+            device.sample_callback = self.samples_received
+
+    # Called from the device reader or drain thread
+    def samples_received(self, samples: List[deviceSample]) -> None:
+        for _, timestamp, values in samples:
+            acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z = values
+            self.accelerometer_figure.append_dict(
+                timestamp, {"x-axis": acc_x, "y-axis": acc_y, "z-axis": acc_z}
+            )
+            self.gyroscope_figure.append_dict(
+                timestamp, {"x-axis": gyro_x, "y-axis": gyro_y, "z-axis": gyro_z}
+            )
+
+    def clear(self) -> None:
+        self.accelerometer_figure.clear()
+        self.gyroscope_figure.clear()
+
+    # Called from the app's drawing thread
+    def draw(self) -> None:
+        if self.device.use_process:
+            set_figure_data(
+                self.accelerometer_figure,
+                self.gyroscope_figure,
+                *self.device.latest(self.max_samples),
+            )
+        self.accelerometer_figure.draw()
+        self.gyroscope_figure.draw()
+        timestamps = self.gyroscope_figure.timestamp
+        newest_timestamp = timestamps[-1] if timestamps else None
+        if newest_timestamp is not None:
+            self.device.clock.mark_drawn(int(newest_timestamp), perf_counter())
+
+        stats = self.device.monitor.stats()
+        state = "connected" if self.device.is_connected() else "disconnected"
+        self.status_label.configure(
+            text=f"{self.device.name}: {state}, {stats['received_hz']:.1f} Hz, "
+            f"loss {stats['loss_ratio']:.1%}"
+            + (" (process)" if self.device.use_process else "")
+        )
+
+    def close(self) -> None:
+        self.device.close()
+        self.accelerometer_figure.close()
+        self.gyroscope_figure.close()
+        self.window.destroy()
+        if self.closed_callback:
+            self.closed_callback(self)
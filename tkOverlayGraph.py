@@ -0,0 +1,175 @@
+from tkinter import Misc
+
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
+import numpy as np
+
+matplotlib.use("Agg")
+
+OVERLAY_AXIS_LABELS = ["x-axis", "y-axis", "z-axis"]
+OVERLAY_AXIS_COLORS = ["tab:blue", "tab:orange", "tab:green"]
+OVERLAY_OUTLIER_COLOR = "red"
+
+
+# Mean and standard deviation over all samples, and each sample's RMS distance from the mean.
+# `samples` is a (N, length, axes) array, each axis is normalized by its standard deviation.
+def overlay_statistics(
+    samples: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    mean = samples.mean(axis=0)
+    std = samples.std(axis=0)
+    scale = np.where(std > 0, std, 1.0)
+    distance = np.sqrt((((samples - mean) / scale) ** 2).mean(axis=(1, 2)))
+    return mean, std, distance
+
+
+# Indices of the samples that are more than `sigma` standard deviations further from the mean than average
+def find_outliers(distance: np.ndarray, sigma: float = 2.0) -> np.ndarray:
+    if distance.size < 2:
+        return np.empty(0, dtype=np.intp)
+    threshold = distance.mean() + sigma * distance.std()
+    return np.flatnonzero(distance > threshold)
+
+
+class tkOverlayGraph:
+    def __init__(
+        self,
+        master: Misc,
+        figsize: tuple[int, int] = (5, 4),
+        dpi: int = 80,
+        title: str = "Graph",
+    ) -> None:
+
+        # Create a figure and a canvas to draw on
+        # Not created through pyplot, which is slow to import and keeps every figure alive until closed
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        self.title = title
+
+        self.do_ylim: bool = False
+        self.data_modified: bool = False
+
+        # Configure Axes object
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_title(self.title)
+        self.ax.grid()
+
+    # Partial function of tk.grid()
+    def grid(self, row: int = 0, column: int = 0, **kwargs) -> None:
+        self.canvas.get_tk_widget().grid(row=row, column=column, **kwargs)
+
+    def grid_remove(self) -> None:
+        self.canvas.get_tk_widget().grid_remove()
+
+    def close(self):
+        self.figure.clear()
+
+    # Set graph y-axis limit, default is automatic
+    def set_ylim(self, low: int | float, high: int | float):
+        self.do_ylim = True
+        self.low_ylim = low
+        self.high_ylim = high
+
+    # Replace the plotted samples, `samples` is a (N, length, axes) array.
+    # Every axis is drawn as a single LineCollection with the mean ± std band on top.
+    def set_samples(
+        self, samples: np.ndarray, outliers: np.ndarray | None = None
+    ) -> None:
+        self.ax.clear()
+        self.ax.set_title(f"{self.title}, {len(samples)} samples")
+        self.ax.grid()
+        self.data_modified = True
+
+        if samples.size == 0:
+            return
+
+        count, length, axes = samples.shape
+        x = np.arange(length)
+        mean = samples.mean(axis=0)
+        std = samples.std(axis=0)
+
+        is_outlier = np.zeros(count, dtype=bool)
+        if outliers is not None:
+            is_outlier[outliers] = True
+
+        # Fade the lines out as more samples are stacked on top of each other
+        alpha = min(0.5, max(0.02, 5.0 / count))
+
+        segments = np.empty((count, length, 2))
+        segments[:, :, 0] = x
+        for axis in range(axes):
+            color = OVERLAY_AXIS_COLORS[axis % len(OVERLAY_AXIS_COLORS)]
+            label = OVERLAY_AXIS_LABELS[axis % len(OVERLAY_AXIS_LABELS)]
+            segments[:, :, 1] = samples[:, :, axis]
+
+            self.ax.add_collection(
+                LineCollection(
+                    segments[~is_outlier], colors=color, alpha=alpha, linewidths=0.5
+                )
+            )
+            if is_outlier.any():
+                self.ax.add_collection(
+                    LineCollection(
+                        segments[is_outlier],
+                        colors=OVERLAY_OUTLIER_COLOR,
+                        alpha=0.8,
+                        linewidths=1.0,
+                    )
+                )
+
+            self.ax.fill_between(
+                x,
+                mean[:, axis] - std[:, axis],
+                mean[:, axis] + std[:, axis],
+                color=color,
+                alpha=0.25,
+                linewidth=0,
+            )
+            self.ax.plot(x, mean[:, axis], color=color, label=label)
+
+        self.ax.set_xlim(0, length - 1)
+        if self.do_ylim:
+            self.ax.set_ylim(self.low_ylim, self.high_ylim)
+        else:
+            self.ax.autoscale_view(scalex=False)
+        self.ax.legend()
+
+    # Draw graph on canvas
+    def draw(self) -> None:
+        if not self.data_modified:
+            return
+
+        self.data_modified = False
+        self.canvas.draw()
+
+
+def main():
+    from tkinter import Tk
+    import time
+
+    root = Tk()
+
+    # Random walks around a common shape, with a few obvious outliers
+    rng = np.random.default_rng(0)
+    shape = np.sin(np.linspace(0, 2 * np.pi, 120))[None, :, None]
+    samples = shape + rng.normal(0, 0.05, (500, 120, 3)).cumsum(axis=1)
+    samples[:5] += 2
+
+    figure = tkOverlayGraph(master=root, title="Test Overlay")
+    figure.grid(row=0, column=0)
+    figure.set_ylim(-4, 4)
+
+    start_time = time.perf_counter()
+    _, _, distance = overlay_statistics(samples)
+    figure.set_samples(samples, find_outliers(distance))
+    figure.draw()
+    print(f"Drew {len(samples)} samples in {time.perf_counter() - start_time:.3f} s")
+
+    root.mainloop()
+
+
+# Example usage
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import tkinter as tk
+from datetime import datetime
+from typing import Callable, Optional
+
+from perfStats import PERF_PERCENTILES, perfStats, perf_stats
+from tkSortableTable import tkSortableTable
+
+PERF_PANEL_UPDATE_INTERVAL_MS = 500
+PERF_PANEL_COLUMNS = (
+    ["name", "kind", "count", "per second", "mean ms"]
+    + [f"p{percentile:g} ms" for percentile in PERF_PERCENTILES]
+    + ["max ms"]
+)
+
+
+# Live table of the stage latencies, counters and gauges recorded in perfStats.
+# `csv_exports` writers are called with their own path on "Export .csv", e.g. the raw clock samples.
+class tkPerfPanel:
+    def __init__(
+        self,
+        master: tk.Misc,
+        stats: perfStats = perf_stats,
+        export_folder: str = ".",
+        height: int = 8,
+        csv_exports: Optional[dict[str, Callable[[str], None]]] = None,
+    ) -> None:
+        self.master = master
+        self.stats = stats
+        self.export_folder = export_folder
+        self.csv_exports = csv_exports or {}
+        self.visible: bool = False
+        self.update_job: str | None = None
+
+        self.frame = tk.Frame(master=master)
+        self.table = tkSortableTable(
+            self.frame, columns=PERF_PANEL_COLUMNS, height=height, column_width=90
+        )
+        self.table.grid(row=0, column=0, rowspan=4, sticky="nsew")
+
+        self.export_csv_button = tk.Button(
+            master=self.frame, text="Export .csv", command=self.export_csv
+        )
+        self.export_csv_button.config(width=15)
+        self.export_csv_button.grid(row=0, column=1)
+
+        self.export_json_button = tk.Button(
+            master=self.frame, text="Export .json", command=self.export_json
+        )
+        self.export_json_button.config(width=15)
+        self.export_json_button.grid(row=1, column=1)
+
+        self.reset_button = tk.Button(
+            master=self.frame, text="Reset", command=self.stats.clear
+        )
+        self.reset_button.config(width=15)
+        self.reset_button.grid(row=2, column=1)
+
+        self.status_label = tk.Label(master=self.frame, wraplength=150)
+        self.status_label.grid(row=3, column=1)
+
+        self.frame.grid_columnconfigure(0, weight=1)
+
+    # Partial function of tk.grid(), showing the panel also turns instrumentation on
+    def grid(self, **kwargs) -> None:
+        self.frame.grid(**kwargs)
+        self.stats.enabled = True
+        if not self.visible:
+            self.visible = True
+            self.update()
+
+    def grid_remove(self) -> None:
+        self.frame.grid_remove()
+        self.visible = False
+        self.stats.enabled = False
+        if self.update_job:
+            self.frame.after_cancel(self.update_job)
+            self.update_job = None
+
+    def update(self) -> None:
+        if not self.visible:
+            return
+
+        snapshot = self.stats.snapshot()
+        rows: list[list[str]] = []
+        for name, stage in snapshot["stages"].items():
+            rows.append(
+                [name, "stage", str(stage["count"]), "", f"{stage['mean_ms']:.3f}"]
+                + [f"{stage[f'p{p:g}_ms']:.3f}" for p in PERF_PERCENTILES]
+                + [f"{stage['max_ms']:.3f}"]
+            )
+        for name, counter in snapshot["counters"].items():
+            rows.append(
+                [name, "counter", str(counter["total"]), f"{counter['per_second']:.1f}"]
+                + [""] * (len(PERF_PANEL_COLUMNS) - 4)
+            )
+        for name, value in snapshot["gauges"].items():
+            rows.append(
+                [name, "gauge", f"{value:g}"] + [""] * (len(PERF_PANEL_COLUMNS) - 3)
+            )
+        self.table.set_rows(rows)
+
+        self.update_job = self.frame.after(PERF_PANEL_UPDATE_INTERVAL_MS, self.update)
+
+    def export_path(self, extension: str, name: str = "") -> str:
+        prefix = f"perf_{name}_" if name else "perf_"
+        return f"{self.export_folder}/{prefix}{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+    def export_csv(self) -> None:
+        paths = [self.export_path("csv")]
+        self.stats.export_csv(paths[0])
+        for name, export in self.csv_exports.items():
+            paths.append(self.export_path("csv", name))
+            export(paths[-1])
+        self.status_label.configure(text=f"Saved {', '.join(paths)}")
+
+    def export_json(self) -> None:
+        path = self.export_path("json")
+        self.stats.export_json(path)
+        self.status_label.configure(text=f"Saved {path}")
+
+
+def main():
+    import random
+    import time
+
+    root = tk.Tk()
+    panel = tkPerfPanel(root)
+    panel.grid(row=0, column=0, sticky="nsew")
+
+    def fake_work():
+        start_time = time.perf_counter_ns()
+        time.sleep(random.uniform(0, 0.002))
+        perf_stats.record_since("sleep", start_time)
+        perf_stats.count("calls")
+        perf_stats.gauge("queue_depth", random.randint(0, 10))
+        root.after(10, fake_work)
+
+    fake_work()
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
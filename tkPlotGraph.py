@@ -2,9 +2,11 @@ from tkinter import Misc
 
 import matplotlib
 import matplotlib.lines
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from collections import deque
+from typing import Sequence
 import numpy as np
 
 matplotlib.use("Agg")
@@ -13,7 +15,7 @@ matplotlib.use("Agg")
 class tkPlotGraph:
     def __init__(
         self,
-        master: Misc,
+        master: Misc | None,
         figsize: tuple[int, int] = (5, 4),
         dpi: int = 80,
         timespan: int | float | None = None,
@@ -22,9 +24,14 @@ class tkPlotGraph:
         show_percentiles: bool = False,
     ) -> None:
 
-        # Create a figure and a canvas to draw on
-        self.figure = plt.figure(figsize=figsize, dpi=dpi)
-        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        # Create a figure and a canvas to draw on, without a master it is rendered offscreen
+        # Not created through pyplot, which is slow to import and keeps every figure alive until closed
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas: FigureCanvasTkAgg | FigureCanvasAgg = (
+            FigureCanvasTkAgg(self.figure, master=master)
+            if master is not None
+            else FigureCanvasAgg(self.figure)
+        )
         self.timespan = timespan
         self.max_samples = max_samples
         self.title = title
@@ -53,10 +60,15 @@ class tkPlotGraph:
 
     # Partial function of tk.grid()
     def grid(self, row: int = 0, column: int = 0, **kwargs) -> None:
-        self.canvas.get_tk_widget().grid(row=row, column=column, **kwargs)
+        if isinstance(self.canvas, FigureCanvasTkAgg):
+            self.canvas.get_tk_widget().grid(row=row, column=column, **kwargs)
+
+    def grid_remove(self) -> None:
+        if isinstance(self.canvas, FigureCanvasTkAgg):
+            self.canvas.get_tk_widget().grid_remove()
 
     def close(self):
-        plt.close(fig=self.figure)
+        self.figure.clear()
 
     # Clears graph data
     def clear(self) -> None:
@@ -113,6 +125,19 @@ class tkPlotGraph:
         self.limit_sample_size()
         self.data_modified = True
 
+    # Replaces all data at once, e.g. with the newest rows of a shared sample buffer
+    def set_data(
+        self,
+        timestamps: Sequence[int | float],
+        data_dict: dict[str, Sequence[int | float]],
+    ) -> None:
+        self.timestamp = deque(timestamps)
+        for label, data in data_dict.items():
+            if label not in self.data_series:
+                (self.lines[label],) = self.ax.plot([], [], label=label)
+            self.data_series[label] = deque(data)
+        self.data_modified = True
+
     # Remove data older than x milliseconds
     def remove_old_data(self, timestamp: int | float) -> None:
         if self.timespan is None:
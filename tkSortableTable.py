@@ -0,0 +1,109 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional
+
+
+# Table with clickable column headings that sort the rows, numbers are sorted numerically
+class tkSortableTable:
+    def __init__(
+        self,
+        master: tk.Misc,
+        columns: list[str],
+        height: int = 20,
+        column_width: int = 120,
+        row_activated_callback: Optional[Callable[[list[str]], None]] = None,
+    ) -> None:
+        self.columns = columns
+        self.row_activated_callback = row_activated_callback
+        self.sort_column: Optional[str] = None
+        self.sort_descending: bool = False
+
+        self.frame = tk.Frame(master=master)
+        self.scrollbar = tk.Scrollbar(self.frame)
+        self.treeview = ttk.Treeview(
+            self.frame,
+            columns=columns,
+            show="headings",
+            height=height,
+            yscrollcommand=self.scrollbar.set,
+        )
+        for column in columns:
+            self.treeview.heading(
+                column, text=column, command=lambda c=column: self.sort_by(c)
+            )
+            self.treeview.column(column, width=column_width, anchor="w")
+
+        # Place the ttk.Treeview and tk.Scrollbar in the tk.Frame
+        self.treeview.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.scrollbar.config(command=self.treeview.yview)
+
+        self.treeview.bind("<Double-1>", self.on_row_activated)
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_rows(self, rows: list[list[str]]) -> None:
+        self.treeview.delete(*self.treeview.get_children())
+        for row in rows:
+            self.treeview.insert("", tk.END, values=row)
+        if self.sort_column:
+            self.sort(self.sort_column, self.sort_descending)
+
+    # Clicking the same heading again reverses the order
+    def sort_by(self, column: str) -> None:
+        descending = self.sort_column == column and not self.sort_descending
+        self.sort(column, descending)
+
+    def sort(self, column: str, descending: bool) -> None:
+        self.sort_column = column
+        self.sort_descending = descending
+
+        def key(item: str) -> tuple[int, float | str]:
+            value = self.treeview.set(item, column)
+            try:
+                return 0, float(value)
+            except ValueError:
+                return 1, value.lower()
+
+        items = sorted(self.treeview.get_children(""), key=key, reverse=descending)
+        for index, item in enumerate(items):
+            self.treeview.move(item, "", index)
+
+        for name in self.columns:
+            arrow = (" ▼" if descending else " ▲") if name == column else ""
+            self.treeview.heading(name, text=name + arrow)
+
+    def on_row_activated(self, event: tk.Event) -> None:
+        item = self.treeview.identify_row(event.y)
+        if item and self.row_activated_callback:
+            self.row_activated_callback(list(self.treeview.item(item, "values")))
+
+
+def main():
+    root = tk.Tk()
+
+    table = tkSortableTable(
+        root,
+        columns=["name", "count", "score"],
+        row_activated_callback=lambda row: print(f"Activated: {row}"),
+    )
+    table.pack(expand=1, fill="both")
+    table.set_rows(
+        [
+            ["apple", "3", "0.75"],
+            ["banana", "12", "0.10"],
+            ["cherry", "7", "0.98"],
+        ]
+    )
+
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+import csv
+import math
+import os
+from typing import Iterator, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from resampler import RESAMPLE_INTERVAL_MS, resample
+from sampleData import (
+    SAMPLE_HEADER,
+    SAMPLE_LENGTH,
+    SAVEDATA_FOLDER_PATH,
+    SAVEDATA_SESSION_FOLDER,
+    get_gestures,
+    load_sample,
+)
+
+WINDOW_STRIDE = 10
+# Share of a labelled interval a window has to cover to get its label, or of the window that has to
+# lie inside an interval longer than the window
+WINDOW_MIN_OVERLAP = 0.8
+# Windows spanning this much more time than expected contain a gap
+WINDOW_GAP_FACTOR = 1.5
+# Next to a recording, rows of Start and End in device milliseconds and the Label in between
+WINDOW_LABELS_SUFFIX = ".labels.csv"
+
+labelInterval = tuple[float, float, str]
+
+
+# Intervals of a recording from its labels file, empty if there is none
+def load_label_intervals(path: str) -> list[labelInterval]:
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        next(reader, None)
+        return [(float(start), float(end), label) for start, end, label in reader]
+
+
+# Training windows cut from continuous recordings.
+# Each recording is kept once, the windows are strided views into it (no copy), so memory does not
+# depend on the stride; rows are only copied when a batch is gathered.
+class windowDataset:
+    def __init__(
+        self,
+        labels: list[str],
+        length: int = SAMPLE_LENGTH,
+        stride: int = WINDOW_STRIDE,
+        min_overlap: float = WINDOW_MIN_OVERLAP,
+        background_label: Optional[str] = None,
+        resample_interval: Optional[float] = RESAMPLE_INTERVAL_MS,
+    ) -> None:
+        self.labels = labels  # Model output order
+        self.length = length
+        self.stride = stride
+        self.min_overlap = min_overlap
+        # Label of windows that overlap no interval, None skips them
+        self.background_label = background_label
+        self.resample_interval = resample_interval
+        # (recording views of shape (windows, length, 6), window indices, label indices)
+        self.recordings: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+
+    def __len__(self) -> int:
+        return sum(len(indices) for _, indices, _ in self.recordings)
+
+    # Add a recording of (N,) timestamps and (N, 6) values, labelled by `intervals` of device time
+    # or entirely with `label`. Returns the number of windows it contributed.
+    def add_recording(
+        self,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+        intervals: Optional[list[labelInterval]] = None,
+        label: Optional[str] = None,
+    ) -> int:
+        if self.resample_interval:
+            timestamps, values = resample(timestamps, values, self.resample_interval)
+        if len(values) < self.length:
+            return 0
+
+        # (windows, 6, length) view, transposed to (windows, length, 6), still without a copy
+        windows = sliding_window_view(values, self.length, axis=0).transpose(0, 2, 1)
+        indices = np.arange(0, len(windows), self.stride)
+        starts = timestamps[indices]
+        ends = timestamps[indices + self.length - 1]
+
+        # A window across a gap does not show a continuous movement
+        expected = (self.length - 1) * (
+            self.resample_interval or np.median(np.diff(timestamps))
+        )
+        continuous = ends - starts <= expected * WINDOW_GAP_FACTOR
+
+        label_indices = np.full(len(indices), -1)
+        if intervals:
+            interval_starts = np.array([start for start, _, _ in intervals])
+            interval_ends = np.array([end for _, end, _ in intervals])
+            interval_labels = np.array(
+                [
+                    self.labels.index(name) if name in self.labels else -1
+                    for _, _, name in intervals
+                ]
+            )
+            # (windows, intervals) overlap as a share of the shorter of the window and the interval,
+            # a long activity labels every window inside it
+            spans = np.minimum(
+                (ends - starts)[:, np.newaxis], interval_ends - interval_starts
+            )
+            overlap = np.clip(
+                np.minimum(ends[:, np.newaxis], interval_ends)
+                - np.maximum(starts[:, np.newaxis], interval_starts),
+                0,
+                None,
+            ) / np.maximum(spans, 1e-9)
+            best = overlap.argmax(axis=1)
+            covered = overlap[np.arange(len(indices)), best] >= self.min_overlap
+            label_indices[covered] = interval_labels[best[covered]]
+            # Windows that only clip an interval are ambiguous, they get no background label
+            untouched = overlap.max(axis=1) == 0
+        else:
+            untouched = np.ones(len(indices), dtype=bool)
+        if label is not None:
+            label_indices[:] = self.labels.index(label)
+        elif self.background_label is not None:
+            label_indices[untouched] = self.labels.index(self.background_label)
+
+        selected = continuous & (label_indices >= 0)
+        if not selected.any():
+            return 0
+        self.recordings.append((windows, indices[selected], label_indices[selected]))
+        return int(selected.sum())
+
+    def steps(self, batch_size: int) -> int:
+        return math.ceil(len(self) / batch_size)
+
+    # One pass over every window as (batch, length, 6) float32 inputs and one-hot targets
+    def batches(
+        self, batch_size: int = 32, shuffle: bool = True, seed: Optional[int] = None
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        recording_ids = np.concatenate(
+            [
+                np.full(len(indices), recording, dtype=np.intp)
+                for recording, (_, indices, _) in enumerate(self.recordings)
+            ]
+            or [np.empty(0, dtype=np.intp)]
+        )
+        positions = np.concatenate(
+            [np.arange(len(indices)) for _, indices, _ in self.recordings]
+            or [np.empty(0, dtype=np.intp)]
+        )
+        order = np.arange(len(recording_ids))
+        if shuffle:
+            np.random.default_rng(seed).shuffle(order)
+
+        for batch_start in range(0, len(order), batch_size):
+            batch = order[batch_start : batch_start + batch_size]
+            inputs = np.empty((len(batch), self.length, 6), dtype=np.float32)
+            targets = np.zeros((len(batch), len(self.labels)), dtype=np.float32)
+            for recording in np.unique(recording_ids[batch]):
+                windows, indices, label_indices = self.recordings[recording]
+                rows = np.flatnonzero(recording_ids[batch] == recording)
+                chosen = positions[batch[rows]]
+                inputs[rows] = windows[indices[chosen]]
+                targets[rows, label_indices[chosen]] = 1
+            yield inputs, targets
+
+    # Endless batches for `model.fit(..., steps_per_epoch=dataset.steps(batch_size))`
+    def generator(
+        self, batch_size: int = 32, shuffle: bool = True, seed: Optional[int] = None
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        epoch = 0
+        while True:
+            yield from self.batches(
+                batch_size, shuffle, None if seed is None else seed + epoch
+            )
+            epoch += 1
+
+
+# Every recording in "{folder_path}/{gesture}/session/", labelled by its labels file when it has
+# one and with its gesture otherwise
+def load_session_dataset(
+    labels: Optional[list[str]] = None,
+    length: int = SAMPLE_LENGTH,
+    stride: int = WINDOW_STRIDE,
+    background_label: Optional[str] = None,
+    folder_path: str = SAVEDATA_FOLDER_PATH,
+) -> windowDataset:
+    gestures = get_gestures(folder_path)
+    dataset = windowDataset(
+        labels if labels is not None else gestures,
+        length,
+        stride,
+        background_label=background_label,
+    )
+    for gesture in gestures:
+        session_folder = f"{folder_path}/{gesture}/{SAVEDATA_SESSION_FOLDER}"
+        if not os.path.isdir(session_folder):
+            continue
+        for file_name in sorted(os.listdir(session_folder)):
+            if not file_name.endswith(".csv") or file_name.endswith(
+                WINDOW_LABELS_SUFFIX
+            ):
+                continue
+            path = f"{session_folder}/{file_name}"
+            data = load_sample(path)
+            if data.shape[1] != len(SAMPLE_HEADER):
+                continue
+            intervals = load_label_intervals(
+                path.removesuffix(".csv") + WINDOW_LABELS_SUFFIX
+            )
+            dataset.add_recording(
+                data[:, 0],
+                data[:, 1:],
+                intervals,
+                label=None if intervals else gesture,
+            )
+    return dataset
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    from sampleData import load_gesture_samples
+
+    # The saved gesture samples back to back, separated by idle ones, stand in for one long
+    # recording; the gesture samples are the labelled intervals
+    rng = np.random.default_rng(0)
+    gestures = get_gestures()
+    _, idle = load_gesture_samples("idle")
+    pieces: list[np.ndarray] = []
+    intervals: list[labelInterval] = []
+    for gesture in gestures:
+        if gesture == "idle":
+            continue
+        _, samples = load_gesture_samples(gesture)
+        for sample in samples:
+            pieces.append(idle[rng.integers(len(idle))])
+            start = sum(len(piece) for piece in pieces) * 10
+            intervals.append((start + 200, start + 900, gesture))
+            pieces.append(sample)
+    values = np.concatenate(pieces)
+    timestamps = np.arange(len(values), dtype=np.float64) * 10
+
+    for stride in (30, 10, 1):
+        dataset = windowDataset(
+            gestures, stride=stride, background_label="idle", resample_interval=None
+        )
+        start_time = perf_counter()
+        dataset.add_recording(timestamps, values, intervals)
+        built = perf_counter() - start_time
+        windows, _, _ = dataset.recordings[0]
+        start_time = perf_counter()
+        counts = np.zeros(len(gestures))
+        for inputs, targets in dataset.batches(256):
+            counts += targets.sum(axis=0)
+        batched = perf_counter() - start_time
+        print(
+            f"stride {stride:2d}: {len(dataset):6d} windows "
+            f"({', '.join(f'{g} {int(c)}' for g, c in zip(gestures, counts))}), "
+            f"built in {built * 1e3:.1f} ms, batched in {batched * 1e3:.0f} ms, "
+            f"shares memory with the recording: {np.shares_memory(windows, values)}"
+        )